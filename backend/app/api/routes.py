@@ -8,8 +8,8 @@ import json
 from typing import Any
 from datetime import datetime, date
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from app.models.schemas import (
     IntakeRequest,
@@ -41,8 +41,10 @@ from app.graph.state import create_initial_state
 from app.graph.workflow import get_scrape_workflow, get_scoring_workflow
 from app.config import get_settings
 from app.services.sheets import get_sheets_service
+from app.services.apify import APIFY_WEBHOOK_SECRET_HEADER, get_apify_service
 from app.scoring.calculator import get_pre_scores, get_all_personas
 from app.services.logger import get_session_logger, log_info, log_error, log_event
+from app.services.openai_scoring import get_scoring_service
 
 
 router = APIRouter()
@@ -765,6 +767,25 @@ async def payment_webhook(request: PaymentWebhookRequest):
     return {"status": "received", "user_id": request.user_id}
 
 
+# === Apify Webhooks ===
+
+@router.post("/apify/webhook")
+async def apify_webhook(request: Request):
+    """
+    Receive Apify run-finished notifications.
+    
+    Wakes the scrape waiting on the run so it stops polling the run status.
+    """
+    apify = get_apify_service()
+    if not apify.webhook_url:
+        raise HTTPException(status_code=404, detail="Apify webhooks are not configured")
+    if not apify.verify_webhook_secret(request.headers.get(APIFY_WEBHOOK_SECRET_HEADER, "")):
+        raise HTTPException(status_code=401, detail="Invalid webhook secret")
+    
+    apify.handle_webhook(await request.json())
+    return {"status": "received"}
+
+
 # === Pre-Scoring Endpoints ===
 
 @router.get("/pre-scores/{user_id}")
@@ -817,6 +838,38 @@ async def get_user_pre_scores(user_id: str, persona: str = "big_company_recruite
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# === AI Scoring Stream ===
+
+@router.get("/ai-scores/{unique_id}/stream")
+async def stream_ai_scores(unique_id: str, target_group: str = None):
+    """
+    Stream AI section scores as Server-Sent Events.
+    
+    Each event carries the result fields completed so far, so the UI can
+    render sections before the whole response is generated. Requires the
+    scraped profile to still be in the status cache.
+    """
+    state = _status_cache.get(unique_id)
+    if not state or not state.get("scraped_profile"):
+        raise HTTPException(status_code=404, detail="Profile data not found")
+    
+    profile = state["scraped_profile"]
+    linkedin_url = state.get("linkedin_url", "")
+    target_group = target_group or state.get("target_group", "recruiters")
+    
+    async def event_stream():
+        try:
+            async for fields in get_scoring_service().stream_score_profile(profile, target_group, linkedin_url):
+                yield f"data: {json.dumps(fields)}\n\n"
+        except Exception as e:
+            log_error("ai_scoring", f"Streaming score failed: {str(e)}", {"unique_id": unique_id})
+            yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
+            return
+        yield "event: done\ndata: {}\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @router.get("/personas", response_model=PersonasResponse)
 async def list_personas():
     """
@@ -38,12 +38,27 @@ class Settings(BaseSettings):
     # === Apify ===
     apify_api_token: str = Field(default="")
     apify_actor_id: str = Field(default="supreme_coder~linkedin-profile-scraper")
+    # Public base URL of this backend; when set, Apify notifies run completion
+    # via POST {base}/api/apify/webhook instead of being polled
+    apify_webhook_base_url: str = Field(default="")
+    apify_webhook_secret: str = Field(default="")
     
     # === OpenAI ===
     openai_api_key: str = Field(default="")
+    # Model for AI scoring; "groq/<model>" runs on Groq (pip install langchain-groq)
+    scoring_model: str = Field(default="gpt-4o-mini")
+    groq_api_key: str = Field(default="")
+    # Max in-flight scoring requests per batch (keeps bursts under the RPM limit)
+    openai_concurrency: int = Field(default=8)
+    # Reuse the AI scores of a near-identical profile at this cosine similarity
+    # (0.95 is a good value; needs NumPy); 0 disables
+    semantic_cache_threshold: float = Field(default=0.0)
     
     # === PDF Generation ===
     pdfshift_api_key: str = Field(default="")
+    # Generated PDFs are cached here for a day (shared across restarts/workers); empty disables.
+    # Reports hold personal data: use a private directory, not a shared temp dir
+    pdf_cache_dir: str = Field(default="")
 
     # === Payment / RentBasket ===
     bypass_payment: bool = Field(default=False)
@@ -5,7 +5,6 @@ Handles the LinkedIn profile scraping via Apify.
 Contains: start_scrape, poll_apify, fetch_dataset
 """
 
-import asyncio
 from datetime import datetime
 from typing import Any
 
@@ -32,7 +31,7 @@ def start_scrape(state: LinkifyState) -> LinkifyState:
     
     # Start the Apify actor (sync wrapper around async)
     try:
-        run_info = asyncio.run(apify.start_scrape(linkedin_url))
+        run_info = apify.run_sync(apify.start_scrape(linkedin_url))
         apify_run_id = run_info["run_id"]
         apify_status = run_info["status"]
     except Exception as e:
@@ -114,7 +113,7 @@ def poll_apify(state: LinkifyState) -> LinkifyState:
     
     try:
         # Poll until complete
-        final_status = asyncio.run(apify.poll_until_complete(apify_run_id))
+        final_status = apify.run_sync(apify.poll_until_complete(apify_run_id))
         apify_status = final_status["status"]
     except Exception as e:
         error_message = f"Failed to poll Apify: {str(e)}"
@@ -185,14 +184,14 @@ def fetch_dataset(state: LinkifyState) -> LinkifyState:
     
     try:
         # Get run status to get dataset ID
-        run_status = asyncio.run(apify.get_run_status(apify_run_id))
+        run_status = apify.run_sync(apify.get_run_status(apify_run_id))
         dataset_id = run_status.get("default_dataset_id")
         
         if not dataset_id:
             raise ValueError("No dataset ID found")
         
         # Get dataset items
-        items = asyncio.run(apify.get_dataset_items(dataset_id))
+        items = apify.run_sync(apify.get_dataset_items(dataset_id, limit=1))
         
         if not items:
             # Empty dataset - common with LinkedIn scrapers
@@ -215,16 +214,16 @@ def fetch_dataset(state: LinkifyState) -> LinkifyState:
                     if unique_id:
                         _status_cache[unique_id] = {**state, "scrape_status": "retrying"}
                     
-                    new_run_info = asyncio.run(apify.start_scrape(linkedin_url))
+                    new_run_info = apify.run_sync(apify.start_scrape(linkedin_url))
                     new_run_id = new_run_info["run_id"]
                     
                     # Poll for completion
-                    new_final_status = asyncio.run(apify.poll_until_complete(new_run_id))
+                    new_final_status = apify.run_sync(apify.poll_until_complete(new_run_id))
                     
                     if new_final_status["status"] == "SUCCEEDED":
                         new_dataset_id = new_final_status.get("default_dataset_id")
                         if new_dataset_id:
-                            new_items = asyncio.run(apify.get_dataset_items(new_dataset_id))
+                            new_items = apify.run_sync(apify.get_dataset_items(new_dataset_id, limit=1))
                             if new_items:
                                 log_info("scrape", f"Retry succeeded on attempt {scrape_attempt + 1}", {
                                     "linkedin_url": linkedin_url,
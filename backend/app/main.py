@@ -10,6 +10,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from app import __version__
 from app.config import settings
 from app.api.routes import router as api_router
+from app.scoring.vision import close_http_client
+from app.services.apify import close_apify_service
+from app.services.openai_scoring import close_scoring_service, warm_scoring_service
+from app.services.pdf_service import close_pdf_service
 from app.services.logger import get_session_logger, log_info
 
 
@@ -26,8 +30,15 @@ async def lifespan(app: FastAPI):
     print(f"   Environment: {settings.app_env}")
     print(f"   Debug: {settings.debug}")
     print(f"   Logs: ./logs/")
+    
+    # Pay client setup and the TLS handshake before the first scoring request
+    await warm_scoring_service()
     yield
     # Shutdown
+    await close_http_client()
+    await close_apify_service()
+    await close_scoring_service()
+    await close_pdf_service()
     log_info("shutdown", "👋 Shutting down LinkifyMe Backend")
     print("👋 Shutting down LinkifyMe Backend")
 
@@ -5,12 +5,14 @@ The main entry point for deterministic profile scoring.
 Computes section scores, applies rules, and calculates final weighted score.
 """
 
+import asyncio
 from typing import Any, Optional
 
 from app.scoring.helpers import clamp
-from app.scoring.sections import SCORER_MAP
+from app.scoring.normalize import normalize_profile
+from app.scoring.sections import SCORER_ITEMS, SCORER_MAP
 from app.scoring.personas import load_persona, list_personas
-from app.scoring.rules import apply_rules
+from app.scoring.rules import apply_rules, build_section_texts
 
 
 # Quality gates - hard caps on final score
@@ -20,6 +22,11 @@ QUALITY_GATES = {
     "no_experience": 4.5,      # Max 4.5 if no experience
 }
 
+# Scorers with an AI (network-bound) score_async variant vs. pure-CPU scorers
+_ASYNC_SCORER_ITEMS = tuple(item for item in SCORER_ITEMS if hasattr(item[1], "score_async"))
+_ASYNC_SCORER_KEYS = tuple(key for key, _ in _ASYNC_SCORER_ITEMS)
+_SYNC_SCORER_ITEMS = tuple(item for item in SCORER_ITEMS if not hasattr(item[1], "score_async"))
+
 
 def get_pre_scores(
     profile: dict,
@@ -40,6 +47,86 @@ def get_pre_scores(
         Dict with all section scores and final weighted score.
         Matches Google Sheets column format.
     """
+    profile = normalize_profile(profile)
+    
+    # Calculate raw section scores
+    section_results = {
+        key: _section_entry(scorer.score(profile))
+        for key, scorer in SCORER_ITEMS
+    }
+    
+    return _build_pre_scores(profile, linkedin_url, user_id, persona, section_results)
+
+
+async def get_pre_scores_async(
+    profile: dict,
+    linkedin_url: str,
+    user_id: Optional[str] = None,
+    persona: str = "big_company_recruiter"
+) -> dict[str, Any]:
+    """
+    Async variant of get_pre_scores that runs AI vision analysis.
+    
+    Scorers with a score_async method (profile and cover picture) call the
+    OpenAI Vision API; those calls run concurrently with each other and with
+    the deterministic scorers, so total latency is roughly the slowest call.
+    """
+    profile = normalize_profile(profile)
+    
+    def score_sync_sections() -> dict[str, dict]:
+        return {key: scorer.score(profile) for key, scorer in _SYNC_SCORER_ITEMS}
+    
+    sync_results, *async_results = await asyncio.gather(
+        asyncio.to_thread(score_sync_sections),
+        *(scorer.score_async(profile) for _, scorer in _ASYNC_SCORER_ITEMS),
+    )
+    results = {**sync_results, **dict(zip(_ASYNC_SCORER_KEYS, async_results))}
+    
+    # Keep the usual section order for rules and debug output
+    section_results = {key: _section_entry(results[key]) for key, _ in SCORER_ITEMS}
+    
+    return _build_pre_scores(profile, linkedin_url, user_id, persona, section_results)
+
+
+async def get_pre_scores_batch_async(
+    profiles: list[dict],
+    linkedin_urls: list[str],
+    persona: str = "big_company_recruiter"
+) -> list[dict[str, Any]]:
+    """
+    Score several profiles with AI vision, batching the profile pictures.
+    
+    All profile pictures are analyzed up front in shared Vision requests;
+    each profile's score_async then reads its analysis from the cache.
+    """
+    profiles = [normalize_profile(profile) for profile in profiles]
+    await SCORER_MAP["profile_pic"].analyze_batch(
+        [profile["_picture_url"] for profile in profiles]
+    )
+    
+    return await asyncio.gather(*(
+        get_pre_scores_async(profile, linkedin_url, persona=persona)
+        for profile, linkedin_url in zip(profiles, linkedin_urls)
+    ))
+
+
+def _section_entry(result: dict) -> dict[str, Any]:
+    """Convert a scorer result into a calculator section entry."""
+    return {
+        "raw": result["score_raw"],
+        "reasons": result["reasons"],
+        "signals": result["signals"],
+    }
+
+
+def _build_pre_scores(
+    profile: dict,
+    linkedin_url: str,
+    user_id: Optional[str],
+    persona: str,
+    section_results: dict[str, dict[str, Any]],
+) -> dict[str, Any]:
+    """Apply rules, quality gates and persona weights to raw section scores."""
     # Validate persona
     available_personas = list_personas()
     if persona not in available_personas:
@@ -49,21 +136,14 @@ def get_pre_scores(
     persona_config = load_persona(persona)
     weights = persona_config["weights"]
     
-    # Calculate raw section scores
-    section_results = {}
-    for key, scorer in SCORER_MAP.items():
-        result = scorer.score(profile)
-        section_results[key] = {
-            "raw": result["score_raw"],
-            "reasons": result["reasons"],
-            "signals": result["signals"],
-        }
-    
     # Apply rules to each section
     rules_applied = []
+    section_texts = build_section_texts(profile)
     for key in section_results:
         raw_score = section_results[key]["raw"]
-        modified_score, rule_reasons = apply_rules(key, raw_score, profile, persona)
+        modified_score, rule_reasons = apply_rules(
+            key, raw_score, profile, persona, section_texts=section_texts
+        )
         section_results[key]["after_rules"] = modified_score
         section_results[key]["reasons"].extend(rule_reasons)
         rules_applied.extend(rule_reasons)
@@ -80,8 +160,7 @@ def get_pre_scores(
         score_cap = min(score_cap, QUALITY_GATES["no_headline"])
         gates_applied.append("No headline (capped at 7.5)")
     
-    positions = profile.get("positions", []) or profile.get("experience", [])
-    if not positions:
+    if not profile.get("_positions"):
         score_cap = min(score_cap, QUALITY_GATES["no_experience"])
         gates_applied.append("No experience (capped at 4.5)")
     
@@ -150,8 +229,7 @@ def validate_persona_weights(persona: str) -> bool:
     """Validate that a persona's weights sum to 1.0."""
     try:
         config = load_persona(persona)
-        total = sum(config["weights"].values())
-        return 0.99 <= total <= 1.01
+        return 0.99 <= config["_weights_sum"] <= 1.01
     except Exception:
         return False
 
@@ -5,7 +5,10 @@ Utility functions for profile scoring calculations.
 """
 
 import re
-from typing import Any
+from bisect import bisect_right
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
 
 
 def clamp(value: float, min_val: float = 0.0, max_val: float = 10.0) -> float:
@@ -38,6 +41,46 @@ def is_true(val: Any) -> bool:
     return bool(val)
 
 
+_METRIC_PREFILTER_CHARS = '0123456789$'
+
+# Keyword sets built once at import rather than on every call
+ACTION_VERBS = frozenset({
+    'built', 'led', 'designed', 'developed', 'created', 'implemented',
+    'managed', 'launched', 'reduced', 'increased', 'improved', 'achieved',
+    'delivered', 'orchestrated', 'spearheaded', 'architected', 'optimized',
+    'automated', 'scaled', 'established', 'transformed', 'pioneered',
+    'executed', 'drove', 'accelerated', 'streamlined', 'mentored'
+})
+
+STANDARD_TITLES = frozenset({
+    'software engineer', 'product manager', 'data scientist',
+    'data analyst', 'developer', 'designer', 'consultant',
+    'analyst', 'manager', 'director', 'engineer', 'architect',
+    'lead', 'founder', 'co-founder', 'ceo', 'cto', 'cfo', 'coo',
+    'intern', 'associate', 'specialist', 'coordinator', 'executive',
+    'head', 'vp', 'vice president', 'senior', 'principal', 'staff'
+})
+
+
+# Metric patterns, compiled once (counted separately, as before)
+_METRIC_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\d+%',                                    # percentages
+    r'\$[\d,]+',                                # dollar amounts
+    r'₹[\d,]+',                                 # rupee amounts
+    r'\d+[xX]\s',                               # multipliers (2x, 10x)
+    r'\d+\+?\s*(users|customers|clients|projects|leads|members)',
+    r'\d+\s*(hours?|days?|weeks?|months?)\s*(saved|reduced)',
+))
+
+# Sentence/bullet markers for count_action_verbs
+_SENTENCE_SPLIT_RE = re.compile(r'[.•\n]')
+
+# LinkedIn vanity URL checks for is_custom_url
+_PROFILE_SLUG_RE = re.compile(r'linkedin\.com/in/([^/?]+)', re.IGNORECASE)
+_NUMERIC_SLUG_RE = re.compile(r'^\d+$')
+_DEFAULT_SLUG_RE = re.compile(r'^[a-z]+-[a-z]+-\d{8,}$', re.IGNORECASE)
+
+
 def count_metrics(text: str) -> int:
     """
     Count quantified metrics in text.
@@ -46,19 +89,14 @@ def count_metrics(text: str) -> int:
     if not text:
         return 0
     
-    patterns = [
-        r'\d+%',                                    # percentages
-        r'\$[\d,]+',                                # dollar amounts
-        r'₹[\d,]+',                                 # rupee amounts
-        r'\d+[xX]\s',                               # multipliers (2x, 10x)
-        r'\d+\+?\s*(users|customers|clients|projects|leads|members)',
-        r'\d+\s*(hours?|days?|weeks?|months?)\s*(saved|reduced)',
-    ]
+    # Every metric needs a digit or currency sign; skip the regexes when an
+    # ASCII text has neither (non-ASCII text may hold ₹ or Unicode digits)
+    if text.isascii() and not any(c in text for c in _METRIC_PREFILTER_CHARS):
+        return 0
     
     count = 0
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        count += len(matches)
+    for pattern in _METRIC_PATTERNS:
+        count += len(pattern.findall(text))
     
     return count
 
@@ -71,22 +109,14 @@ def count_action_verbs(text: str) -> dict:
     if not text:
         return {"total": 0, "action_count": 0, "ratio": 0.0}
     
-    action_verbs = {
-        'built', 'led', 'designed', 'developed', 'created', 'implemented',
-        'managed', 'launched', 'reduced', 'increased', 'improved', 'achieved',
-        'delivered', 'orchestrated', 'spearheaded', 'architected', 'optimized',
-        'automated', 'scaled', 'established', 'transformed', 'pioneered',
-        'executed', 'drove', 'accelerated', 'streamlined', 'mentored'
-    }
-    
     # Split by sentence/bullet markers
-    sentences = re.split(r'[.•\n]', text)
-    sentences = [s.strip() for s in sentences if len(s.strip()) > 10]
+    sentences = [s for s in map(str.strip, _SENTENCE_SPLIT_RE.split(text)) if len(s) > 10]
     
     action_count = 0
     for sentence in sentences:
-        first_word = sentence.split()[0].lower() if sentence.split() else ''
-        if first_word in action_verbs:
+        # Sentences are stripped and longer than 10 chars, so never empty
+        first_word = sentence.split(None, 1)[0].lower()
+        if first_word in ACTION_VERBS:
             action_count += 1
     
     total = len(sentences)
@@ -95,20 +125,44 @@ def count_action_verbs(text: str) -> dict:
     return {"total": total, "action_count": action_count, "ratio": ratio}
 
 
+class DescriptionAnalysis(NamedTuple):
+    """Metric and action-verb counts for one block of description text."""
+    
+    metrics_count: int
+    sentence_count: int
+    action_count: int
+    action_ratio: float
+
+
+@lru_cache(maxsize=256)
+def analyze_description_block(text: str) -> DescriptionAnalysis:
+    """
+    Run count_metrics and count_action_verbs over a text block in one call.
+    Memoized on the text, so re-scoring a profile reuses the analysis.
+    """
+    verbs = count_action_verbs(text)
+    return DescriptionAnalysis(
+        metrics_count=count_metrics(text),
+        sentence_count=verbs["total"],
+        action_count=verbs["action_count"],
+        action_ratio=verbs["ratio"],
+    )
+
+
 def is_custom_url(url: str) -> bool:
     """Check if LinkedIn URL is custom (not default numeric)."""
     if not url:
         return False
     
-    match = re.search(r'linkedin\.com/in/([^/?]+)', url, re.IGNORECASE)
+    match = _PROFILE_SLUG_RE.search(url)
     if not match:
         return False
     
     username = match.group(1)
     # Default URLs often have many numbers or pattern like name-name-12345678
-    if re.match(r'^\d+$', username):
+    if _NUMERIC_SLUG_RE.match(username):
         return False
-    if re.match(r'^[a-z]+-[a-z]+-\d{8,}$', username, re.IGNORECASE):
+    if _DEFAULT_SLUG_RE.match(username):
         return False
     
     return True
@@ -119,26 +173,29 @@ def is_standard_title(title: str) -> bool:
     if not title:
         return False
     
-    standard_titles = {
-        'software engineer', 'product manager', 'data scientist',
-        'data analyst', 'developer', 'designer', 'consultant',
-        'analyst', 'manager', 'director', 'engineer', 'architect',
-        'lead', 'founder', 'co-founder', 'ceo', 'cto', 'cfo', 'coo',
-        'intern', 'associate', 'specialist', 'coordinator', 'executive',
-        'head', 'vp', 'vice president', 'senior', 'principal', 'staff'
-    }
-    
     lower = title.lower()
-    return any(t in lower for t in standard_titles)
+    return any(t in lower for t in STANDARD_TITLES)
+
+
+@lru_cache(maxsize=64)
+def compile_keyword_pattern(keywords: frozenset[str]) -> re.Pattern:
+    """Compile keywords into one case-insensitive, word-bounded alternation."""
+    ordered = sorted({kw.lower() for kw in keywords}, key=lambda kw: (-len(kw), kw))
+    alternation = "|".join(re.escape(kw) for kw in ordered)
+    return re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
 
 
-def has_keywords(text: str, keywords: list[str]) -> int:
-    """Count how many keywords are present in text."""
+def has_keywords(text: str, keywords: Iterable[str] | re.Pattern) -> int:
+    """
+    Count how many distinct keywords are present in text (whole words, any case).
+    keywords: a keyword collection or a pattern from compile_keyword_pattern
+    """
     if not text:
         return 0
     
-    lower = text.lower()
-    return sum(1 for kw in keywords if kw.lower() in lower)
+    if not isinstance(keywords, re.Pattern):
+        keywords = compile_keyword_pattern(frozenset(keywords))
+    return len({match.lower() for match in keywords.findall(text)})
 
 
 def calculate_length_score(
@@ -169,6 +226,22 @@ def calculate_length_score(
         return clamp(max_score - penalty)
 
 
+# Scraped count strings: "1,234", "500+", "1.2K", "3M" (not "12 months")
+_COUNT_RE = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*([KkMm]?)(?![A-Za-z])')
+_COUNT_MULTIPLIERS = {'': 1, 'K': 1_000, 'k': 1_000, 'M': 1_000_000, 'm': 1_000_000}
+
+
+def parse_count(value: Any) -> Optional[int]:
+    """Parse a scraped count (number, or text like "500+" / "1,234" / "1.5K"); None if unknown."""
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        match = _COUNT_RE.search(value)
+        if match:
+            return int(float(match.group(1).replace(',', '')) * _COUNT_MULTIPLIERS[match.group(2)])
+    return None
+
+
 def map_count_to_score(count: int, thresholds: list[tuple[int, float]]) -> float:
     """
     Map a count to a score using threshold ranges.
@@ -181,3 +254,50 @@ def map_count_to_score(count: int, thresholds: list[tuple[int, float]]) -> float
         else:
             break
     return clamp(score)
+
+
+def lookup_count_score(
+    count: int,
+    counts: tuple[int, ...],
+    scores: tuple[float, ...]
+) -> float:
+    """
+    Binary-search equivalent of map_count_to_score.
+    counts/scores: parallel tuples split from a thresholds list, sorted ascending
+    """
+    idx = bisect_right(counts, count) - 1
+    return clamp(scores[idx] if idx >= 0 else 1.0)
+
+
+def require_numpy():
+    """Import NumPy for the optional bulk-scoring paths and the semantic score cache."""
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "NumPy not installed. Install with: pip install numpy"
+        )
+    return np
+
+
+@lru_cache(maxsize=16)
+def _threshold_arrays(counts: tuple[int, ...], scores: tuple[float, ...]):
+    """NumPy copies of a thresholds table, built once per table."""
+    import numpy as np
+    return np.asarray(counts), np.asarray(scores, dtype=float)
+
+
+def lookup_count_scores(
+    counts: Iterable[int],
+    threshold_counts: tuple[int, ...],
+    scores: tuple[float, ...]
+):
+    """
+    Vectorized lookup_count_score for many counts at once (requires NumPy).
+    Returns a float ndarray with one clamped score per count.
+    """
+    np = require_numpy()
+    counts_np, scores_np = _threshold_arrays(threshold_counts, scores)
+    idx = np.searchsorted(counts_np, np.asarray(counts), side="right") - 1
+    values = np.where(idx >= 0, scores_np[np.maximum(idx, 0)], 1.0)
+    return np.round(np.clip(values, 0.0, 10.0), 1)
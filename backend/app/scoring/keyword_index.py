@@ -0,0 +1,61 @@
+"""
+Keyword Index
+
+Aho-Corasick keyword matching shared by the section scorers.
+One pass over a text counts the distinct keywords found for every category,
+matching whole words case-insensitively (same rules as has_keywords).
+"""
+
+from collections.abc import Iterable, Mapping
+
+import ahocorasick
+
+
+def _is_word_char(char: str) -> bool:
+    """Match regex \\w: letters, digits and underscore."""
+    return char.isalnum() or char == "_"
+
+
+def _at_boundary(text: str, index: int) -> bool:
+    """Check for a regex-style word boundary just before text[index]."""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+class KeywordIndex:
+    """Frozen automaton over several keyword categories."""
+
+    def __init__(self, categories: Mapping[str, Iterable[str]]):
+        self.categories = tuple(categories)
+
+        owners: dict[str, list[str]] = {}
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                owners.setdefault(keyword.lower(), []).append(category)
+
+        self._automaton = ahocorasick.Automaton()
+        for keyword, keyword_categories in owners.items():
+            self._automaton.add_word(keyword, (keyword, tuple(keyword_categories)))
+        self._automaton.make_automaton()
+
+    def scan_categories(self, text: str) -> dict[str, int]:
+        """Count distinct whole-word keyword hits per category in one pass."""
+        counts = dict.fromkeys(self.categories, 0)
+        if not text:
+            return counts
+
+        lower = text.lower()
+        seen = set()
+        for end, (keyword, keyword_categories) in self._automaton.iter(lower):
+            if keyword in seen:
+                continue
+            start = end - len(keyword) + 1
+            if _at_boundary(lower, start) and _at_boundary(lower, end + 1):
+                seen.add(keyword)
+                for category in keyword_categories:
+                    counts[category] += 1
+        return counts
+
+
+__all__ = ["KeywordIndex"]
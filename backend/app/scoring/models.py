@@ -1,43 +1,52 @@
 """
 Scoring Models
 
-Pydantic schemas for scoring data structures.
+Schemas for scoring data structures.
+
+Internal intermediates are plain TypedDicts/dataclasses (their values are
+already clamped by the scorers); only the API-facing ScoringResult and the
+config schemas go through Pydantic validation.
 """
 
-from typing import Any, Optional
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from typing import Any, Optional, TypedDict
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
-class SectionResult(BaseModel):
-    """Result from a single section scorer."""
+class SectionResult(TypedDict):
+    """Result from a single section scorer (the dict returned by score())."""
     
-    score_raw: float = Field(ge=1.0, le=10.0, description="Raw score 1-10")
-    reasons: list[str] = Field(default_factory=list)
-    signals: dict[str, Any] = Field(default_factory=dict)
+    score_raw: float  # Raw score, clamped by BaseSectionScorer._result
+    reasons: list[str]
+    signals: dict[str, Any]
 
 
-class SectionFinal(BaseModel):
+@dataclass(slots=True)
+class SectionFinal:
     """Final section score after rules applied."""
     
-    raw: float = Field(ge=1.0, le=10.0)
-    after_rules: float = Field(ge=1.0, le=10.0)
-    weight: float = Field(ge=0.0, le=1.0)
+    raw: float
+    after_rules: float
+    weight: float
     weighted_contribution: float
-    reasons: list[str] = Field(default_factory=list)
+    reasons: list[str] = field(default_factory=list)
 
 
-class DebugInfo(BaseModel):
+@dataclass(slots=True)
+class DebugInfo:
     """Debug information for scoring."""
     
     persona: str
     weights: dict[str, float]
     sections: dict[str, SectionFinal]
-    rules_applied: list[str] = Field(default_factory=list)
+    rules_applied: list[str] = field(default_factory=list)
 
 
 class ScoringResult(BaseModel):
     """Complete scoring result for API/Google Sheets."""
     
+    model_config = ConfigDict(populate_by_name=True)
+    
     user_id: str = Field(alias="User ID")
     linkedin_profile: str = Field(alias="LinkedIn Profile")
     first_name: str = Field(alias="First Name")
@@ -56,19 +65,26 @@ class ScoringResult(BaseModel):
     final_score: float = Field(ge=1.0, le=10.0, alias="Final Score")
     debug: Optional[DebugInfo] = Field(default=None, alias="_debug")
 
-    class Config:
-        populate_by_name = True
-
 
 class PersonaConfig(BaseModel):
     """Persona weight configuration."""
     
     name: str
     weights: dict[str, float]
+    _weights_sum: Optional[float] = PrivateAttr(default=None)
+    
+    @classmethod
+    def from_loaded(cls, name: str, config: dict[str, Any]) -> "PersonaConfig":
+        """Build from a load_persona() dict, reusing its precomputed weight sum."""
+        persona = cls(name=name, weights=config["weights"])
+        persona._weights_sum = config.get("_weights_sum")
+        return persona
     
     def validate_weights(self) -> bool:
         """Check that weights sum to 1.0."""
-        total = sum(self.weights.values())
+        total = self._weights_sum
+        if total is None:
+            total = self._weights_sum = sum(self.weights.values())
         return 0.99 <= total <= 1.01  # Allow small floating point variance
 
 
@@ -0,0 +1,53 @@
+"""
+Profile Normalization
+
+Resolves the field aliases used by different scrapers once per profile.
+Section scorers read the canonical underscore keys instead of chaining
+profile.get() fallbacks for every field.
+"""
+
+from typing import Any
+
+
+# Shared empty default for list fields (never mutated by the scorers)
+EMPTY_LIST: tuple = ()
+
+# Canonical key -> (source keys in priority order, default)
+FIELD_ALIASES: dict[str, tuple[tuple[str, ...], Any]] = {
+    "_positions": (("positions", "experience"), EMPTY_LIST),
+    "_educations": (("educations", "education"), EMPTY_LIST),
+    "_certifications": (("certifications", "licenses"), EMPTY_LIST),
+    "_followers": (("followersCount", "followerCount"), 0),
+    "_picture_url": (("pictureUrl", "profilePictureUrl"), ""),
+    "_cover_url": (("coverImageUrl", "backgroundImageUrl"), ""),
+    "_about": (("about", "summary"), ""),
+}
+
+_NORMALIZED_FLAG = "_normalized"
+
+
+def normalize_profile(profile: dict) -> dict:
+    """
+    Return a shallow copy of a scraped profile with canonical keys added.
+
+    Each canonical key holds the first truthy alias value, or the default.
+    Already-normalized profiles are returned as-is, so calling this again
+    further down the pipeline is free.
+    """
+    if profile.get(_NORMALIZED_FLAG):
+        return profile
+
+    normalized = dict(profile)
+    for canonical, (sources, default) in FIELD_ALIASES.items():
+        value = default
+        for source in sources:
+            candidate = profile.get(source)
+            if candidate:
+                value = candidate
+                break
+        normalized[canonical] = value
+    normalized[_NORMALIZED_FLAG] = True
+    return normalized
+
+
+__all__ = ["EMPTY_LIST", "FIELD_ALIASES", "normalize_profile"]
@@ -1,7 +1,8 @@
 # Rules module init
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 import re
 import yaml
 
@@ -10,14 +11,44 @@ from app.scoring.helpers import clamp
 
 RULES_DIR = Path(__file__).parent
 
+# Top-level keys the scorer actually reads; anything else is skipped
+RULES_FILE_KEYS = frozenset({"version", "rules"})
+
+
+class _RulesLoader(yaml.SafeLoader):
+    """SafeLoader that only constructs the top-level keys in RULES_FILE_KEYS."""
+    
+    def get_rules_data(self) -> Optional[dict[str, Any]]:
+        root = self.get_single_node()
+        if not isinstance(root, yaml.MappingNode):
+            return None
+        return {
+            key_node.value: self.construct_object(value_node, deep=True)
+            for key_node, value_node in root.value
+            if key_node.value in RULES_FILE_KEYS
+        }
+
+
+@lru_cache(maxsize=32)
+def _load_rules_cached(filepath: Path, mtime_ns: int) -> dict[str, Any]:
+    """Parse a rules file; cached per path and modification time."""
+    with open(filepath) as f:
+        loader = _RulesLoader(f)
+        try:
+            data = loader.get_rules_data()
+        finally:
+            loader.dispose()
+    return data or {"version": 1, "rules": []}
+
 
 def load_rules_file(filepath: Path) -> dict[str, Any]:
-    """Load a YAML rules file."""
-    if not filepath.exists():
+    """Load a YAML rules file (only its version and rules keys)."""
+    try:
+        mtime_ns = filepath.stat().st_mtime_ns
+    except FileNotFoundError:
         return {"version": 1, "rules": []}
     
-    with open(filepath) as f:
-        return yaml.safe_load(f) or {"version": 1, "rules": []}
+    return _load_rules_cached(filepath, mtime_ns)
 
 
 def check_rule_condition(rule: dict, section_key: str, text: str) -> bool:
@@ -78,19 +109,28 @@ def apply_rules(
     section_key: str,
     score: float,
     profile: dict,
-    persona: str = "big_company_recruiter"
+    persona: str = "big_company_recruiter",
+    section_texts: Optional[dict[str, str]] = None,
 ) -> tuple[float, list[str]]:
     """
     Apply rules to modify a section score.
     
     Order: base_rules -> persona_rules -> hr_insights_compiled
     
+    Args:
+        section_texts: Optional precomputed output of build_section_texts(profile).
+            Pass it when scoring every section of the same profile so the
+            section text is only built once.
+    
     Returns: (modified_score, list of rule reasons)
     """
     reasons = []
     
     # Get text for this section (for pattern matching)
-    text = _get_section_text(section_key, profile)
+    if section_texts is not None:
+        text = section_texts.get(section_key, "")
+    else:
+        text = _get_section_text(section_key, profile)
     
     # Load rule files in order
     rule_files = [
@@ -117,24 +157,33 @@ def apply_rules(
     return clamp(score), reasons
 
 
+# Rule-matching text builders, one per text-bearing section
+_SECTION_TEXT_BUILDERS = {
+    "headline": lambda profile: profile.get("headline", ""),
+    "about": lambda profile: profile.get("about", "") or profile.get("summary", ""),
+    "experience": lambda profile: " ".join(
+        p.get("description", "") for p in profile.get("positions", [])
+    ),
+    "education": lambda profile: " ".join(
+        e.get("schoolName", "") + " " + e.get("degreeName", "")
+        for e in profile.get("educations", [])
+    ),
+    "skills": lambda profile: " ".join(
+        s.get("name", "") if isinstance(s, dict) else str(s)
+        for s in profile.get("skills", [])
+    ),
+}
+
+
+def build_section_texts(profile: dict) -> dict[str, str]:
+    """Extract the rule-matching text for every text-bearing section at once."""
+    return {key: build(profile) for key, build in _SECTION_TEXT_BUILDERS.items()}
+
+
 def _get_section_text(section_key: str, profile: dict) -> str:
     """Extract the relevant text for a section from the profile."""
-    mapping = {
-        "headline": profile.get("headline", ""),
-        "about": profile.get("about", "") or profile.get("summary", ""),
-        "experience": " ".join(
-            p.get("description", "") for p in profile.get("positions", [])
-        ),
-        "education": " ".join(
-            e.get("schoolName", "") + " " + e.get("degreeName", "")
-            for e in profile.get("educations", [])
-        ),
-        "skills": " ".join(
-            s.get("name", "") if isinstance(s, dict) else str(s)
-            for s in profile.get("skills", [])
-        ),
-    }
-    return mapping.get(section_key, "")
-
-
-__all__ = ["apply_rules", "load_rules_file"]
+    build = _SECTION_TEXT_BUILDERS.get(section_key)
+    return build(profile) if build else ""
+
+
+__all__ = ["apply_rules", "build_section_texts", "load_rules_file"]
@@ -13,7 +13,8 @@ from app.scoring.sections.licenses_certs import LicensesCertsScorer
 from app.scoring.sections.verified import VerifiedScorer
 from app.scoring.sections.premium import PremiumScorer
 
-ALL_SCORERS = [
+# Shared, stateless instances reused across every request
+ALL_SCORERS = (
     HeadlineScorer(),
     ConnectionsScorer(),
     FollowersScorer(),
@@ -26,12 +27,28 @@ ALL_SCORERS = [
     LicensesCertsScorer(),
     VerifiedScorer(),
     PremiumScorer(),
-]
+)
 
 SCORER_MAP = {scorer.key: scorer for scorer in ALL_SCORERS}
+SCORER_ITEMS = tuple(SCORER_MAP.items())
+
+
+def _assert_stateless(scorers: tuple[BaseSectionScorer, ...]) -> None:
+    """Fail at import if a scorer keeps per-profile state on its instance."""
+    for scorer in scorers:
+        scorer.score({})
+        if vars(scorer):
+            raise RuntimeError(
+                f"{type(scorer).__name__} sets instance attributes in score(): "
+                f"{sorted(vars(scorer))}; shared scorers must be stateless"
+            )
+
+
+_assert_stateless(ALL_SCORERS)
 
 __all__ = [
     "BaseSectionScorer",
     "ALL_SCORERS",
     "SCORER_MAP",
+    "SCORER_ITEMS",
 ]
@@ -4,9 +4,13 @@ About Section Scorer
 Evaluates: length, structure, quantification, keywords, buzzwords.
 """
 
-import re
 from app.scoring.sections.base_sections import BaseSectionScorer
-from app.scoring.helpers import count_metrics, has_keywords
+from app.scoring.helpers import count_metrics
+from app.scoring.keyword_index import KeywordIndex
+
+
+# Newline, bullet, hyphen, em dash
+_STRUCTURE_CHARS = ('\n', '•', '-', '—')
 
 
 class AboutScorer(BaseSectionScorer):
@@ -15,20 +19,26 @@ class AboutScorer(BaseSectionScorer):
     key = "about"
     display_name = "About Score"
     
-    BANNED_BUZZWORDS = [
+    BANNED_BUZZWORDS = frozenset({
         'synergy', 'hardworking', 'team player', 'passionate',
         'results-driven', 'detail-oriented', 'go-getter', 'ninja',
         'rockstar', 'guru', 'wizard', 'motivated', 'self-starter'
-    ]
+    })
     
-    VALUABLE_KEYWORDS = [
+    VALUABLE_KEYWORDS = frozenset({
         'python', 'java', 'javascript', 'react', 'aws', 'cloud',
         'data', 'ml', 'ai', 'led', 'built', 'grew', 'managed',
         'revenue', 'customers', 'users', 'launched'
-    ]
+    })
     
-    def score(self, profile: dict) -> dict:
-        about = profile.get("about", "") or profile.get("summary", "") or ""
+    # Single-pass matcher for both categories, built at class definition
+    _KEYWORDS = KeywordIndex({
+        "buzzword": BANNED_BUZZWORDS,
+        "valuable": VALUABLE_KEYWORDS,
+    })
+    
+    def _score(self, profile: dict) -> dict:
+        about = profile.get("_about", "")
         reasons = []
         signals = {}
         
@@ -53,7 +63,7 @@ class AboutScorer(BaseSectionScorer):
             reasons.append("Too short")
         
         # Structure (bullets, line breaks, paragraphs)
-        has_structure = bool(re.search(r'[\n•\-—]', about))
+        has_structure = any(c in about for c in _STRUCTURE_CHARS)
         if has_structure:
             score += 1.5
             reasons.append("Well-structured with formatting")
@@ -69,8 +79,10 @@ class AboutScorer(BaseSectionScorer):
             reasons.append("Contains metrics")
         signals["metrics_count"] = metrics
         
+        keyword_counts = self._KEYWORDS.scan_categories(about)
+        
         # Valuable keywords
-        valuable = has_keywords(about, self.VALUABLE_KEYWORDS)
+        valuable = keyword_counts["valuable"]
         if valuable >= 3:
             score += 1.5
             reasons.append("Rich with relevant keywords")
@@ -80,7 +92,7 @@ class AboutScorer(BaseSectionScorer):
         signals["valuable_keywords"] = valuable
         
         # Buzzword penalty
-        buzzwords = has_keywords(about, self.BANNED_BUZZWORDS)
+        buzzwords = keyword_counts["buzzword"]
         if buzzwords >= 3:
             score -= 2.0
             reasons.append("Too many generic buzzwords")
@@ -7,7 +7,9 @@ Abstract base class for all section scorers.
 from abc import ABC, abstractmethod
 from typing import Any
 
-from app.scoring.helpers import clamp
+from app.scoring.helpers import clamp, require_numpy
+from app.scoring.models import SectionResult
+from app.scoring.normalize import normalize_profile
 
 
 class BaseSectionScorer(ABC):
@@ -15,19 +17,29 @@ class BaseSectionScorer(ABC):
     Abstract base class for section scorers.
     
     All section scorers must inherit from this class and implement
-    the score() method that returns a score between 1-10.
+    the _score() method that returns a score between 1-10.
     """
     
     key: str  # e.g., "headline", "connections"
     display_name: str  # e.g., "Headline Score"
     
+    def score(self, profile: dict) -> SectionResult:
+        """
+        Calculate the section score of a raw or normalized profile.
+        
+        Scorers read only the canonical keys, so profiles not yet passed
+        through normalize_profile are normalized here (free otherwise).
+        """
+        return self._score(normalize_profile(profile))
+    
     @abstractmethod
-    def score(self, profile: dict) -> dict:
+    def _score(self, profile: dict) -> SectionResult:
         """
         Calculate the section score.
         
         Args:
-            profile: The scraped LinkedIn profile data
+            profile: The scraped LinkedIn profile data, as returned by
+                normalize_profile (aliased fields under canonical keys)
             
         Returns:
             {
@@ -38,12 +50,26 @@ class BaseSectionScorer(ABC):
         """
         pass
     
+    def score_profiles(self, profiles: list[dict]):
+        """
+        Raw scores for many profiles as a float ndarray (requires NumPy).
+        
+        Scorers whose score depends only on simple counts override this with
+        a vectorized version; the default just calls score() per profile.
+        """
+        np = require_numpy()
+        return np.fromiter(
+            (self.score(profile)["score_raw"] for profile in profiles),
+            dtype=float,
+            count=len(profiles),
+        )
+    
     def _result(
         self,
         score: float,
         reasons: list[str],
         signals: dict[str, Any] | None = None
-    ) -> dict:
+    ) -> SectionResult:
         """Helper to build a properly formatted result."""
         return {
             "score_raw": clamp(score),
@@ -5,7 +5,7 @@ Maps connection count to 1-10 score using thresholds.
 """
 
 from app.scoring.sections.base_sections import BaseSectionScorer
-from app.scoring.helpers import map_count_to_score
+from app.scoring.helpers import lookup_count_score, lookup_count_scores, require_numpy
 
 
 class ConnectionsScorer(BaseSectionScorer):
@@ -28,15 +28,27 @@ class ConnectionsScorer(BaseSectionScorer):
         (1000, 9.0),
         (2000, 10.0),
     ]
+    _COUNTS = tuple(min_count for min_count, _ in THRESHOLDS)
+    _SCORES = tuple(score for _, score in THRESHOLDS)
     
-    def score(self, profile: dict) -> dict:
-        count = profile.get("connectionsCount", 0) or 0
+    @staticmethod
+    def _count(profile: dict) -> int:
+        """Connection count of a profile as an int."""
+        count = profile.get("connectionsCount", 0)
         
-        # Handle string values like "500+"
-        if isinstance(count, str):
-            count = int(count.replace("+", "").replace(",", "")) if count else 0
+        # Scrapers usually emit ints; exact type checks keep that path cheapest
+        if type(count) is not int:
+            # Handle string values like "500+"
+            if type(count) is str:
+                count = int(count.replace("+", "").replace(",", "")) if count else 0
+            else:
+                count = count or 0
+        return count
+    
+    def _score(self, profile: dict) -> dict:
+        count = self._count(profile)
         
-        score = map_count_to_score(count, self.THRESHOLDS)
+        score = lookup_count_score(count, self._COUNTS, self._SCORES)
         
         reasons = []
         if count >= 1000:
@@ -49,3 +61,18 @@ class ConnectionsScorer(BaseSectionScorer):
             reasons.append(f"Limited network ({count} connections)")
         
         return self._result(score, reasons, {"count": count})
+    
+    def score_batch(self, counts):
+        """
+        Score many already-parsed connection counts in one vectorized pass.
+        
+        Requires NumPy. Returns only the raw scores (no reasons/signals),
+        for bulk scoring such as a column of counts read from Google Sheets.
+        """
+        return lookup_count_scores(counts, self._COUNTS, self._SCORES)
+    
+    def score_profiles(self, profiles: list[dict]):
+        """Vectorized raw connection scores for many profiles (requires NumPy)."""
+        np = require_numpy()
+        counts = np.fromiter(map(self._count, profiles), dtype=np.int64, count=len(profiles))
+        return self.score_batch(counts)
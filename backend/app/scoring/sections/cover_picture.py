@@ -5,13 +5,62 @@ AI-powered comprehensive cover/banner image analysis using OpenAI Vision API.
 Evaluates: relevance, branding, professionalism, quality, and visual appeal.
 """
 
-import httpx
+import orjson
 from typing import Optional
 
+from app.scoring.normalize import normalize_profile
 from app.scoring.sections.base_sections import BaseSectionScorer
+from app.scoring.vision import AnalysisCache, get_http_client, strip_code_fence
 from app.config import settings
 
 
+# Analyses of already-seen image URLs (re-scoring the same profile is free)
+_ANALYSIS_CACHE = AnalysisCache()
+
+# Static parts of the Vision request, built once
+_SYSTEM_MSG = {
+    "role": "system",
+    "content": """You are an expert at analyzing LinkedIn cover/banner images for professional quality.
+
+IMPORTANT: Be reasonably lenient in scoring. Not everyone needs a perfect corporate banner.
+A decent, professional-looking cover should score 6-7. Reserve 9-10 for exceptional branding.
+
+Analyze the image and rate each criterion on a scale of 0-10:
+
+1. relevance (0-10): Does it relate to the person's profession/industry? 
+   - Score 5+ for generic but professional images
+   - Score 7+ for industry-relevant imagery
+   - Score 9+ for highly specific professional branding
+
+2. branding (0-10): Does it include personal branding elements?
+   - Score 5+ for clean, professional look (even without text)
+   - Score 7+ for subtle branding (company logo, industry symbols)
+   - Score 9+ for clear personal brand (name, tagline, contact info)
+
+3. professionalism (0-10): Does it look professional?
+   - Score 5+ for non-personal, work-appropriate images
+   - Score 7+ for polished, business-appropriate imagery
+   - Score 9+ for exceptional, corporate-quality design
+
+4. visual_quality (0-10): Is the image high quality?
+   - Score 5+ for decent resolution, not blurry
+   - Score 7+ for good composition and clarity
+   - Score 9+ for exceptional quality and design
+
+5. uniqueness (0-10): Is it a custom image (not default LinkedIn)?
+   - Score 4+ for any non-default image
+   - Score 6+ for clearly customized images
+   - Score 9+ for original, professionally designed banners
+
+Return ONLY a JSON object with these keys and integer scores, nothing else:
+{"relevance": X, "branding": X, "professionalism": X, "visual_quality": X, "uniqueness": X, "summary": "one-line assessment"}""",
+}
+_USER_TEXT = {
+    "type": "text",
+    "text": "Analyze this LinkedIn cover/banner image for professional quality and branding.",
+}
+
+
 class CoverPictureScorer(BaseSectionScorer):
     """Score cover/banner image using AI vision analysis (1-10)."""
     
@@ -26,6 +75,8 @@ class CoverPictureScorer(BaseSectionScorer):
         "visual_quality": 2.0,     # High resolution, good composition
         "uniqueness": 1.5,         # Not a default/stock LinkedIn banner
     }
+    _CRITERIA_ITEMS = tuple(CRITERIA.items())
+    _TOTAL_WEIGHT = sum(CRITERIA.values())
     
     NO_COVER_SCORE = 0.0
     
@@ -36,6 +87,14 @@ class CoverPictureScorer(BaseSectionScorer):
         Returns dict with scores for each criterion (0-10 scale).
         Note: Scoring is intentionally lenient to avoid being too deterministic.
         """
+        cached = _ANALYSIS_CACHE.get(image_url)
+        if cached is not None:
+            return cached
+        
+        # AI disabled (no API key): skip the doomed request, use the fallback score
+        if not settings.openai_api_key:
+            return None
+        
         try:
             headers = {
                 "Content-Type": "application/json",
@@ -45,50 +104,11 @@ class CoverPictureScorer(BaseSectionScorer):
             payload = {
                 "model": "gpt-4o",
                 "messages": [
-                    {
-                        "role": "system",
-                        "content": """You are an expert at analyzing LinkedIn cover/banner images for professional quality.
-
-IMPORTANT: Be reasonably lenient in scoring. Not everyone needs a perfect corporate banner.
-A decent, professional-looking cover should score 6-7. Reserve 9-10 for exceptional branding.
-
-Analyze the image and rate each criterion on a scale of 0-10:
-
-1. relevance (0-10): Does it relate to the person's profession/industry? 
-   - Score 5+ for generic but professional images
-   - Score 7+ for industry-relevant imagery
-   - Score 9+ for highly specific professional branding
-
-2. branding (0-10): Does it include personal branding elements?
-   - Score 5+ for clean, professional look (even without text)
-   - Score 7+ for subtle branding (company logo, industry symbols)
-   - Score 9+ for clear personal brand (name, tagline, contact info)
-
-3. professionalism (0-10): Does it look professional?
-   - Score 5+ for non-personal, work-appropriate images
-   - Score 7+ for polished, business-appropriate imagery
-   - Score 9+ for exceptional, corporate-quality design
-
-4. visual_quality (0-10): Is the image high quality?
-   - Score 5+ for decent resolution, not blurry
-   - Score 7+ for good composition and clarity
-   - Score 9+ for exceptional quality and design
-
-5. uniqueness (0-10): Is it a custom image (not default LinkedIn)?
-   - Score 4+ for any non-default image
-   - Score 6+ for clearly customized images
-   - Score 9+ for original, professionally designed banners
-
-Return ONLY a JSON object with these keys and integer scores, nothing else:
-{"relevance": X, "branding": X, "professionalism": X, "visual_quality": X, "uniqueness": X, "summary": "one-line assessment"}"""
-                    },
+                    _SYSTEM_MSG,
                     {
                         "role": "user",
                         "content": [
-                            {
-                                "type": "text",
-                                "text": "Analyze this LinkedIn cover/banner image for professional quality and branding."
-                            },
+                            _USER_TEXT,
                             {
                                 "type": "image_url",
                                 "image_url": {
@@ -103,41 +123,33 @@ Return ONLY a JSON object with these keys and integer scores, nothing else:
                 "temperature": 0.4  # Slightly higher for less deterministic scoring
             }
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers=headers,
-                    json=payload
-                )
-                
-                if response.status_code != 200:
-                    return None
-                
-                result = response.json()
-                content = result["choices"][0]["message"]["content"]
-                
-                import json
-                content = content.strip()
-                if content.startswith("```"):
-                    content = content.split("```")[1]
-                    if content.startswith("json"):
-                        content = content[4:]
-                content = content.strip()
-                
-                analysis = json.loads(content)
-                return analysis
-                
+            response = await get_http_client().post(
+                "https://api.openai.com/v1/chat/completions",
+                headers=headers,
+                content=orjson.dumps(payload)
+            )
+            
+            if response.status_code != 200:
+                return None
+            
+            result = orjson.loads(response.content)
+            content = result["choices"][0]["message"]["content"]
+            
+            analysis = orjson.loads(strip_code_fence(content))
+            _ANALYSIS_CACHE.set(image_url, analysis)
+            return analysis
+            
         except Exception as e:
             print(f"Cover picture AI analysis failed: {e}")
             return None
     
-    def score(self, profile: dict) -> dict:
+    def _score(self, profile: dict) -> dict:
         """
         Score cover picture (sync version).
         
         For async AI analysis, use score_async.
         """
-        cover_url = profile.get("coverImageUrl") or profile.get("backgroundImageUrl") or ""
+        cover_url = profile.get("_cover_url", "")
         
         if not cover_url:
             return self._result(
@@ -157,7 +169,8 @@ Return ONLY a JSON object with these keys and integer scores, nothing else:
         """
         Async version that performs full AI vision analysis.
         """
-        cover_url = profile.get("coverImageUrl") or profile.get("backgroundImageUrl") or ""
+        profile = normalize_profile(profile)
+        cover_url = profile.get("_cover_url", "")
         
         if not cover_url:
             return self._result(
@@ -178,17 +191,17 @@ Return ONLY a JSON object with these keys and integer scores, nothing else:
             )
         
         # Calculate weighted score
-        total_weight = sum(self.CRITERIA.values())
-        weighted_score = 0.0
-        
-        criteria_scores = {}
-        for criterion, weight in self.CRITERIA.items():
-            score = analysis.get(criterion, 6)  # Default to 6 (generous)
-            criteria_scores[criterion] = score
-            weighted_score += (score / 10.0) * weight
+        criteria_scores = {
+            criterion: analysis.get(criterion, 6)  # Default to 6 (generous)
+            for criterion in self.CRITERIA
+        }
+        weighted_score = sum(
+            (criteria_scores[criterion] / 10.0) * weight
+            for criterion, weight in self._CRITERIA_ITEMS
+        )
         
         # Normalize to 1-10 scale
-        final_score = (weighted_score / total_weight) * 10.0
+        final_score = (weighted_score / self._TOTAL_WEIGHT) * 10.0
         final_score = max(1.0, min(10.0, round(final_score, 1)))
         
         # Build reasons (constructive feedback)
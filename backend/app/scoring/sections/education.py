@@ -5,6 +5,8 @@ Evaluates: presence, completeness, degree info.
 """
 
 from app.scoring.sections.base_sections import BaseSectionScorer
+from app.scoring.normalize import EMPTY_LIST, normalize_profile
+from app.scoring.helpers import require_numpy
 
 
 class EducationScorer(BaseSectionScorer):
@@ -13,8 +15,25 @@ class EducationScorer(BaseSectionScorer):
     key = "education"
     display_name = "Education Score"
     
-    def score(self, profile: dict) -> dict:
-        educations = profile.get("educations", []) or profile.get("education", []) or []
+    @staticmethod
+    def _features(educations: list[dict]) -> tuple[int, bool, bool]:
+        """Complete-entry count, field-of-study and dates flags for a section."""
+        # One pass: count complete entries and pick up the section-wide flags
+        complete_entries = 0
+        has_field = has_dates = False
+        for edu in educations:
+            get = edu.get
+            # Check for essential fields
+            if (get("schoolName") or get("school")) and (get("degreeName") or get("degree")):
+                complete_entries += 1
+            if not has_field and (get("fieldOfStudy") or get("field")):
+                has_field = True
+            if not has_dates and (get("startDate") or get("endDate") or get("timePeriod")):
+                has_dates = True
+        return complete_entries, has_field, has_dates
+    
+    def _score(self, profile: dict) -> dict:
+        educations = profile.get("_educations", EMPTY_LIST)
         reasons = []
         signals = {}
         
@@ -25,17 +44,7 @@ class EducationScorer(BaseSectionScorer):
         edu_count = len(educations)
         signals["education_count"] = edu_count
         
-        # Count complete entries
-        complete_entries = 0
-        for edu in educations:
-            # Check for essential fields
-            has_school = bool(edu.get("schoolName") or edu.get("school"))
-            has_degree = bool(edu.get("degreeName") or edu.get("degree"))
-            has_dates = bool(edu.get("startDate") or edu.get("timePeriod"))
-            
-            if has_school and has_degree:
-                complete_entries += 1
-        
+        complete_entries, has_field, has_dates = self._features(educations)
         signals["complete_entries"] = complete_entries
         
         # Scoring
@@ -50,23 +59,38 @@ class EducationScorer(BaseSectionScorer):
             reasons.append("Partial education entry")
         
         # Field of study bonus
-        has_field = any(
-            edu.get("fieldOfStudy") or edu.get("field") 
-            for edu in educations
-        )
         if has_field:
             score += 1.5
             reasons.append("Field of study specified")
         signals["has_field_of_study"] = has_field
         
         # Dates bonus
-        has_dates = any(
-            edu.get("startDate") or edu.get("endDate") or edu.get("timePeriod")
-            for edu in educations
-        )
         if has_dates:
             score += 1.5
             reasons.append("Education timeline provided")
         signals["has_dates"] = has_dates
         
         return self._result(score, reasons, signals)
+    
+    def score_profiles(self, profiles: list[dict]):
+        """Vectorized raw education scores for many profiles (requires NumPy)."""
+        np = require_numpy()
+        n = len(profiles)
+        has_entries = np.zeros(n, dtype=bool)
+        complete = np.zeros(n, dtype=np.int64)
+        has_field = np.zeros(n, dtype=bool)
+        has_dates = np.zeros(n, dtype=bool)
+        
+        for i, profile in enumerate(map(normalize_profile, profiles)):
+            educations = profile.get("_educations", EMPTY_LIST)
+            if educations:
+                has_entries[i] = True
+                complete[i], has_field[i], has_dates[i] = self._features(educations)
+        
+        scores = (
+            1.0
+            + np.select([complete >= 2, complete >= 1], [6.0, 4.0], 2.0)
+            + 1.5 * has_field
+            + 1.5 * has_dates
+        )
+        return np.round(np.clip(np.where(has_entries, scores, 2.0), 0.0, 10.0), 1)
@@ -6,7 +6,13 @@ This is typically the highest-weighted section for recruiters.
 """
 
 from app.scoring.sections.base_sections import BaseSectionScorer
-from app.scoring.helpers import count_metrics, count_action_verbs, has_keywords, is_standard_title
+from app.scoring.normalize import EMPTY_LIST
+from app.scoring.helpers import DescriptionAnalysis, analyze_description_block, is_standard_title
+from app.scoring.keyword_index import KeywordIndex
+
+
+# Analysis of a section whose descriptions are all blank
+_EMPTY_ANALYSIS = DescriptionAnalysis(metrics_count=0, sentence_count=0, action_count=0, action_ratio=0.0)
 
 
 class ExperienceScorer(BaseSectionScorer):
@@ -15,20 +21,22 @@ class ExperienceScorer(BaseSectionScorer):
     key = "experience"
     display_name = "Experience Score"
     
-    TECH_TOOLS = [
+    TECH_TOOLS = frozenset({
         'python', 'java', 'react', 'aws', 'docker', 'kubernetes', 'sql',
         'node', 'typescript', 'javascript', 'mongodb', 'redis', 'graphql',
         'git', 'terraform', 'jenkins', 'spark', 'kafka', 'postgresql'
-    ]
+    })
     
-    IMPACT_KEYWORDS = [
+    IMPACT_KEYWORDS = frozenset({
         'revenue', 'growth', 'scale', 'led', 'managed', 'built',
         'launched', 'optimized', 'reduced', 'increased', 'improved',
         'saved', 'generated', 'achieved', 'delivered'
-    ]
+    })
     
-    def score(self, profile: dict) -> dict:
-        positions = profile.get("positions", []) or profile.get("experience", []) or []
+    _KEYWORDS = KeywordIndex({"tech_tools": TECH_TOOLS})
+    
+    def _score(self, profile: dict) -> dict:
+        positions = profile.get("_positions", EMPTY_LIST)
         reasons = []
         signals = {}
         
@@ -58,7 +66,7 @@ class ExperienceScorer(BaseSectionScorer):
             reasons.append(f"Some experience ({pos_count} roles)")
         
         # Aggregate all descriptions
-        all_descriptions = ""
+        description_parts = []
         positions_with_desc = 0
         for exp in positions[:5]:  # Analyze first 5 (companies)
             nested_positions = exp.get("positions", [])
@@ -67,12 +75,13 @@ class ExperienceScorer(BaseSectionScorer):
                     desc = pos.get("description", "") or ""
                     if len(desc) > 20:
                         positions_with_desc += 1
-                    all_descriptions += " " + desc
+                    description_parts.append(desc)
             else:
                 desc = exp.get("description", "") or ""
                 if len(desc) > 20:
                     positions_with_desc += 1
-                all_descriptions += " " + desc
+                description_parts.append(desc)
+        all_descriptions = " ".join(description_parts)
         
         signals["positions_with_description"] = positions_with_desc
         
@@ -86,8 +95,13 @@ class ExperienceScorer(BaseSectionScorer):
         else:
             reasons.append("No descriptions in experience entries")
         
+        # Metrics and action verbs, analyzed together (memoized per text);
+        # blank descriptions skip the regex and keyword passes entirely
+        has_text = bool(all_descriptions.strip())
+        analysis = analyze_description_block(all_descriptions) if has_text else _EMPTY_ANALYSIS
+        
         # Metrics in descriptions
-        metrics = count_metrics(all_descriptions)
+        metrics = analysis.metrics_count
         signals["metrics_count"] = metrics
         if metrics >= 5:
             score += 2.0
@@ -97,17 +111,16 @@ class ExperienceScorer(BaseSectionScorer):
             reasons.append("Some quantified results")
         
         # Action verbs
-        verb_analysis = count_action_verbs(all_descriptions)
-        signals["action_verb_ratio"] = verb_analysis["ratio"]
-        if verb_analysis["ratio"] >= 0.6:
+        signals["action_verb_ratio"] = analysis.action_ratio
+        if analysis.action_ratio >= 0.6:
             score += 1.5
             reasons.append("Excellent action verb usage")
-        elif verb_analysis["ratio"] >= 0.3:
+        elif analysis.action_ratio >= 0.3:
             score += 0.5
             reasons.append("Good action verb usage")
         
         # Tech tools mentioned
-        tools = has_keywords(all_descriptions, self.TECH_TOOLS)
+        tools = self._KEYWORDS.scan_categories(all_descriptions)["tech_tools"] if has_text else 0
         signals["tech_tools_count"] = tools
         if tools >= 3:
             score += 1.0
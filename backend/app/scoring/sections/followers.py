@@ -5,7 +5,8 @@ Maps follower count to 1-10 score using thresholds.
 """
 
 from app.scoring.sections.base_sections import BaseSectionScorer
-from app.scoring.helpers import map_count_to_score
+from app.scoring.helpers import lookup_count_score, lookup_count_scores, parse_count, require_numpy
+from app.scoring.normalize import normalize_profile
 
 
 class FollowersScorer(BaseSectionScorer):
@@ -25,14 +26,23 @@ class FollowersScorer(BaseSectionScorer):
         (5000, 9.0),
         (10000, 10.0),
     ]
+    _COUNTS = tuple(min_count for min_count, _ in THRESHOLDS)
+    _SCORES = tuple(score for _, score in THRESHOLDS)
     
-    def score(self, profile: dict) -> dict:
-        count = profile.get("followersCount", 0) or profile.get("followerCount", 0) or 0
+    @staticmethod
+    def _count(profile: dict) -> int:
+        """Follower count of a profile as an int."""
+        count = profile.get("_followers", 0)
         
-        if isinstance(count, str):
-            count = int(count.replace("+", "").replace(",", "").replace("K", "000")) if count else 0
+        # Exact type check: cheaper than isinstance for the common int case
+        if type(count) is not int:
+            count = parse_count(count) or 0
+        return count
+    
+    def _score(self, profile: dict) -> dict:
+        count = self._count(profile)
         
-        score = map_count_to_score(count, self.THRESHOLDS)
+        score = lookup_count_score(count, self._COUNTS, self._SCORES)
         
         reasons = []
         if count >= 5000:
@@ -45,3 +55,21 @@ class FollowersScorer(BaseSectionScorer):
             reasons.append(f"Building audience ({count} followers)")
         
         return self._result(score, reasons, {"count": count})
+    
+    def score_batch(self, counts):
+        """
+        Score many already-parsed follower counts in one vectorized pass.
+        
+        Requires NumPy. Returns only the raw scores (no reasons/signals).
+        """
+        return lookup_count_scores(counts, self._COUNTS, self._SCORES)
+    
+    def score_profiles(self, profiles: list[dict]):
+        """Vectorized raw follower scores for many profiles (requires NumPy)."""
+        np = require_numpy()
+        counts = np.fromiter(
+            (self._count(normalize_profile(profile)) for profile in profiles),
+            dtype=np.int64,
+            count=len(profiles),
+        )
+        return self.score_batch(counts)
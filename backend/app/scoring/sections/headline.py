@@ -5,7 +5,8 @@ Evaluates: length, role keywords, seniority keywords, quantified signals, clarit
 """
 
 from app.scoring.sections.base_sections import BaseSectionScorer
-from app.scoring.helpers import has_keywords, count_metrics
+from app.scoring.helpers import count_metrics
+from app.scoring.keyword_index import KeywordIndex
 
 
 class HeadlineScorer(BaseSectionScorer):
@@ -15,24 +16,31 @@ class HeadlineScorer(BaseSectionScorer):
     display_name = "Headline Score"
     
     # Keyword categories
-    ROLE_KEYWORDS = [
+    ROLE_KEYWORDS = frozenset({
         'engineer', 'developer', 'manager', 'analyst', 'designer',
         'founder', 'consultant', 'architect', 'lead', 'specialist',
         'scientist', 'director', 'head', 'vp', 'president', 'chief'
-    ]
+    })
     
-    SKILL_KEYWORDS = [
+    SKILL_KEYWORDS = frozenset({
         'python', 'java', 'react', 'aws', 'cloud', 'ai', 'ml',
         'data', 'product', 'ux', 'ui', 'agile', 'devops', 'sql',
         'node', 'kubernetes', 'docker', 'blockchain', 'saas'
-    ]
+    })
     
-    SENIORITY_KEYWORDS = [
+    SENIORITY_KEYWORDS = frozenset({
         'senior', 'staff', 'principal', 'lead', 'head', 'director',
         'vp', 'chief', 'founder', 'co-founder', 'cto', 'ceo', 'coo'
-    ]
+    })
     
-    def score(self, profile: dict) -> dict:
+    # One automaton for all three categories, built at class definition
+    _KEYWORDS = KeywordIndex({
+        "role": ROLE_KEYWORDS,
+        "skill": SKILL_KEYWORDS,
+        "seniority": SENIORITY_KEYWORDS,
+    })
+    
+    def _score(self, profile: dict) -> dict:
         headline = profile.get("headline", "") or ""
         reasons = []
         signals = {"length": len(headline)}
@@ -55,15 +63,17 @@ class HeadlineScorer(BaseSectionScorer):
         
         signals["length"] = length
         
+        keyword_counts = self._KEYWORDS.scan_categories(headline)
+        
         # Role keywords
-        role_matches = has_keywords(headline, self.ROLE_KEYWORDS)
+        role_matches = keyword_counts["role"]
         if role_matches >= 1:
             score += 2.0
             reasons.append(f"Contains role keyword(s)")
         signals["role_keywords"] = role_matches
         
         # Skill keywords
-        skill_matches = has_keywords(headline, self.SKILL_KEYWORDS)
+        skill_matches = keyword_counts["skill"]
         if skill_matches >= 2:
             score += 2.0
             reasons.append(f"Multiple skill keywords")
@@ -73,7 +83,7 @@ class HeadlineScorer(BaseSectionScorer):
         signals["skill_keywords"] = skill_matches
         
         # Seniority indicators
-        seniority_matches = has_keywords(headline, self.SENIORITY_KEYWORDS)
+        seniority_matches = keyword_counts["seniority"]
         if seniority_matches >= 1:
             score += 1.5
             reasons.append("Seniority level indicated")
@@ -87,7 +97,11 @@ class HeadlineScorer(BaseSectionScorer):
         signals["metrics_count"] = metrics
         
         # Clarity - no excessive punctuation or emojis
-        emoji_count = sum(1 for c in headline if ord(c) > 127)
+        # Non-ASCII code points, counted in C (ASCII-only headlines skip it)
+        if headline.isascii():
+            emoji_count = 0
+        else:
+            emoji_count = len(headline) - len(headline.encode("ascii", "ignore"))
         if emoji_count > 3:
             score -= 1.0
             reasons.append("Too many emojis/special chars")
@@ -5,6 +5,8 @@ Evaluates: count and recency.
 """
 
 from app.scoring.sections.base_sections import BaseSectionScorer
+from app.scoring.normalize import EMPTY_LIST, normalize_profile
+from app.scoring.helpers import require_numpy
 
 
 class LicensesCertsScorer(BaseSectionScorer):
@@ -13,8 +15,17 @@ class LicensesCertsScorer(BaseSectionScorer):
     key = "licenses_certs"
     display_name = "Licenses & Certifications Score"
     
-    def score(self, profile: dict) -> dict:
-        certs = profile.get("certifications", []) or profile.get("licenses", []) or []
+    @staticmethod
+    def _issuer_count(certs: list) -> int:
+        """Number of certifications naming an issuing authority."""
+        has_issuer = 0
+        for cert in certs:
+            if isinstance(cert, dict) and cert.get("authority"):
+                has_issuer += 1
+        return has_issuer
+    
+    def _score(self, profile: dict) -> dict:
+        certs = profile.get("_certifications", EMPTY_LIST)
         reasons = []
         signals = {}
         
@@ -40,10 +51,7 @@ class LicensesCertsScorer(BaseSectionScorer):
             reasons.append("Has certification")
         
         # Check for issuing organizations (adds credibility)
-        has_issuer = 0
-        for cert in certs:
-            if isinstance(cert, dict) and cert.get("authority"):
-                has_issuer += 1
+        has_issuer = self._issuer_count(certs)
         
         signals["certs_with_issuer"] = has_issuer
         if has_issuer >= 2:
@@ -54,3 +62,26 @@ class LicensesCertsScorer(BaseSectionScorer):
             reasons.append("Certification from recognized issuer")
         
         return self._result(score, reasons, signals)
+    
+    def score_profiles(self, profiles: list[dict]):
+        """Vectorized raw certification scores for many profiles (requires NumPy)."""
+        np = require_numpy()
+        n = len(profiles)
+        cert_count = np.zeros(n, dtype=np.int64)
+        issuers = np.zeros(n, dtype=np.int64)
+        
+        for i, profile in enumerate(map(normalize_profile, profiles)):
+            certs = profile.get("_certifications", EMPTY_LIST)
+            cert_count[i] = len(certs)
+            issuers[i] = self._issuer_count(certs)
+        
+        scores = (
+            1.0
+            + np.select(
+                [cert_count >= 5, cert_count >= 3, cert_count >= 2],
+                [5.0, 4.0, 3.0],
+                2.0,
+            )
+            + np.select([issuers >= 2, issuers >= 1], [2.5, 1.5], 0.0)
+        )
+        return np.round(np.clip(np.where(cert_count > 0, scores, 0.0), 0.0, 10.0), 1)
@@ -19,7 +19,7 @@ class PremiumScorer(BaseSectionScorer):
     PREMIUM_SCORE = 10.0
     NOT_PREMIUM_SCORE = 0.0
     
-    def score(self, profile: dict) -> dict:
+    def _score(self, profile: dict) -> dict:
         is_premium = is_true(profile.get("premium", False))
         
         if is_premium:
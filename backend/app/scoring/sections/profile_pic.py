@@ -5,14 +5,53 @@ AI-powered comprehensive profile picture analysis using OpenAI Vision API.
 Evaluates: professionalism, face visibility, lighting, background, image quality.
 """
 
+import asyncio
 import base64
-import httpx
+import orjson
 from typing import Optional
 
+from app.scoring.normalize import normalize_profile
 from app.scoring.sections.base_sections import BaseSectionScorer
+from app.scoring.vision import AnalysisCache, fetch_image_data_url, get_http_client, strip_code_fence
 from app.config import settings
 
 
+# Analyses of already-seen image URLs (re-scoring the same profile is free)
+_ANALYSIS_CACHE = AnalysisCache()
+
+_INTRO_PROMPT = "You are an expert at analyzing LinkedIn profile pictures for professional quality."
+
+_CRITERIA_PROMPT = """Rate each criterion on a scale of 0-10:
+1. face_visible (0-10): Is the face clearly visible, centered, and takes up appropriate space?
+2. professional (0-10): Does the person look professional? (appropriate attire, grooming, formal/semi-formal)
+3. lighting (0-10): Is the lighting good? (well-lit, not too dark/bright, no harsh shadows)
+4. background (0-10): Is the background clean and non-distracting? (solid color, blurred, office setting)
+5. image_quality (0-10): Is the image high quality? (good resolution, not blurry, not pixelated)
+6. approachable (0-10): Does the person appear friendly and approachable? (natural smile, open expression)"""
+
+_SYSTEM_PROMPT = f"""{_INTRO_PROMPT}
+
+Analyze the image. {_CRITERIA_PROMPT}
+
+Return ONLY a JSON object with these keys and integer scores, nothing else:
+{{"face_visible": X, "professional": X, "lighting": X, "background": X, "image_quality": X, "approachable": X, "summary": "one-line assessment"}}"""
+
+_BATCH_SYSTEM_PROMPT = f"""{_INTRO_PROMPT}
+
+You will receive several numbered pictures. Analyze each one separately. {_CRITERIA_PROMPT}
+
+Return ONLY a JSON array with one object per picture, in order, nothing else:
+[{{"index": 1, "face_visible": X, "professional": X, "lighting": X, "background": X, "image_quality": X, "approachable": X, "summary": "one-line assessment"}}, ...]"""
+
+# Static parts of the Vision requests, built once
+_SYSTEM_MSG = {"role": "system", "content": _SYSTEM_PROMPT}
+_BATCH_SYSTEM_MSG = {"role": "system", "content": _BATCH_SYSTEM_PROMPT}
+_USER_TEXT = {
+    "type": "text",
+    "text": "Analyze this LinkedIn profile picture for professional quality.",
+}
+
+
 class ProfilePicScorer(BaseSectionScorer):
     """Score profile picture using AI vision analysis (1-10)."""
     
@@ -28,15 +67,28 @@ class ProfilePicScorer(BaseSectionScorer):
         "image_quality": 1.5,      # High resolution, not blurry
         "approachable": 1.0,       # Friendly, approachable expression
     }
+    _CRITERIA_ITEMS = tuple(CRITERIA.items())
+    _TOTAL_WEIGHT = sum(CRITERIA.values())
     
     NO_PICTURE_SCORE = 0.0
     
+    # Pictures sent per Vision request by analyze_batch
+    BATCH_SIZE = 10
+    
     async def analyze_image_with_ai(self, image_url: str) -> dict:
         """
         Analyze profile picture using OpenAI Vision API.
         
         Returns dict with scores for each criterion (0-10 scale).
         """
+        cached = _ANALYSIS_CACHE.get(image_url)
+        if cached is not None:
+            return cached
+        
+        # AI disabled (no API key): skip the doomed request, use the fallback score
+        if not settings.openai_api_key:
+            return None
+        
         try:
             # Prepare the vision API request
             headers = {
@@ -47,32 +99,15 @@ class ProfilePicScorer(BaseSectionScorer):
             payload = {
                 "model": "gpt-4o",
                 "messages": [
-                    {
-                        "role": "system",
-                        "content": """You are an expert at analyzing LinkedIn profile pictures for professional quality.
-                        
-Analyze the image and rate each criterion on a scale of 0-10:
-1. face_visible (0-10): Is the face clearly visible, centered, and takes up appropriate space?
-2. professional (0-10): Does the person look professional? (appropriate attire, grooming, formal/semi-formal)
-3. lighting (0-10): Is the lighting good? (well-lit, not too dark/bright, no harsh shadows)
-4. background (0-10): Is the background clean and non-distracting? (solid color, blurred, office setting)
-5. image_quality (0-10): Is the image high quality? (good resolution, not blurry, not pixelated)
-6. approachable (0-10): Does the person appear friendly and approachable? (natural smile, open expression)
-
-Return ONLY a JSON object with these keys and integer scores, nothing else:
-{"face_visible": X, "professional": X, "lighting": X, "background": X, "image_quality": X, "approachable": X, "summary": "one-line assessment"}"""
-                    },
+                    _SYSTEM_MSG,
                     {
                         "role": "user",
                         "content": [
-                            {
-                                "type": "text",
-                                "text": "Analyze this LinkedIn profile picture for professional quality."
-                            },
+                            _USER_TEXT,
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": image_url,
+                                    "url": await fetch_image_data_url(image_url),
                                     "detail": "low"  # Use low detail to save tokens
                                 }
                             }
@@ -83,45 +118,106 @@ Return ONLY a JSON object with these keys and integer scores, nothing else:
                 "temperature": 0.3
             }
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers=headers,
-                    json=payload
-                )
-                
-                if response.status_code != 200:
-                    return None
-                
-                result = response.json()
-                content = result["choices"][0]["message"]["content"]
-                
-                # Parse the JSON response
-                import json
-                # Clean up the response (remove markdown code blocks if present)
-                content = content.strip()
-                if content.startswith("```"):
-                    content = content.split("```")[1]
-                    if content.startswith("json"):
-                        content = content[4:]
-                content = content.strip()
-                
-                analysis = json.loads(content)
-                return analysis
-                
+            response = await get_http_client().post(
+                "https://api.openai.com/v1/chat/completions",
+                headers=headers,
+                content=orjson.dumps(payload)
+            )
+            
+            if response.status_code != 200:
+                return None
+            
+            result = orjson.loads(response.content)
+            content = result["choices"][0]["message"]["content"]
+            
+            # Parse the JSON response (remove markdown code blocks if present)
+            analysis = orjson.loads(strip_code_fence(content))
+            _ANALYSIS_CACHE.set(image_url, analysis)
+            return analysis
+            
         except Exception as e:
             # Log the error but don't fail - return None to trigger fallback
             print(f"Profile picture AI analysis failed: {e}")
             return None
     
-    def score(self, profile: dict) -> dict:
+    async def analyze_batch(self, image_urls: list[str]) -> list[Optional[dict]]:
+        """
+        Analyze many profile pictures with one Vision request per BATCH_SIZE images.
+        
+        Results land in the analysis cache, so a later score_async for the same
+        URL makes no API call. Returns one analysis (None on failure) per URL.
+        """
+        pending = list(dict.fromkeys(
+            url for url in image_urls if url and _ANALYSIS_CACHE.get(url) is None
+        ))
+        chunks = [
+            pending[start:start + self.BATCH_SIZE]
+            for start in range(0, len(pending), self.BATCH_SIZE)
+        ]
+        await asyncio.gather(*(self._analyze_chunk(chunk) for chunk in chunks))
+        return [_ANALYSIS_CACHE.get(url) if url else None for url in image_urls]
+    
+    async def _analyze_chunk(self, image_urls: list[str]) -> None:
+        """Send one Vision request for several pictures and cache each analysis."""
+        if not settings.openai_api_key:
+            return
+        
+        data_urls = await asyncio.gather(*map(fetch_image_data_url, image_urls))
+        content = []
+        for index, data_url in enumerate(data_urls, 1):
+            content.append({"type": "text", "text": f"Analyze picture #{index}"})
+            content.append({
+                "type": "image_url",
+                "image_url": {"url": data_url, "detail": "low"}
+            })
+        
+        try:
+            headers = {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {settings.openai_api_key}"
+            }
+            
+            payload = {
+                "model": "gpt-4o",
+                "messages": [
+                    _BATCH_SYSTEM_MSG,
+                    {"role": "user", "content": content}
+                ],
+                "max_tokens": 300 * len(image_urls),
+                "temperature": 0.3
+            }
+            
+            response = await get_http_client().post(
+                "https://api.openai.com/v1/chat/completions",
+                headers=headers,
+                content=orjson.dumps(payload),
+                timeout=60.0  # several images per request
+            )
+            
+            if response.status_code != 200:
+                return
+            
+            result = orjson.loads(response.content)
+            analyses = orjson.loads(strip_code_fence(result["choices"][0]["message"]["content"]))
+            
+            # Dispatch each analysis back to its URL by index (fall back to position)
+            for position, analysis in enumerate(analyses):
+                index = analysis.pop("index", position + 1) - 1
+                if 0 <= index < len(image_urls):
+                    _ANALYSIS_CACHE.set(image_urls[index], analysis)
+                    
+        except Exception as e:
+            # Uncached URLs fall back to presence-based scoring
+            print(f"Profile picture batch AI analysis failed: {e}")
+    
+    def _score(self, profile: dict) -> dict:
         """
         Score profile picture.
         
         For synchronous context, uses simple presence check.
         For async analysis, use score_async.
         """
-        pic_url = profile.get("pictureUrl") or profile.get("profilePictureUrl") or ""
+        pic_url = profile.get("_picture_url", "")
         
         if not pic_url:
             return self._result(
@@ -142,7 +238,8 @@ Return ONLY a JSON object with these keys and integer scores, nothing else:
         """
         Async version that performs full AI vision analysis.
         """
-        pic_url = profile.get("pictureUrl") or profile.get("profilePictureUrl") or ""
+        profile = normalize_profile(profile)
+        pic_url = profile.get("_picture_url", "")
         
         if not pic_url:
             return self._result(
@@ -163,18 +260,19 @@ Return ONLY a JSON object with these keys and integer scores, nothing else:
             )
         
         # Calculate weighted score
-        total_weight = sum(self.CRITERIA.values())
-        weighted_score = 0.0
         reasons = []
         
-        criteria_scores = {}
-        for criterion, weight in self.CRITERIA.items():
-            score = analysis.get(criterion, 5)  # Default to 5 if missing
-            criteria_scores[criterion] = score
-            weighted_score += (score / 10.0) * weight
+        criteria_scores = {
+            criterion: analysis.get(criterion, 5)  # Default to 5 if missing
+            for criterion in self.CRITERIA
+        }
+        weighted_score = sum(
+            (criteria_scores[criterion] / 10.0) * weight
+            for criterion, weight in self._CRITERIA_ITEMS
+        )
         
         # Normalize to 1-10 scale
-        final_score = (weighted_score / total_weight) * 10.0
+        final_score = (weighted_score / self._TOTAL_WEIGHT) * 10.0
         final_score = max(0.0, min(10.0, round(final_score, 1)))
         
         # Build detailed reasons
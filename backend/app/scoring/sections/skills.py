@@ -5,7 +5,7 @@ Evaluates: count, relevance, endorsements.
 """
 
 from app.scoring.sections.base_sections import BaseSectionScorer
-from app.scoring.helpers import has_keywords
+from app.scoring.keyword_index import KeywordIndex
 
 
 class SkillsScorer(BaseSectionScorer):
@@ -14,14 +14,16 @@ class SkillsScorer(BaseSectionScorer):
     key = "skills"
     display_name = "Skills Score"
     
-    HIGH_VALUE_SKILLS = [
+    HIGH_VALUE_SKILLS = frozenset({
         'python', 'java', 'javascript', 'react', 'sql', 'aws',
         'data analysis', 'machine learning', 'project management',
         'leadership', 'communication', 'node.js', 'typescript',
         'docker', 'kubernetes', 'system design', 'product management'
-    ]
+    })
     
-    def score(self, profile: dict) -> dict:
+    _KEYWORDS = KeywordIndex({"high_value": HIGH_VALUE_SKILLS})
+    
+    def _score(self, profile: dict) -> dict:
         skills = profile.get("skills", []) or []
         import json
         if isinstance(skills, str):
@@ -65,7 +67,7 @@ class SkillsScorer(BaseSectionScorer):
         skills_text = " ".join(skill_names)
         
         # High-value skill alignment
-        valuable = has_keywords(skills_text, self.HIGH_VALUE_SKILLS)
+        valuable = self._KEYWORDS.scan_categories(skills_text)["high_value"]
         signals["high_value_skills"] = valuable
         if valuable >= 5:
             score += 3.0
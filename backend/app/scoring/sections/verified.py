@@ -19,7 +19,7 @@ class VerifiedScorer(BaseSectionScorer):
     VERIFIED_SCORE = 10.0
     NOT_VERIFIED_SCORE = 0.0
     
-    def score(self, profile: dict) -> dict:
+    def _score(self, profile: dict) -> dict:
         is_verified = is_true(profile.get("isVerified", False))
         
         if is_verified:
@@ -0,0 +1,115 @@
+"""
+Vision Analysis Helpers
+
+Shared pieces for the AI-powered picture scorers (profile and cover picture).
+"""
+
+import asyncio
+import base64
+import io
+import re
+import time
+from typing import Any, Optional
+
+import httpx
+
+
+# Markdown code fence (optionally tagged json) wrapped around the model's JSON
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.S)
+
+
+# Long-lived client so bulk scoring reuses TLS connections to api.openai.com
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared keep-alive HTTP/2 client for the Vision API."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (called on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _shrink_to_jpeg(image_bytes: bytes, max_side: int) -> bytes:
+    """Downscale an image to fit max_side x max_side and re-encode as JPEG."""
+    from PIL import Image
+    
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        image = image.convert("RGB")
+        image.thumbnail((max_side, max_side))
+        out = io.BytesIO()
+        image.save(out, format="JPEG", quality=75)
+    return out.getvalue()
+
+
+async def fetch_image_data_url(image_url: str, max_side: int = 512) -> str:
+    """
+    Download an image and return it as a small inline JPEG data URL.
+    
+    Sending ~30KB inline saves OpenAI a fetch of the full-size original from
+    the LinkedIn CDN. Falls back to the original URL when Pillow is not
+    installed (pip install Pillow) or the download/decode fails.
+    """
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        return image_url
+    
+    try:
+        response = await get_http_client().get(image_url, follow_redirects=True)
+        response.raise_for_status()
+        jpeg = await asyncio.to_thread(_shrink_to_jpeg, response.content, max_side)
+    except Exception as e:
+        print(f"Image prefetch failed, sending URL instead: {e}")
+        return image_url
+    return "data:image/jpeg;base64," + base64.b64encode(jpeg).decode("ascii")
+
+
+def strip_code_fence(content: str) -> str:
+    """Return the JSON text of a Vision reply, without any markdown fence."""
+    fenced = _FENCE_RE.match(content)
+    return fenced.group(1) if fenced else content.strip()
+
+
+class AnalysisCache:
+    """
+    In-memory cache of OpenAI Vision analyses keyed by image URL.
+
+    Entries expire after ttl_seconds; once maxsize is reached the oldest
+    entry is evicted. Failed analyses are never stored.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl_seconds: float = 7 * 24 * 3600):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[float, dict[str, Any]]] = {}
+
+    def get(self, image_url: str) -> Optional[dict[str, Any]]:
+        """Return the cached analysis for a URL, or None if missing/expired."""
+        entry = self._entries.get(image_url)
+        if entry is None:
+            return None
+        expires_at, analysis = entry
+        if expires_at < time.monotonic():
+            del self._entries[image_url]
+            return None
+        return analysis
+
+    def set(self, image_url: str, analysis: dict[str, Any]) -> None:
+        """Store an analysis, evicting the oldest entry when full."""
+        self._entries.pop(image_url, None)
+        if len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[image_url] = (time.monotonic() + self.ttl_seconds, analysis)
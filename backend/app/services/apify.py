@@ -5,13 +5,86 @@ Handles LinkedIn profile scraping via Apify actors.
 """
 
 import asyncio
+import base64
+import hmac
+import json
+import random
+import time
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Awaitable, Optional, TypeVar
+from urllib.parse import quote
 
 import httpx
 
 from app.config import settings
 from app.services.logger import log_info, log_error, log_debug, log_warning
+from app.utils.validators import normalize_linkedin_url
+
+
+# Run-finished events Apify reports to our webhook endpoint
+_WEBHOOK_EVENT_TYPES = (
+    "ACTOR.RUN.SUCCEEDED",
+    "ACTOR.RUN.FAILED",
+    "ACTOR.RUN.ABORTED",
+    "ACTOR.RUN.TIMED_OUT",
+)
+APIFY_WEBHOOK_SECRET_HEADER = "X-Apify-Webhook-Secret"
+
+_TERMINAL_STATUSES = frozenset({"SUCCEEDED", "FAILED", "ABORTED", "TIMED-OUT"})
+
+# Client errors worth retrying (timeout, rate limit); other 4xx fail fast
+_RETRYABLE_CLIENT_ERRORS = frozenset({408, 429})
+
+# Client of the current run_sync() call, used instead of the pooled one
+_scoped_client: ContextVar[Optional[httpx.AsyncClient]] = ContextVar("apify_scoped_client", default=None)
+
+T = TypeVar("T")
+
+
+def _retry_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """Exponential backoff with up to 50% jitter for retry number `attempt`."""
+    return min(base * 2 ** attempt, cap) * (1 + random.uniform(0, 0.5))
+
+
+class LinkedInCache:
+    """
+    In-memory TTL cache of scraped profiles keyed by normalized profile URL.
+    
+    "https://in.linkedin.com/in/Jane-Doe/?trk=x" and
+    "linkedin.com/in/jane-doe" share one entry. Only successful scrapes
+    are stored; once maxsize is reached the oldest entry is evicted.
+    """
+    
+    def __init__(self, maxsize: int = 1_000, ttl_seconds: float = 24 * 3600):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[float, dict[str, Any]]] = {}
+    
+    @staticmethod
+    def normalize_url(linkedin_url: str) -> str:
+        """Cache key for a profile URL (profile slugs are case-insensitive)."""
+        return (normalize_linkedin_url(linkedin_url) or linkedin_url.strip()).lower()
+    
+    def get(self, linkedin_url: str) -> Optional[dict[str, Any]]:
+        """Return the cached profile for a URL, or None if missing/expired."""
+        key = self.normalize_url(linkedin_url)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, profile = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        return profile
+    
+    def set(self, linkedin_url: str, profile: dict[str, Any]) -> None:
+        """Store a scraped profile, evicting the oldest entry when full."""
+        key = self.normalize_url(linkedin_url)
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, profile)
 
 
 class ApifyService:
@@ -22,17 +95,146 @@ class ApifyService:
     def __init__(self):
         self.api_token = settings.apify_api_token
         self.actor_id = settings.apify_actor_id
+        self._headers = {
+            "Authorization": f"Bearer {self.api_token}",
+            "Content-Type": "application/json",
+        }
+        self._start_url = f"{self.BASE_URL}/acts/{quote(self.actor_id, safe='')}/runs"
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.cache = LinkedInCache()
+        
+        # Webhook completion (optional): run_id -> waiting loop and event
+        # Notifications are only trusted with a shared secret, so a base URL
+        # without one leaves webhooks off
+        base_url = settings.apify_webhook_base_url.rstrip("/")
+        if base_url and not settings.apify_webhook_secret:
+            log_error("apify", "APIFY_WEBHOOK_BASE_URL is set without APIFY_WEBHOOK_SECRET; webhooks disabled")
+            base_url = ""
+        self.webhook_url = f"{base_url}/api/apify/webhook" if base_url else ""
+        self._pending_runs: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Event]] = {}
+        self._webhook_results: dict[str, dict[str, Any]] = {}
         log_debug("apify", f"Apify service initialized", {
             "actor_id": self.actor_id,
             "has_token": bool(self.api_token),
+            "webhooks": bool(self.webhook_url),
         })
     
-    @property
-    def headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self.api_token}",
-            "Content-Type": "application/json",
+    def _new_client(self) -> httpx.AsyncClient:
+        """Keep-alive HTTP/2 client for the Apify API."""
+        return httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            headers=self._headers,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=30.0,
+            ),
+            http2=True,
+        )
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the HTTP client for the running call.
+        
+        Inside run_sync() that is the call's own client. Otherwise it is the
+        pooled keep-alive client of the serving loop; connections cannot
+        outlive their loop, so if the loop changes the old client is closed
+        (on its loop, if still running) and a new one created.
+        """
+        scoped = _scoped_client.get()
+        if scoped is not None:
+            return scoped
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            old_client, old_loop = self._client, self._client_loop
+            if old_client is not None and old_loop is not None and old_loop.is_running():
+                asyncio.run_coroutine_threadsafe(old_client.aclose(), old_loop)
+            self._client = self._new_client()
+            self._client_loop = loop
+        return self._client
+    
+    def run_sync(self, coro: Awaitable[T]) -> T:
+        """
+        Run a service coroutine from sync code (graph nodes) on a new loop.
+        
+        The call gets its own client, closed before the loop ends, so
+        one-shot loops neither leak clients nor replace the pooled one.
+        """
+        async def scoped() -> T:
+            client = self._new_client()
+            token = _scoped_client.set(client)
+            try:
+                return await coro
+            finally:
+                _scoped_client.reset(token)
+                await client.aclose()
+        
+        return asyncio.run(scoped())
+    
+    async def aclose(self) -> None:
+        """Close the pooled client if it belongs to the running loop."""
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+    
+    async def __aenter__(self) -> "ApifyService":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    def _webhooks_param(self) -> str:
+        """Base64 JSON for the run endpoint's ad-hoc `webhooks` parameter."""
+        webhook = {
+            "eventTypes": list(_WEBHOOK_EVENT_TYPES),
+            "requestUrl": self.webhook_url,
+            "headersTemplate": json.dumps({APIFY_WEBHOOK_SECRET_HEADER: settings.apify_webhook_secret}),
         }
+        return base64.b64encode(json.dumps([webhook]).encode()).decode()
+    
+    def verify_webhook_secret(self, received: str) -> bool:
+        """
+        Check the shared secret sent back in the webhook headers.
+        
+        Always False when webhooks are off or no secret is configured.
+        """
+        expected = settings.apify_webhook_secret
+        if not self.webhook_url or not expected:
+            return False
+        return hmac.compare_digest(received.encode(), expected.encode())
+    
+    def handle_webhook(self, payload: dict[str, Any]) -> None:
+        """
+        Record a run-finished notification and wake the poller waiting on it.
+        
+        Safe to call from another thread/loop than the waiting poller.
+        """
+        if not self.webhook_url:
+            return
+        resource = payload.get("resource") or {}
+        run_id = resource.get("id")
+        if not run_id:
+            return
+        
+        self._webhook_results[run_id] = {
+            "run_id": run_id,
+            "status": resource.get("status"),
+            "finished_at": resource.get("finishedAt"),
+            "default_dataset_id": resource.get("defaultDatasetId"),
+        }
+        # Runs nobody waits for (e.g. already timed out) must not pile up
+        if len(self._webhook_results) > 1_000:
+            del self._webhook_results[next(iter(self._webhook_results))]
+        
+        log_info("apify", f"Webhook: run finished with status {resource.get('status')}", {"run_id": run_id})
+        
+        waiter = self._pending_runs.get(run_id)
+        if waiter is not None:
+            loop, event = waiter
+            loop.call_soon_threadsafe(event.set)
     
     async def start_scrape(self, linkedin_url: str) -> dict[str, Any]:
         """
@@ -41,9 +243,7 @@ class ApifyService:
         Returns:
             dict with 'run_id' and 'status'
         """
-        from urllib.parse import quote
-        encoded_actor_id = quote(self.actor_id, safe='')
-        url = f"{self.BASE_URL}/acts/{encoded_actor_id}/runs"
+        url = self._start_url
         
         # Different actors have different input schemas
         # supreme_coder~linkedin-profile-scraper uses 'urls' with object format
@@ -63,55 +263,51 @@ class ApifyService:
             "url": url,
         })
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    url,
-                    headers=self.headers,
-                    json=payload,
-                    timeout=30.0,
-                )
-                
-                # Log response details for debugging
-                log_debug("apify", f"Apify API response", {
+        try:
+            params = {"webhooks": self._webhooks_param()} if self.webhook_url else None
+            response = await self._get_client().post(url, json=payload, params=params)
+            
+            # Log response details for debugging
+            log_debug("apify", f"Apify API response", {
+                "status_code": response.status_code,
+                "url": url,
+            })
+            
+            if response.status_code != 201:
+                error_text = response.text
+                log_error("apify", f"Apify API error: {response.status_code}", {
                     "status_code": response.status_code,
-                    "url": url,
+                    "response": error_text[:500],
                 })
-                
-                if response.status_code != 201:
-                    error_text = response.text
-                    log_error("apify", f"Apify API error: {response.status_code}", {
-                        "status_code": response.status_code,
-                        "response": error_text[:500],
-                    })
-                    raise Exception(f"Apify API error: {response.status_code} - {error_text}")
-                
+                # HTTPStatusError for 4xx/5xx so callers can classify the failure
                 response.raise_for_status()
-                data = response.json()
-                
-                run_id = data["data"]["id"]
-                status = data["data"]["status"]
-                
-                log_info("apify", f"Scrape started successfully", {
-                    "run_id": run_id,
-                    "status": status,
-                })
-                
-                return {
-                    "run_id": run_id,
-                    "status": status,
-                    "started_at": data["data"]["startedAt"],
-                }
-                
-            except httpx.HTTPStatusError as e:
-                log_error("apify", f"HTTP error starting scrape: {str(e)}", {
-                    "status_code": e.response.status_code if e.response else None,
-                    "response": e.response.text[:500] if e.response else None,
-                })
-                raise
-            except Exception as e:
-                log_error("apify", f"Error starting scrape: {str(e)}")
-                raise
+                raise Exception(f"Apify API error: {response.status_code} - {error_text}")
+            
+            data = response.json()
+            
+            run_id = data["data"]["id"]
+            status = data["data"]["status"]
+            
+            log_info("apify", f"Scrape started successfully", {
+                "run_id": run_id,
+                "status": status,
+            })
+            
+            return {
+                "run_id": run_id,
+                "status": status,
+                "started_at": data["data"]["startedAt"],
+            }
+            
+        except httpx.HTTPStatusError as e:
+            log_error("apify", f"HTTP error starting scrape: {str(e)}", {
+                "status_code": e.response.status_code if e.response else None,
+                "response": e.response.text[:500] if e.response else None,
+            })
+            raise
+        except Exception as e:
+            log_error("apify", f"Error starting scrape: {str(e)}")
+            raise
     
     async def get_run_status(self, run_id: str) -> dict[str, Any]:
         """
@@ -122,102 +318,158 @@ class ApifyService:
         """
         url = f"{self.BASE_URL}/actor-runs/{run_id}"
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers=self.headers,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            status = data["data"]["status"]
-            log_debug("apify", f"Run status: {status}", {"run_id": run_id})
-            
-            return {
-                "run_id": run_id,
-                "status": status,
-                "finished_at": data["data"].get("finishedAt"),
-                "default_dataset_id": data["data"].get("defaultDatasetId"),
-            }
+        response = await self._get_client().get(url)
+        response.raise_for_status()
+        data = response.json()
+        
+        status = data["data"]["status"]
+        log_debug("apify", f"Run status: {status}", {"run_id": run_id})
+        
+        return {
+            "run_id": run_id,
+            "status": status,
+            "finished_at": data["data"].get("finishedAt"),
+            "default_dataset_id": data["data"].get("defaultDatasetId"),
+        }
     
-    async def get_dataset_items(self, dataset_id: str) -> list[dict[str, Any]]:
+    async def get_dataset_items(
+        self,
+        dataset_id: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
         """
         Get items from an Apify dataset.
         
+        Args:
+            dataset_id: Apify dataset ID
+            limit: Maximum number of items to transfer (None = all)
+            offset: Number of items to skip
+        
         Returns:
             List of scraped profile data
         """
         url = f"{self.BASE_URL}/datasets/{dataset_id}/items"
         
-        log_debug("apify", f"Fetching dataset items", {"dataset_id": dataset_id})
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers=self.headers,
-                params={"format": "json"},
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            items = response.json()
-            
-            log_info("apify", f"Retrieved {len(items)} items from dataset", {
-                "dataset_id": dataset_id,
-                "item_count": len(items),
-            })
-            
-            return items
+        # clean=1 drops empty items and hidden (#-prefixed) fields server-side
+        params: dict[str, Any] = {"format": "json", "clean": "1"}
+        if limit:
+            params["limit"] = limit
+        if offset:
+            params["offset"] = offset
+        
+        log_debug("apify", f"Fetching dataset items", {"dataset_id": dataset_id, "limit": limit})
+        
+        response = await self._get_client().get(url, params=params)
+        response.raise_for_status()
+        items = response.json()
+        
+        log_info("apify", f"Retrieved {len(items)} items from dataset", {
+            "dataset_id": dataset_id,
+            "item_count": len(items),
+        })
+        
+        return items
     
     async def poll_until_complete(
         self,
         run_id: str,
-        max_attempts: int = 30,
-        poll_interval: float = 10.0,
+        timeout: float = 300.0,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
     ) -> dict[str, Any]:
         """
-        Poll an Apify run until it completes.
+        Poll an Apify run until it completes or the timeout budget runs out.
+        
+        Polls densely at first (fast runs are noticed within a second or two),
+        then doubles the gap with jitter up to max_interval, so long runs
+        cost only a handful of status requests.
+        
+        With webhooks configured, the wait ends as soon as Apify reports the
+        run finished; status is then only polled every max_interval as a
+        safety net for lost notifications.
         
         Returns:
             Final run status dict
         """
         log_info("apify", f"Polling run until complete", {
             "run_id": run_id,
-            "max_attempts": max_attempts,
+            "timeout": timeout,
         })
         
-        for attempt in range(max_attempts):
-            status = await self.get_run_status(run_id)
-            
-            if status["status"] in ("SUCCEEDED", "FAILED", "ABORTED", "TIMED-OUT"):
-                log_info("apify", f"Run completed with status: {status['status']}", {
-                    "run_id": run_id,
-                    "attempts": attempt + 1,
-                })
-                return status
-            
-            await asyncio.sleep(poll_interval)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = initial_interval
+        attempt = 0
         
-        log_error("apify", f"Polling timeout exceeded", {"run_id": run_id})
+        event = None
+        if self.webhook_url:
+            event = asyncio.Event()
+            self._pending_runs[run_id] = (loop, event)
+        
+        try:
+            while True:
+                attempt += 1
+                status = None
+                if event is not None:
+                    status = self._webhook_results.pop(run_id, None)
+                if status is None:
+                    status = await self.get_run_status(run_id)
+                
+                if status["status"] in _TERMINAL_STATUSES:
+                    log_info("apify", f"Run completed with status: {status['status']}", {
+                        "run_id": run_id,
+                        "attempts": attempt,
+                    })
+                    return status
+                
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                
+                if event is not None:
+                    try:
+                        await asyncio.wait_for(event.wait(), min(max_interval, remaining))
+                    except asyncio.TimeoutError:
+                        pass
+                    event.clear()
+                else:
+                    await asyncio.sleep(min(delay, max_interval, remaining))
+                    delay = min(delay * 2, max_interval) * (1 + random.uniform(0, 0.5))
+        finally:
+            self._pending_runs.pop(run_id, None)
+        
+        log_error("apify", f"Polling timeout exceeded", {"run_id": run_id, "attempts": attempt})
         return {"run_id": run_id, "status": "TIMEOUT", "error": "Polling timeout exceeded"}
     
     async def scrape_profile(
         self, 
         linkedin_url: str,
         max_retries: int = 3,
+        force_refresh: bool = False,
     ) -> Optional[dict[str, Any]]:
         """
         Full scrape workflow: start, poll, and get results.
         
-        Includes retry logic for empty datasets (known issue with LinkedIn scrapers).
+        Includes retry logic for empty datasets (known issue with LinkedIn scrapers),
+        failed runs, rate limits and server errors, with exponential backoff.
+        Unrecoverable client errors (bad token, unknown actor, invalid input)
+        return None immediately.
         
         Args:
             linkedin_url: LinkedIn profile URL
             max_retries: Number of retries if dataset is empty (default 3)
+            force_refresh: Skip the cache and run the actor again
         
         Returns:
             Scraped profile data or None on failure
         """
+        if not force_refresh:
+            cached = self.cache.get(linkedin_url)
+            if cached is not None:
+                log_info("apify", "Scrape cache hit", {"linkedin_url": linkedin_url})
+                return cached
+        
         log_info("apify", f"🔍 Starting full scrape workflow", {"linkedin_url": linkedin_url})
         
         for attempt in range(max_retries):
@@ -226,8 +478,8 @@ class ApifyService:
                     log_info("apify", f"Retry attempt {attempt + 1}/{max_retries}", {
                         "linkedin_url": linkedin_url,
                     })
-                    # Wait before retrying
-                    await asyncio.sleep(5)
+                    # Back off before retrying (recoverable failures only reach here)
+                    await asyncio.sleep(_retry_delay(attempt))
                 
                 # Start the scrape
                 run_info = await self.start_scrape(linkedin_url)
@@ -249,7 +501,7 @@ class ApifyService:
                     log_error("apify", f"No dataset ID in completed run", {"run_id": run_id})
                     continue  # Retry if no dataset
                 
-                items = await self.get_dataset_items(dataset_id)
+                items = await self.get_dataset_items(dataset_id, limit=1)
                 
                 if not items:
                     log_warning("apify", f"Empty dataset returned (attempt {attempt + 1}/{max_retries})", {
@@ -270,9 +522,26 @@ class ApifyService:
                     "attempt": attempt + 1,
                 })
                 
-                # Return first profile
+                # Cache and return first profile
+                self.cache.set(linkedin_url, items[0])
                 return items[0]
                 
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                if 400 <= status_code < 500 and status_code not in _RETRYABLE_CLIENT_ERRORS:
+                    # Bad token, missing actor, invalid input: retrying cannot help
+                    log_error("apify", f"❌ Unrecoverable Apify error {status_code}, not retrying", {
+                        "linkedin_url": linkedin_url,
+                        "status_code": status_code,
+                    })
+                    return None
+                log_error("apify", f"❌ Scrape workflow failed (attempt {attempt + 1}/{max_retries}): {str(e)}", {
+                    "linkedin_url": linkedin_url,
+                    "status_code": status_code,
+                })
+                if attempt < max_retries - 1:
+                    continue  # Retry on 429/5xx
+                return None
             except Exception as e:
                 log_error("apify", f"❌ Scrape workflow failed (attempt {attempt + 1}/{max_retries}): {str(e)}", {
                     "linkedin_url": linkedin_url,
@@ -284,6 +553,45 @@ class ApifyService:
         
         log_error("apify", f"All {max_retries} retry attempts failed", {"linkedin_url": linkedin_url})
         return None
+    
+    async def scrape_profiles_batch(
+        self,
+        linkedin_urls: list[str],
+        concurrency: int = 5,
+    ) -> list[Optional[dict[str, Any]]]:
+        """
+        Scrape many profiles with at most `concurrency` actor runs at a time.
+        
+        Keep concurrency within the Apify account's concurrent-run limit.
+        URLs that normalize to the same profile are scraped once.
+        
+        Returns:
+            One scraped profile (or None on failure) per input URL, in order
+        """
+        unique_urls: dict[str, str] = {}
+        for url in linkedin_urls:
+            unique_urls.setdefault(self.cache.normalize_url(url), url)
+        results: dict[str, Optional[dict[str, Any]]] = {}
+        
+        queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
+        for key, url in unique_urls.items():
+            queue.put_nowait((key, url))
+        
+        async def worker() -> None:
+            while True:
+                try:
+                    key, url = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                results[key] = await self.scrape_profile(url)
+        
+        log_info("apify", f"Scraping {len(unique_urls)} profiles", {
+            "concurrency": concurrency,
+            "requested": len(linkedin_urls),
+        })
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, len(unique_urls)))))
+        
+        return [results[self.cache.normalize_url(url)] for url in linkedin_urls]
 
 
 # Singleton instance
@@ -297,3 +605,8 @@ def get_apify_service() -> ApifyService:
         _apify_service = ApifyService()
     return _apify_service
 
+
+async def close_apify_service() -> None:
+    """Close the singleton's pooled client (called on application shutdown)."""
+    if _apify_service is not None:
+        await _apify_service.aclose()
@@ -1,22 +1,24 @@
 """
 Atomic Counter Service
 
-Uses Google Apps Script-style locking via a dedicated cell
-in the spreadsheet to provide atomic increment operations.
+Keeps the counter in a dedicated cell of the spreadsheet. Increments are
+serialized by a process-wide lock and written back in a single
+values.batchUpdate call.
 """
 
-from datetime import datetime
+import threading
 from typing import Optional
 
 import gspread
 
 from app.config import settings
-from app.services.sheets import get_sheets_service
+from app.services.sheets import get_sheets_service, now_iso
 
 
 # Counter sheet name and cell
 COUNTER_SHEET_NAME = "Counter"
 USER_COUNTER_CELL = "A3"  # Counter for User IDs
+USER_COUNTER_UPDATED_CELL = "C3"  # Timestamp of the last increment
 
 
 class UserIdCounter:
@@ -31,6 +33,8 @@ class UserIdCounter:
     
     def __init__(self):
         self._sheets_service = get_sheets_service()
+        self._lock = threading.Lock()
+        self._sheet: Optional[gspread.Worksheet] = None
     
     def _get_counter_sheet(self) -> gspread.Worksheet:
         """Get or create the counter sheet."""
@@ -56,32 +60,30 @@ class UserIdCounter:
         """
         Get the next User ID atomically.
         Returns formatted ID like "USR-00001".
-        """
-        sheet = self._get_counter_sheet()
         
-        max_retries = 5
-        for attempt in range(max_retries):
+        One read plus one batched write per ID; the lock keeps concurrent
+        requests in this process from reading the same counter value.
+        """
+        with self._lock:
+            if self._sheet is None:
+                self._sheet = self._get_counter_sheet()
+            sheet = self._sheet
+            
             try:
-                # Read current user counter value (row 3)
                 current_value = sheet.acell(USER_COUNTER_CELL).value
-                current_count = int(current_value) if current_value else 0
-                
-                # Increment
-                new_count = current_count + 1
-                
-                # Write back
-                sheet.update_cell(3, 1, str(new_count))
-                sheet.update_cell(3, 3, datetime.utcnow().isoformat())
-                
-                # Format ID with zero-padding
-                return f"{self.PREFIX}-{new_count:05d}"
+                new_count = (int(current_value) if current_value else 0) + 1
                 
+                # Counter and timestamp in a single values.batchUpdate
+                sheet.batch_update([
+                    {"range": USER_COUNTER_CELL, "values": [[new_count]]},
+                    {"range": USER_COUNTER_UPDATED_CELL, "values": [[now_iso()]]},
+                ])
             except Exception as e:
-                if attempt == max_retries - 1:
-                    raise RuntimeError(f"Failed to generate User ID after {max_retries} attempts: {e}")
-                continue
-        
-        raise RuntimeError("Failed to generate User ID")
+                self._sheet = None  # Re-resolve the worksheet on the next call
+                raise RuntimeError(f"Failed to generate User ID: {e}") from e
+            
+            # Format ID with zero-padding
+            return f"{self.PREFIX}-{new_count:05d}"
     
     def get_current_count(self) -> int:
         """Get the current user counter value without incrementing."""
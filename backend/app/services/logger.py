@@ -6,11 +6,17 @@ Provides DevOps-friendly logging with:
 - JSON-formatted logs for log aggregation
 - File-based persistence for session history
 - Console output with colors for development
+- Queue-based handlers so file I/O stays off the request path
 """
 
+import atexit
+import copy
 import json
 import logging
+import logging.handlers
+import queue
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
@@ -23,6 +29,71 @@ from app.config import settings
 LOG_DIR = Path(__file__).parent.parent.parent / "logs"
 LOG_DIR.mkdir(exist_ok=True)
 
+# Rotate the daily log file past this size, keeping a bounded number of backups
+LOG_MAX_BYTES = 50 * 1024 * 1024
+LOG_BACKUP_COUNT = 7
+
+# SessionLogger.log level names -> logging levels
+_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format each record as one JSON object per line.
+    
+    Structured fields passed via extra= (component, session_id, data) are
+    serialized once, alongside the plain message.
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "module": record.name,
+            "message": record.getMessage(),
+        }
+        for key in ("component", "session_id", "data"):
+            value = getattr(record, key, None)
+            if value:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class ConsoleFormatter(logging.Formatter):
+    """Human-readable format: session prefix and structured data inline."""
+    
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        session_id = getattr(record, "session_id", None)
+        data = getattr(record, "data", None)
+        if session_id or data:
+            record = logging.makeLogRecord(record.__dict__)
+            if data:
+                record.message = f"{record.message} | {json.dumps(data, default=str)}"
+            if session_id:
+                record.message = f"[{session_id}] {record.message}"
+        return super().formatMessage(record)
+
+
+class RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueue a copy of each record with its fields intact.
+    
+    The stock prepare() pre-formats the record, folding any traceback into
+    msg and clearing exc_info, so the listener's formatters could no longer
+    place it (JSON "exception" field, console line after the data suffix).
+    Records never leave the process, so nothing has to be made picklable.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return copy.copy(record)
+
 
 class SessionLogger:
     """
@@ -36,16 +107,17 @@ class SessionLogger:
         self._setup_logging()
         self._sessions_file = LOG_DIR / "sessions.jsonl"
         self._current_session: Optional[str] = None
+        
+        # Single writer thread keeps session records in order
+        self._session_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-log")
+        atexit.register(self._session_writer.shutdown)
     
     def _setup_logging(self):
         """Configure structured logging."""
         # Create formatters
-        json_formatter = logging.Formatter(
-            '{"timestamp": "%(asctime)s", "level": "%(levelname)s", '
-            '"module": "%(name)s", "message": "%(message)s"}'
-        )
+        json_formatter = JsonFormatter()
         
-        console_formatter = logging.Formatter(
+        console_formatter = ConsoleFormatter(
             '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
             datefmt='%H:%M:%S'
         )
@@ -57,15 +129,26 @@ class SessionLogger:
         
         # File handler - JSON lines format
         today = datetime.now().strftime("%Y-%m-%d")
-        file_handler = logging.FileHandler(LOG_DIR / f"backend_{today}.log")
+        file_handler = logging.handlers.RotatingFileHandler(
+            LOG_DIR / f"backend_{today}.log",
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT,
+        )
         file_handler.setFormatter(json_formatter)
         file_handler.setLevel(logging.DEBUG)
         
+        # Callers only enqueue records; a listener thread formats and writes them
+        self._queue: queue.Queue = queue.Queue(-1)
+        self._listener = logging.handlers.QueueListener(
+            self._queue, console_handler, file_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self._listener.stop)
+        
         # Configure root logger
         root_logger = logging.getLogger()
         root_logger.setLevel(logging.DEBUG)
-        root_logger.addHandler(console_handler)
-        root_logger.addHandler(file_handler)
+        root_logger.addHandler(RecordQueueHandler(self._queue))
         
         # Reduce noise from third-party libraries
         logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -99,9 +182,8 @@ class SessionLogger:
             "events": [],
         }
         
-        # Save to sessions file
-        with open(self._sessions_file, "a") as f:
-            f.write(json.dumps(session_data) + "\n")
+        # Save to sessions file (in the background)
+        self._session_writer.submit(self._append_session, json.dumps(session_data) + "\n")
         
         self.log("session", f"🚀 Session started: {session_id}", {
             "unique_id": unique_id,
@@ -110,6 +192,11 @@ class SessionLogger:
         
         return session_id
     
+    def _append_session(self, line: str):
+        """Append one JSON line to the sessions file."""
+        with open(self._sessions_file, "a") as f:
+            f.write(line)
+    
     def log(
         self,
         component: str,
@@ -128,18 +215,16 @@ class SessionLogger:
         """
         logger = logging.getLogger(f"linkify.{component}")
         
-        # Build log message
-        log_msg = message
-        if data:
-            log_msg += f" | {json.dumps(data)}"
-        
-        # Add session prefix if active
-        if self._current_session:
-            log_msg = f"[{self._current_session}] {log_msg}"
-        
-        # Log at appropriate level
-        log_method = getattr(logger, level.lower(), logger.info)
-        log_method(log_msg)
+        # Structured fields travel on the record; the formatters serialize them
+        logger.log(
+            _LEVELS.get(level.lower(), logging.INFO),
+            message,
+            extra={
+                "component": component,
+                "session_id": self._current_session,
+                "data": data,
+            },
+        )
     
     def log_event(
         self,
@@ -5,13 +5,27 @@ Handles AI-powered profile scoring using GPT-4.
 Aligned with the deterministic scoring architecture in app/scoring/.
 """
 
-import json
-from typing import Any, Optional
+import asyncio
+import hashlib
+import random
+import re
+import time
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, AsyncIterator, ClassVar, Optional
 
-from langchain_openai import ChatOpenAI
+import httpx
+import openai
+import orjson
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.utils.function_calling import convert_to_openai_function
+from langchain_core.utils.json import parse_partial_json
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, model_validator
 
 from app.config import settings
+from app.scoring.helpers import parse_count, require_numpy
+from app.services.logger import log_warning
 
 
 # ============================================================================
@@ -61,6 +75,14 @@ SCORING RUBRIC - What to look for in each section:
 - 50-199 = 3-4 points
 - Under 50 = 1-2 points
 
+## FOLLOWERS (1-10 points)
+- 5000+ followers = 10 points
+- 1000-4999 = 8 points
+- 500-999 = 7 points
+- 100-499 = 5 points
+- 1-99 = 3 points
+- None = 1 point
+
 ## EDUCATION (1-10 points)
 ✅ POSITIVE signals:
 - Advanced degrees (Master's, MBA, PhD)
@@ -88,6 +110,10 @@ SCORING RUBRIC - What to look for in each section:
 - Casual but clear = 5-7
 - Missing or inappropriate = 1-4
 
+## COVER PICTURE (1-10 points)
+- Custom cover image = 7
+- Default or missing = 3
+
 ## VERIFIED & PREMIUM (1-10 points each)
 - LinkedIn Verified badge = 10, none = 4
 - LinkedIn Premium = 8, none = 5
@@ -96,59 +122,37 @@ SCORING RUBRIC - What to look for in each section:
 # ============================================================================
 # SYSTEM PROMPT
 # ============================================================================
+# Static content only: keeping the rubric at the start, identical on every
+# call (and across section groups), lets OpenAI's automatic prompt caching
+# reuse the prefix. Each group appends its own sections and schema; the
+# target audience is given in the user prompt.
 SCORING_SYSTEM_PROMPT = """You are an expert LinkedIn profile optimization consultant who helps professionals improve their profiles for specific target audiences.
+""" + SCORING_RUBRIC + """
 
-Your task is to analyze a LinkedIn profile and provide:
+Your task is to analyze a LinkedIn profile and provide, for the sections you are asked to score:
 1. Section-by-section scores (1-10 scale)
 2. Detailed reasoning for each score
 3. SPECIFIC highlighting of what rubric items are MISSING from the profile
-4. Cumulative score (sum of all section scores, max 100)
-
-TARGET AUDIENCE: {target_group}
-
-""" + SCORING_RUBRIC + """
 
 CRITICAL INSTRUCTIONS:
 1. For each section's reasoning, explicitly state which rubric items are PRESENT and which are MISSING
 2. Use format: "PRESENT: [list items found] | MISSING: [list items not found]"
 3. Be specific about what the user should ADD to improve their score
 4. Each section score must be 1-10 (not 0, minimum is 1)
-5. The Cumulative Sum should equal the sum of all 12 section scores
-
-Return your analysis as a valid JSON object matching this exact schema:
-{{
-    "LinkedIn URL": "<profile_url>",
-    "Headline Score": <1-10>,
-    "Connection Count Score": <1-10>,
-    "Follower Count Score": <1-10>,
-    "About Score": <1-10>,
-    "Profile Pic Score": <1-10>,
-    "Cover_picture Score": <1-10>,
-    "Experience Score": <1-10>,
-    "Education Score": <1-10>,
-    "Skills Score": <1-10>,
-    "Licenses & Certifications Score": <1-10>,
-    "is Verified Score": <1-10>,
-    "is Premium Score": <1-10>,
-    "Cumulative Sum of Score(100)": <sum of above scores>,
-    "Headline Reasoning": "<analysis with PRESENT/MISSING items>",
-    "Connection Reasoning": "<analysis>",
-    "Follower Reasoning": "<analysis>",
-    "About Reasoning": "<analysis with PRESENT/MISSING items>",
-    "Profile Pic Reasoning": "<analysis>",
-    "Cover_picture Reasoning": "<analysis>",
-    "Experience Reasoning": "<analysis with PRESENT/MISSING items>",
-    "Education Reasoning": "<analysis>",
-    "Skills Reasoning": "<analysis with PRESENT/MISSING items>",
-    "Licenses & Certifications Reasoning": "<analysis>",
-    "Cumulative Sum Reasoning": "<executive summary and top 3 priorities>"
-}}
+5. Connection, follower, profile picture, cover image, verified and premium scores are PRECOMPUTED
+   from the rubric and given in the user message. Do not score them, but take them into account
+   in any executive summary.
+6. Score ONLY the sections listed below and return ONLY the fields in the schema below
+
+The target audience is provided in the user message; score for that audience.
 """
 
 # ============================================================================
 # USER PROMPT
 # ============================================================================
-SCORING_USER_PROMPT = """Analyze this LinkedIn profile for optimization opportunities:
+SCORING_USER_PROMPT = """TARGET AUDIENCE: {target_group}
+
+Analyze this LinkedIn profile for optimization opportunities:
 
 LINKEDIN URL: {linkedin_url}
 
@@ -171,6 +175,8 @@ COVER IMAGE: {has_cover_image}
 VERIFIED: {is_verified}
 PREMIUM: {is_premium}
 
+PRECOMPUTED SCORES: {precomputed_scores}
+
 EXPERIENCE:
 {experience}
 
@@ -185,27 +191,611 @@ LICENSES & CERTIFICATIONS:
 
 == END PROFILE DATA ==
 
-Please score each section (1-10), highlight MISSING rubric items in your reasoning, and provide the Cumulative Sum.
+Please score the requested sections (1-10) and highlight MISSING rubric items in your reasoning.
 Target Audience: {target_group}
 """
 
 
+# Target group -> audience description used in the prompt
+TARGET_GROUP_LABELS = {
+    "recruiters": "Recruiters & Hiring Managers at Big Companies (FAANG, Fortune 500)",
+    "clients": "Potential Clients & Business Partners",
+    "vcs": "Venture Capitalists & Investors",
+}
+
+
+# ============================================================================
+# RESPONSE SCHEMA
+# ============================================================================
+# The model scores content sections in three groups, one parallel call each,
+# so no single reply has to generate every field. Field aliases are the keys
+# of the returned dict; descriptions are shown in the prompt schema.
+class _SectionScores(BaseModel):
+    """Base for one group of model-scored sections."""
+    
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+    
+    sections: ClassVar[str]
+
+
+class HeadlineAboutScores(_SectionScores):
+    sections: ClassVar[str] = "Headline, About"
+    
+    headline_score: int = Field(alias="Headline Score", description="1-10")
+    about_score: int = Field(alias="About Score", description="1-10")
+    headline_reasoning: str = Field(alias="Headline Reasoning", description="analysis with PRESENT/MISSING items")
+    about_reasoning: str = Field(alias="About Reasoning", description="analysis with PRESENT/MISSING items")
+
+
+class ExperienceSkillsScores(_SectionScores):
+    sections: ClassVar[str] = "Experience, Skills"
+    
+    experience_score: int = Field(alias="Experience Score", description="1-10")
+    skills_score: int = Field(alias="Skills Score", description="1-10")
+    experience_reasoning: str = Field(alias="Experience Reasoning", description="analysis with PRESENT/MISSING items")
+    skills_reasoning: str = Field(alias="Skills Reasoning", description="analysis with PRESENT/MISSING items")
+
+
+class EducationCertsScores(_SectionScores):
+    sections: ClassVar[str] = "Education, Licenses & Certifications, plus an executive summary of the whole profile"
+    
+    education_score: int = Field(alias="Education Score", description="1-10")
+    licenses_certs_score: int = Field(alias="Licenses & Certifications Score", description="1-10")
+    education_reasoning: str = Field(alias="Education Reasoning", description="analysis")
+    licenses_certs_reasoning: str = Field(alias="Licenses & Certifications Reasoning", description="analysis")
+    cumulative_sum_reasoning: str = Field(
+        alias="Cumulative Sum Reasoning",
+        description="executive summary covering all 12 sections and top 3 priorities",
+    )
+
+
+SECTION_GROUPS: tuple[type[_SectionScores], ...] = (
+    HeadlineAboutScores,
+    ExperienceSkillsScores,
+    EducationCertsScores,
+)
+
+
+# The 12 section scores summed into "Cumulative Sum of Score(100)"
+SECTION_SCORE_KEYS = (
+    "Headline Score",
+    "Connection Count Score",
+    "Follower Count Score",
+    "About Score",
+    "Profile Pic Score",
+    "Cover_picture Score",
+    "Experience Score",
+    "Education Score",
+    "Skills Score",
+    "Licenses & Certifications Score",
+    "is Verified Score",
+    "is Premium Score",
+)
+
+# Fields the model generates; the precomputed sections are derived from each
+# profile itself
+MODEL_SCORE_KEYS = tuple(
+    field.alias for group in SECTION_GROUPS for field in group.model_fields.values()
+    if field.annotation is int
+)
+MODEL_REASONING_KEYS = tuple(
+    field.alias for group in SECTION_GROUPS for field in group.model_fields.values()
+    if field.annotation is str
+)
+
+
+def _response_format(group: type[_SectionScores]) -> dict[str, Any]:
+    """Structured outputs: OpenAI constrains decoding to exactly the group's schema."""
+    schema = convert_to_openai_function(group, strict=True)
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": schema["name"],
+            "schema": schema["parameters"],
+            "strict": True,
+        },
+    }
+
+
+def _group_prompt(group: type[_SectionScores]) -> ChatPromptTemplate:
+    """Shared system prompt plus the group's sections and JSON schema."""
+    fields = ",\n".join(
+        f'    "{field.alias}": <{field.description}>' if field.annotation is int
+        else f'    "{field.alias}": "<{field.description}>"'
+        for field in group.model_fields.values()
+    )
+    system = (
+        SCORING_SYSTEM_PROMPT
+        + f"\nSECTIONS TO SCORE: {group.sections}\n\n"
+        + f"Return your analysis as a valid JSON object matching this exact schema:\n{{{{\n{fields}\n}}}}\n"
+    )
+    return ChatPromptTemplate.from_messages([("system", system), ("user", SCORING_USER_PROMPT)])
+
+
+# Built once at import; reused by every scoring call
+SCORING_PROMPTS = tuple(_group_prompt(group) for group in SECTION_GROUPS)
+SCORE_RESPONSE_FORMATS = tuple(_response_format(group) for group in SECTION_GROUPS)
+
+
+# ============================================================================
+# PROFILE FORMATTING
+# ============================================================================
+# Input tokens drive cost and latency; long free text is collapsed and capped
+DESCRIPTION_CHAR_LIMIT = 300
+ABOUT_CHAR_LIMIT = 2000
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Objective sections are scored in Python from the rubric: (min count, score)
+CONNECTION_SCORE_BANDS = ((500, 9), (200, 6), (50, 3))
+FOLLOWER_SCORE_BANDS = ((5000, 10), (1000, 8), (500, 7), (100, 5), (1, 3))
+PROFILE_PIC_SCORES = (8, 2)     # (present, missing)
+COVER_PICTURE_SCORES = (7, 3)   # (present, missing)
+VERIFIED_SCORES = (10, 4)       # (verified, not verified)
+PREMIUM_SCORES = (8, 5)         # (premium, free)
+
+
+def _band_score(count: Optional[int], bands: tuple[tuple[int, int], ...]) -> int:
+    """Score for the first band whose minimum the count reaches (else 1)."""
+    for minimum, score in bands:
+        if count is not None and count >= minimum:
+            return score
+    return 1
+
+
+def _compact_text(text: Optional[str], limit: int) -> str:
+    """Collapse whitespace runs and cap the length."""
+    if not text:
+        return ""
+    return _WHITESPACE_RE.sub(" ", text).strip()[:limit]
+
+
+class _ProfileModel(BaseModel):
+    """
+    Lenient base for scraped-profile views (unknown keys ignored).
+    
+    Empty values are dropped before validation, so an alias falls through
+    to the next key variant (or the default) when a scraper sends "",
+    None, 0 or [] for it.
+    """
+    
+    model_config = ConfigDict(extra="ignore", coerce_numbers_to_str=True)
+    
+    @model_validator(mode="before")
+    @classmethod
+    def _drop_empty(cls, data: Any) -> Any:
+        if isinstance(data, dict):
+            return {key: value for key, value in data.items() if value}
+        return data
+
+
+class ExperienceEntry(_ProfileModel):
+    title: Optional[str] = None
+    company: Optional[str] = Field(default=None, validation_alias=AliasChoices("companyName", "company"))
+    description: Optional[str] = None
+    
+    def line(self) -> str:
+        """Title, company and (if any) description."""
+        head = f"• {self.title or 'Unknown Role'} at {self.company or 'Unknown Company'}"
+        desc = _compact_text(self.description, DESCRIPTION_CHAR_LIMIT)
+        return f"{head}\n  {desc}" if desc else head
+
+
+class EducationEntry(_ProfileModel):
+    school: Optional[str] = Field(default=None, validation_alias=AliasChoices("schoolName", "school"))
+    degree: Optional[str] = Field(default=None, validation_alias=AliasChoices("degreeName", "degree"))
+    field_of_study: Optional[str] = Field(default=None, validation_alias="fieldOfStudy")
+    
+    def line(self) -> str:
+        """Degree, field of study and school."""
+        school = self.school or "Unknown School"
+        degree = " ".join(filter(None, (self.degree, self.field_of_study)))
+        return f"• {degree} - {school}" if degree else f"• {school}"
+
+
+class CertificationEntry(_ProfileModel):
+    name: Optional[str] = Field(default=None, validation_alias=AliasChoices("name", "title"))
+    authority: Optional[str] = Field(default=None, validation_alias=AliasChoices("authority", "issuer"))
+    
+    def line(self) -> str:
+        """Name and (if any) issuing authority."""
+        name = self.name or "Unknown"
+        return f"• {name} ({self.authority})" if self.authority else f"• {name}"
+
+
+class SkillEntry(_ProfileModel):
+    name: Optional[str] = None
+
+
+class ProfileView(_ProfileModel):
+    """
+    The parts of a scraped profile the scoring prompt uses.
+    
+    Validation aliases cover the key variants of the supported Apify actors,
+    so the prompt variables are read from typed fields instead of chains of
+    dict lookups.
+    """
+    
+    url: str = "Unknown"
+    first_name: Optional[str] = Field(default="Unknown", validation_alias="firstName")
+    last_name: Optional[str] = Field(default="", validation_alias="lastName")
+    headline: Optional[str] = "No headline"
+    about: Optional[str] = Field(default=None, validation_alias=AliasChoices("about", "summary"))
+    location: Optional[str] = Field(default="Unknown", validation_alias=AliasChoices("geoLocationName", "location"))
+    experience: list[ExperienceEntry] = Field(default_factory=list, validation_alias=AliasChoices("experience", "positions"))
+    education: list[EducationEntry] = Field(default_factory=list, validation_alias=AliasChoices("education", "educations"))
+    skills: list[SkillEntry | str] = Field(default_factory=list)
+    certifications: list[CertificationEntry] = Field(default_factory=list, validation_alias=AliasChoices("certifications", "licenses"))
+    picture: Any = Field(default=None, validation_alias=AliasChoices("pictureUrl", "profilePicture", "profilePictureUrl"))
+    cover: Any = Field(default=None, validation_alias=AliasChoices("coverImageUrl", "backgroundUrl", "backgroundImage", "coverImage"))
+    is_verified: Any = Field(default=False, validation_alias="isVerified")
+    is_premium: Any = Field(default=False, validation_alias=AliasChoices("isPremium", "premium"))
+    followers: Any = Field(default=None, validation_alias=AliasChoices("followerCount", "followersCount", "followers"))
+    connections: Any = Field(default=None, validation_alias=AliasChoices("connectionsCount", "connections"))
+    
+    def precomputed_scores(self) -> dict[str, Any]:
+        """Scores and reasoning of the objective sections, per the rubric."""
+        connections = parse_count(self.connections)
+        followers = parse_count(self.followers)
+        return {
+            "Connection Count Score": _band_score(connections, CONNECTION_SCORE_BANDS),
+            "Follower Count Score": _band_score(followers, FOLLOWER_SCORE_BANDS),
+            "Profile Pic Score": PROFILE_PIC_SCORES[0] if self.picture else PROFILE_PIC_SCORES[1],
+            "Cover_picture Score": COVER_PICTURE_SCORES[0] if self.cover else COVER_PICTURE_SCORES[1],
+            "is Verified Score": VERIFIED_SCORES[0] if self.is_verified else VERIFIED_SCORES[1],
+            "is Premium Score": PREMIUM_SCORES[0] if self.is_premium else PREMIUM_SCORES[1],
+            "Connection Reasoning": (
+                f"{connections} connections" if connections is not None else "Connection count unavailable"
+            ),
+            "Follower Reasoning": (
+                f"{followers} followers" if followers is not None else "Follower count unavailable"
+            ),
+            "Profile Pic Reasoning": "Profile picture present" if self.picture else "MISSING: profile picture",
+            "Cover_picture Reasoning": "Custom cover image present" if self.cover else "MISSING: custom cover image",
+        }
+    
+    def to_prompt_vars(self) -> dict[str, Any]:
+        """
+        Prompt template variables of the profile itself (empty fields
+        dropped, free text compacted); the caller adds target_group and may
+        override linkedin_url.
+        """
+        skill_names = (
+            skill.name if isinstance(skill, SkillEntry) else skill
+            for skill in self.skills[:15]
+        )
+        precomputed = self.precomputed_scores()
+        return {
+            "precomputed": precomputed,
+            "precomputed_scores": ", ".join(
+                f"{key}={value}" for key, value in precomputed.items() if key.endswith("Score")
+            ),
+            "linkedin_url": self.url,
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "headline": self.headline,
+            "about": _compact_text(self.about, ABOUT_CHAR_LIMIT) or "No about section",
+            "connections": self.connections or "Unknown",
+            "followers": self.followers or "Unknown",
+            "location": self.location,
+            "experience": "\n".join(e.line() for e in self.experience[:5]) or "No experience listed",
+            "education": "\n".join(e.line() for e in self.education[:3]) or "No education listed",
+            "skills": ", ".join(filter(None, skill_names)) or "No skills listed",
+            "certifications": "\n".join(c.line() for c in self.certifications[:5]) or "No certifications listed",
+            "has_profile_pic": "Yes" if self.picture else "No",
+            "has_cover_image": "Yes" if self.cover else "No",
+            "is_verified": "Yes" if self.is_verified else "No",
+            "is_premium": "Yes" if self.is_premium else "No",
+        }
+
+
+GROQ_MODEL_PREFIX = "groq/"
+
+# Cheap authenticated GETs used to open a connection before the first request
+OPENAI_MODELS_URL = "https://api.openai.com/v1/models"
+GROQ_MODELS_URL = "https://api.groq.com/openai/v1/models"
+
+# Model calls are retried here (max_retries=0 on the clients) so the circuit
+# breaker sees one outcome per request
+LLM_MAX_ATTEMPTS = 4
+# Status codes worth retrying (timeout, rate limit, server errors >= 500)
+_RETRYABLE_STATUS_CODES = frozenset({408, 429})
+
+# Chains of the current sync score_profile call, used instead of the pooled ones
+_scoped_chains: ContextVar[Optional[tuple]] = ContextVar("scoring_scoped_chains", default=None)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the model while the circuit breaker is open."""
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a model call error is transient (connection, timeout, 408/429/5xx)."""
+    if isinstance(error, (openai.APIConnectionError, httpx.TransportError)):
+        return True
+    # Duck-typed so Groq's SDK errors (same shape as OpenAI's) are covered too
+    status_code = getattr(error, "status_code", None)
+    return isinstance(status_code, int) and (
+        status_code in _RETRYABLE_STATUS_CODES or status_code >= 500
+    )
+
+
+def _retry_delay(error: Exception, attempt: int, base: float = 1.0, cap: float = 20.0) -> float:
+    """
+    Seconds to wait before retry number `attempt`.
+    
+    Honors a Retry-After header on the error's response; otherwise random
+    exponential backoff (full jitter) between 0 and min(base * 2^attempt, cap).
+    """
+    response = getattr(error, "response", None)
+    if response is not None:
+        try:
+            return min(float(response.headers["retry-after"]), cap)
+        except (KeyError, ValueError):
+            pass
+    return random.uniform(0, min(base * 2 ** attempt, cap))
+
+
+class CircuitBreaker:
+    """
+    Stop calling the model during a sustained outage.
+    
+    After fail_max consecutive failed requests (each already retried), the
+    circuit opens and calls fail fast for reset_timeout seconds. The next
+    call is then let through as a trial: success closes the circuit, failure
+    reopens it.
+    """
+    
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+    
+    @property
+    def is_open(self) -> bool:
+        """True while calls should fail fast."""
+        return (
+            self._opened_at is not None
+            and time.monotonic() - self._opened_at < self.reset_timeout
+        )
+    
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = None
+    
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.fail_max:
+            self._opened_at = time.monotonic()
+
+
+def _build_llm(
+    model: str,
+    http_async_client: Optional[httpx.AsyncClient] = None,
+    response_format: Optional[dict[str, Any]] = None,
+):
+    """
+    Create the chat model for one section group.
+    
+    Plain model names run on OpenAI with the group's JSON schema enforced
+    (response_format); "groq/<model>" runs on Groq in JSON mode. Sampling is
+    deterministic, so a cached result is what a new call would return.
+    """
+    if model.startswith(GROQ_MODEL_PREFIX):
+        try:
+            from langchain_groq import ChatGroq
+        except ImportError:
+            raise ImportError(
+                "langchain-groq not installed. Install with: pip install langchain-groq\n"
+                "Or set SCORING_MODEL to an OpenAI model."
+            )
+        return ChatGroq(
+            model=model[len(GROQ_MODEL_PREFIX):],
+            api_key=settings.groq_api_key,
+            temperature=0,
+            max_retries=0,
+            http_async_client=http_async_client,
+            model_kwargs={"response_format": {"type": "json_object"}},
+        )
+    
+    return ChatOpenAI(
+        model=model,
+        api_key=settings.openai_api_key,
+        temperature=0,
+        max_retries=0,
+        http_async_client=http_async_client,
+        response_format=response_format,
+    )
+
+
+def _new_http_client() -> httpx.AsyncClient:
+    """Keep-alive HTTP/2 client shared by the section groups' models."""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(60.0, connect=5.0),
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+    )
+
+
+def _build_chains(http_client: httpx.AsyncClient) -> tuple:
+    """The prompt | llm chain of each section group, on one HTTP client."""
+    return tuple(
+        prompt | _build_llm(settings.scoring_model, http_client, response_format)
+        for prompt, response_format in zip(SCORING_PROMPTS, SCORE_RESPONSE_FORMATS)
+    )
+
+
+class ScoreCache:
+    """
+    In-memory TTL cache of AI scoring results keyed by prompt content.
+    
+    Identical profile + target group inputs (dashboard refreshes, retries)
+    are answered without another model call. Only successfully parsed
+    results are stored; once maxsize is reached the oldest entry is evicted.
+    """
+    
+    def __init__(self, maxsize: int = 1_000, ttl_seconds: float = 24 * 3600):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, tuple[float, dict[str, Any]]] = {}
+    
+    @staticmethod
+    def make_key(prompt_vars: dict[str, Any]) -> str:
+        """SHA-256 of the canonical JSON form of the prompt variables."""
+        canonical = orjson.dumps(prompt_vars, option=orjson.OPT_SORT_KEYS, default=str)
+        return hashlib.sha256(canonical).hexdigest()
+    
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Return the cached result for a key, or None if missing/expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+    
+    def set(self, key: str, result: dict[str, Any]) -> None:
+        """Store a result, evicting the oldest entry when full."""
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, result)
+
+
+class SemanticScoreCache:
+    """
+    Embedding cache of AI scoring results for near-duplicate profiles.
+    
+    A profile is embedded from every section the model scores; if a
+    profile scored for the same target group has cosine similarity >=
+    threshold, its model-scored section scores are reused. Only the scores
+    are stored, never another profile's reasoning. Requires NumPy.
+    """
+    
+    def __init__(self, threshold: float, maxsize: int = 1_000):
+        self._np = require_numpy()
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._embeddings = OpenAIEmbeddings(
+            model="text-embedding-3-small",
+            api_key=settings.openai_api_key,
+        )
+        # target group -> (unit embedding matrix, results in row order)
+        self._stores: dict[str, tuple[Any, list[dict[str, Any]]]] = {}
+    
+    @staticmethod
+    def profile_text(prompt_vars: dict[str, Any]) -> str:
+        """Text embedded for similarity: the prompt text of each model-scored section."""
+        return "\n\n".join(
+            prompt_vars[key]
+            for key in ("headline", "about", "experience", "skills", "education", "certifications")
+        )
+    
+    async def embed(self, prompt_vars: dict[str, Any]):
+        """Unit-length embedding of a profile's prompt variables."""
+        vector = self._np.asarray(
+            await self._embeddings.aembed_query(self.profile_text(prompt_vars)),
+            dtype=self._np.float32,
+        )
+        return vector / (self._np.linalg.norm(vector) or 1.0)
+    
+    def get(self, target_group: str, vector) -> Optional[dict[str, Any]]:
+        """Return the scores of the most similar stored profile above threshold."""
+        store = self._stores.get(target_group)
+        if store is not None:
+            matrix, results = store
+            similarities = matrix @ vector
+            best = int(similarities.argmax())
+            if similarities[best] >= self.threshold:
+                self.hits += 1
+                return results[best]
+        self.misses += 1
+        return None
+    
+    def set(self, target_group: str, vector, result: dict[str, Any]) -> None:
+        """Store a result's model scores, evicting the oldest entry when full."""
+        result = {key: result[key] for key in MODEL_SCORE_KEYS if key in result}
+        store = self._stores.get(target_group)
+        if store is None:
+            self._stores[target_group] = (vector[None, :], [result])
+            return
+        matrix, results = store
+        if len(results) >= self.maxsize:
+            matrix, results = matrix[1:], results[1:]
+        self._stores[target_group] = (self._np.vstack([matrix, vector]), results + [result])
+
+
 class OpenAIScoringService:
     """Service for AI-powered profile scoring."""
     
     def __init__(self):
-        self.llm = ChatOpenAI(
-            model="gpt-4-turbo-preview",
-            api_key=settings.openai_api_key,
-            temperature=0.3,
-            response_format={"type": "json_object"},
-        )
+        self.chains: tuple = ()
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._llm_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.cache = ScoreCache()
+        self.breaker = CircuitBreaker()
+        self.semantic_cache: Optional[SemanticScoreCache] = None
+        if settings.semantic_cache_threshold > 0 and settings.openai_api_key:
+            try:
+                self.semantic_cache = SemanticScoreCache(settings.semantic_cache_threshold)
+            except ImportError as e:
+                log_warning("ai_scoring", f"Semantic cache disabled: {e}")
     
     def score_profile(
         self,
         scraped_profile: dict[str, Any],
         target_group: str,
         linkedin_url: str = "",
+    ) -> dict[str, Any]:
+        """
+        Score a LinkedIn profile using AI (sync version).
+        
+        Blocks until the response arrives; from async code, use ascore_profile.
+        The call runs on a new loop with its own HTTP client, closed before
+        the loop ends, so the pooled client is left to the serving loop.
+        """
+        async def scoped() -> dict[str, Any]:
+            http_client = _new_http_client()
+            token = _scoped_chains.set(_build_chains(http_client))
+            try:
+                return await self.ascore_profile(scraped_profile, target_group, linkedin_url)
+            finally:
+                _scoped_chains.reset(token)
+                await http_client.aclose()
+        
+        return asyncio.run(scoped())
+    
+    async def score_profiles_batch(
+        self,
+        profiles: list[dict[str, Any]],
+        target_group: str,
+    ) -> list[Any]:
+        """
+        Score many profiles concurrently.
+        
+        At most settings.openai_concurrency requests are in flight at once.
+        Results are in input order; a failed profile yields its exception
+        instead of failing the whole batch.
+        """
+        semaphore = asyncio.Semaphore(settings.openai_concurrency)
+        
+        async def score_one(profile: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                return await self.ascore_profile(profile, target_group)
+        
+        return await asyncio.gather(*(score_one(p) for p in profiles), return_exceptions=True)
+    
+    async def ascore_profile(
+        self,
+        scraped_profile: dict[str, Any],
+        target_group: str,
+        linkedin_url: str = "",
     ) -> dict[str, Any]:
         """
         Score a LinkedIn profile using AI.
@@ -218,151 +808,358 @@ class OpenAIScoringService:
         Returns:
             Scoring results dict matching the expected schema
         """
-        # Map target group to readable format
-        target_map = {
-            "recruiters": "Recruiters & Hiring Managers at Big Companies (FAANG, Fortune 500)",
-            "clients": "Potential Clients & Business Partners",
-            "vcs": "Venture Capitalists & Investors",
-        }
-        target_readable = target_map.get(target_group, target_group)
-        
-        # Build the prompt
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", SCORING_SYSTEM_PROMPT),
-            ("user", SCORING_USER_PROMPT),
-        ])
-        
-        # Format experience, education, skills for the prompt
-        experience = scraped_profile.get("experience", []) or scraped_profile.get("positions", [])
-        education = scraped_profile.get("education", []) or scraped_profile.get("educations", [])
-        skills = scraped_profile.get("skills", [])
-        certifications = scraped_profile.get("certifications", []) or scraped_profile.get("licenses", [])
-        
-        # Convert to readable strings
-        if experience:
-            exp_lines = []
-            for exp in experience[:5]:
-                title = exp.get("title", "Unknown Role")
-                company = exp.get("companyName", exp.get("company", "Unknown Company"))
-                desc = exp.get("description", "No description")[:300]
-                exp_lines.append(f"• {title} at {company}\n  {desc}")
-            experience_str = "\n\n".join(exp_lines)
-        else:
-            experience_str = "No experience listed"
-        
-        if education:
-            edu_lines = []
-            for edu in education[:3]:
-                school = edu.get("schoolName", edu.get("school", "Unknown School"))
-                degree = edu.get("degreeName", edu.get("degree", ""))
-                field = edu.get("fieldOfStudy", "")
-                edu_lines.append(f"• {degree} {field} - {school}")
-            education_str = "\n".join(edu_lines)
-        else:
-            education_str = "No education listed"
+        prompt_vars = self._build_prompt_vars(scraped_profile, target_group, linkedin_url)
+        cached, cache_key, embedding = await self._lookup_cached(prompt_vars)
+        if cached is not None:
+            return cached
         
-        if skills:
-            skills_str = ", ".join([s.get("name", str(s)) for s in skills[:15]])
-        else:
-            skills_str = "No skills listed"
-        
-        if certifications:
-            cert_lines = []
-            for cert in certifications[:5]:
-                name = cert.get("name", cert.get("title", "Unknown"))
-                authority = cert.get("authority", cert.get("issuer", ""))
-                cert_lines.append(f"• {name} ({authority})" if authority else f"• {name}")
-            certs_str = "\n".join(cert_lines)
-        else:
-            certs_str = "No certifications listed"
-        
-        # Detect presence of media - check all possible Apify keys
-        has_profile_pic = "Yes" if (
-            scraped_profile.get("pictureUrl") or 
-            scraped_profile.get("profilePicture") or
-            scraped_profile.get("profilePictureUrl")
-        ) else "No"
-        
-        has_cover_image = "Yes" if (
-            scraped_profile.get("coverImageUrl") or  # Apify's actual key
-            scraped_profile.get("backgroundUrl") or 
-            scraped_profile.get("backgroundImage") or
-            scraped_profile.get("coverImage")
-        ) else "No"
-        
-        is_verified = "Yes" if scraped_profile.get("isVerified") else "No"
-        is_premium = "Yes" if scraped_profile.get("isPremium") or scraped_profile.get("premium") else "No"
-        
-        # Get follower/connection counts - check all possible Apify keys
-        followers = (
-            scraped_profile.get("followerCount") or  # Apify's actual key
-            scraped_profile.get("followersCount") or 
-            scraped_profile.get("followers") or 
-            "Unknown"
-        )
-        connections = (
-            scraped_profile.get("connectionsCount") or 
-            scraped_profile.get("connections") or 
-            "Unknown"
+        try:
+            contents = await self._invoke_llm(prompt_vars)
+        except CircuitOpenError:
+            return self._outage_result(prompt_vars)
+        
+        return self._parse_response(contents, prompt_vars, cache_key, embedding)
+    
+    async def stream_score_profile(
+        self,
+        scraped_profile: dict[str, Any],
+        target_group: str,
+        linkedin_url: str = "",
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Score a profile, yielding result fields as soon as they are generated.
+        
+        Each yielded dict holds the top-level fields completed since the
+        previous one, in whichever order the section groups generate them
+        (the precomputed sections come first); merged together they equal
+        the ascore_profile result.
+        """
+        prompt_vars = self._build_prompt_vars(scraped_profile, target_group, linkedin_url)
+        cached, cache_key, embedding = await self._lookup_cached(prompt_vars)
+        if cached is not None:
+            yield cached
+            return
+        if self.breaker.is_open:
+            yield self._outage_result(prompt_vars)
+            return
+        
+        yield prompt_vars["precomputed"]
+        
+        # Each group streams into one queue; None marks all groups finished
+        fields: asyncio.Queue = asyncio.Queue()
+        
+        async def stream_group(chain) -> str:
+            buffer = ""
+            async for chunk in chain.astream(prompt_vars):
+                buffer += chunk.content
+                partial = parse_partial_json(buffer)
+                if isinstance(partial, dict):
+                    # The last key may still be mid-value; everything before it is final
+                    fields.put_nowait(dict(list(partial.items())[:-1]))
+            return buffer
+        
+        tasks = [asyncio.create_task(stream_group(chain)) for chain in self._chains()]
+        streams = asyncio.gather(*tasks)
+        streams.add_done_callback(lambda _: fields.put_nowait(None))
+        emitted: set[str] = set(prompt_vars["precomputed"])
+        try:
+            while (partial := await fields.get()) is not None:
+                completed = {key: value for key, value in partial.items() if key not in emitted}
+                if completed:
+                    emitted.update(completed)
+                    yield completed
+            contents = await streams
+        except Exception:
+            # Fields may already be out, so a stream is not retried; it still counts
+            self.breaker.record_failure()
+            raise
+        finally:
+            for task in tasks:
+                task.cancel()
+        self.breaker.record_success()
+        
+        result = self._parse_response(contents, prompt_vars, cache_key, embedding)
+        remaining = {key: value for key, value in result.items() if key not in emitted}
+        if remaining:
+            yield remaining
+    
+    async def score_profiles(
+        self,
+        profiles: list[dict[str, Any]],
+        target_group: str,
+    ) -> list[dict[str, Any]]:
+        """
+        Score many profiles, sending only cache misses to the model.
+        
+        Requests share the model's connection pool, with at most
+        settings.openai_concurrency profiles (each one call per section
+        group) in flight, and are retried like ascore_profile. A profile whose request or parse fails gets the
+        fallback result instead of failing the batch.
+        """
+        inputs = [self._build_prompt_vars(profile, target_group) for profile in profiles]
+        keys = [self.cache.make_key(prompt_vars) for prompt_vars in inputs]
+        results: list[Optional[dict[str, Any]]] = [self.cache.get(key) for key in keys]
+        
+        # Only cache misses go to the model
+        pending = [i for i, result in enumerate(results) if result is None]
+        semaphore = asyncio.Semaphore(settings.openai_concurrency)
+        
+        async def invoke_one(prompt_vars: dict[str, Any]):
+            async with semaphore:
+                return await self._invoke_llm(prompt_vars)
+        
+        responses = await asyncio.gather(
+            *(invoke_one(inputs[i]) for i in pending), return_exceptions=True
         )
         
-        # Invoke the LLM
-        chain = prompt | self.llm
-        
-        response = chain.invoke({
-            "target_group": target_readable,
-            "linkedin_url": linkedin_url or scraped_profile.get("url", "Unknown"),
-            "first_name": scraped_profile.get("firstName", "Unknown"),
-            "last_name": scraped_profile.get("lastName", ""),
-            "headline": scraped_profile.get("headline", "No headline"),
-            "about": scraped_profile.get("about", scraped_profile.get("summary", "No about section")),
-            "connections": connections,
-            "followers": followers,
-            "location": scraped_profile.get("geoLocationName", scraped_profile.get("location", "Unknown")),
-            "experience": experience_str,
-            "education": education_str,
-            "skills": skills_str,
-            "certifications": certs_str,
-            "has_profile_pic": has_profile_pic,
-            "has_cover_image": has_cover_image,
-            "is_verified": is_verified,
-            "is_premium": is_premium,
-        })
-        
-        # Parse the JSON response
+        for i, response in zip(pending, responses):
+            if isinstance(response, Exception):
+                results[i] = _with_precomputed(_fallback_result(inputs[i]["linkedin_url"]), inputs[i])
+            else:
+                results[i] = self._parse_response(response, inputs[i], keys[i])
+        return results
+    
+    async def _invoke_llm(self, prompt_vars: dict[str, Any]) -> list[str]:
+        """
+        Score all section groups in parallel; returns their raw replies.
+        
+        Each call is retried on its own; the circuit breaker counts the
+        profile as one request. Raises CircuitOpenError without calling the
+        model while the circuit is open.
+        """
+        if self.breaker.is_open:
+            raise CircuitOpenError("AI scoring circuit is open")
+        
+        try:
+            contents = await asyncio.gather(
+                *(self._invoke_chain(chain, prompt_vars) for chain in self._chains())
+            )
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return contents
+    
+    async def _invoke_chain(self, chain, prompt_vars: dict[str, Any]) -> str:
+        """
+        Call one section group's chain, retrying transient errors.
+        
+        Transient errors are retried up to LLM_MAX_ATTEMPTS times with
+        backoff; other errors are raised at once.
+        """
+        for attempt in range(LLM_MAX_ATTEMPTS):
+            try:
+                response = await chain.ainvoke(prompt_vars)
+            except Exception as e:
+                if not _is_retryable(e) or attempt + 1 >= LLM_MAX_ATTEMPTS:
+                    raise
+                delay = _retry_delay(e, attempt)
+                log_warning("ai_scoring", f"Scoring call failed, retrying in {delay:.1f}s", {
+                    "attempt": attempt + 1,
+                    "error": str(e),
+                })
+                await asyncio.sleep(delay)
+            else:
+                return response.content
+    
+    def _outage_result(self, prompt_vars: dict[str, Any]) -> dict[str, Any]:
+        """
+        Neutral fallback result while the model is unreachable.
+        
+        Semantic matches were already tried by _lookup_cached at the normal
+        threshold. Not cached, so scoring resumes normally once the circuit
+        closes.
+        """
+        log_warning("ai_scoring", "Circuit open, skipping the model")
+        return _with_precomputed(_fallback_result(prompt_vars["linkedin_url"]), prompt_vars)
+    
+    def _chains(self) -> tuple:
+        """
+        Get the prompt | llm chain of each section group for the running call.
+        
+        Inside the sync score_profile these are the call's own chains.
+        Otherwise all models share one pooled keep-alive HTTP/2 client across
+        the requests on the serving loop. Connections cannot outlive their
+        loop, so if the loop changes the old client is closed (on its loop,
+        if still running) and the models and client are recreated.
+        """
+        scoped = _scoped_chains.get()
+        if scoped is not None:
+            return scoped
+        loop = asyncio.get_running_loop()
+        if not self.chains or self._llm_loop is not loop:
+            old_client, old_loop = self._http_client, self._llm_loop
+            if old_client is not None and old_loop is not None and old_loop.is_running():
+                asyncio.run_coroutine_threadsafe(old_client.aclose(), old_loop)
+            self._http_client = _new_http_client()
+            self.chains = _build_chains(self._http_client)
+            self._llm_loop = loop
+        return self.chains
+    
+    async def aclose(self) -> None:
+        """Close the pooled client if it belongs to the running loop."""
+        if self._http_client is not None and self._llm_loop is asyncio.get_running_loop():
+            await self._http_client.aclose()
+            self._http_client = None
+            self.chains = ()
+            self._llm_loop = None
+    
+    async def warm_up(self) -> None:
+        """
+        Build the chains and open a connection to the model API.
+        
+        Run on the serving loop at startup, so the first scoring request
+        skips client setup and the TLS handshake. Skipped when the configured
+        provider has no API key; failures are only logged, so startup never
+        depends on the model API.
+        """
+        if settings.scoring_model.startswith(GROQ_MODEL_PREFIX):
+            url, api_key = GROQ_MODELS_URL, settings.groq_api_key
+        else:
+            url, api_key = OPENAI_MODELS_URL, settings.openai_api_key
+        if not api_key:
+            return
+        try:
+            self._chains()
+            await self._http_client.get(url, headers={"Authorization": f"Bearer {api_key}"})
+        except Exception as e:
+            log_warning("ai_scoring", f"Scoring API warm-up failed: {str(e)}")
+    
+    async def _lookup_cached(
+        self,
+        prompt_vars: dict[str, Any],
+    ) -> tuple[Optional[dict[str, Any]], str, Any]:
+        """
+        Check the exact and semantic caches for a profile.
+        
+        Returns (cached result or None, exact cache key, profile embedding);
+        the embedding is only set on a semantic miss, for storing the result.
+        """
+        cache_key = self.cache.make_key(prompt_vars)
+        cached = self.cache.get(cache_key)
+        if cached is not None or self.semantic_cache is None:
+            return cached, cache_key, None
+        
         try:
-            result = json.loads(response.content)
-        except json.JSONDecodeError:
-            # Fallback if JSON parsing fails
-            result = {
-                "LinkedIn URL": linkedin_url,
-                "Headline Score": 5,
-                "Connection Count Score": 5,
-                "Follower Count Score": 5,
-                "About Score": 5,
-                "Profile Pic Score": 5,
-                "Cover_picture Score": 5,
-                "Experience Score": 5,
-                "Education Score": 5,
-                "Skills Score": 5,
-                "Licenses & Certifications Score": 5,
-                "is Verified Score": 5,
-                "is Premium Score": 5,
-                "Cumulative Sum of Score(100)": 60,
-                "Headline Reasoning": "Unable to parse AI response",
-                "Connection Reasoning": "Unable to parse AI response",
-                "Follower Reasoning": "Unable to parse AI response",
-                "About Reasoning": "Unable to parse AI response",
-                "Profile Pic Reasoning": "Unable to parse AI response",
-                "Cover_picture Reasoning": "Unable to parse AI response",
-                "Experience Reasoning": "Unable to parse AI response",
-                "Education Reasoning": "Unable to parse AI response",
-                "Skills Reasoning": "Unable to parse AI response",
-                "Licenses & Certifications Reasoning": "Unable to parse AI response",
-                "Cumulative Sum Reasoning": "AI response could not be parsed. Please try again.",
-            }
+            embedding = await self.semantic_cache.embed(prompt_vars)
+        except Exception as e:
+            log_warning("ai_scoring", f"Profile embedding failed: {str(e)}")
+            return None, cache_key, None
+        
+        similar = self.semantic_cache.get(prompt_vars["target_group"], embedding)
+        if similar is None:
+            return None, cache_key, embedding
+        
+        result = _with_precomputed(_reused_result(similar, prompt_vars["linkedin_url"]), prompt_vars)
+        self.cache.set(cache_key, result)
+        return result, cache_key, None
+    
+    def _parse_response(
+        self,
+        contents: list[str],
+        prompt_vars: dict[str, Any],
+        cache_key: str,
+        embedding: Any = None,
+    ) -> dict[str, Any]:
+        """
+        Merge the section groups' JSON replies and add the precomputed sections.
         
+        Complete results are cached. A group whose reply cannot be parsed
+        keeps the neutral fallback scores for its sections, and the result
+        is not cached.
+        """
+        result = {"LinkedIn URL": prompt_vars["linkedin_url"]}
+        parsed = True
+        for content in contents:
+            try:
+                result.update(orjson.loads(content))
+            except orjson.JSONDecodeError:
+                parsed = False
+        if not parsed:
+            fallback = _fallback_result(prompt_vars["linkedin_url"])
+            return _with_precomputed({**fallback, **result}, prompt_vars)
+        
+        result = _with_precomputed(result, prompt_vars)
+        self.cache.set(cache_key, result)
+        if embedding is not None:
+            self.semantic_cache.set(prompt_vars["target_group"], embedding, result)
         return result
+    
+    @staticmethod
+    def _build_prompt_vars(
+        scraped_profile: dict[str, Any],
+        target_group: str,
+        linkedin_url: str = "",
+    ) -> dict[str, Any]:
+        """Format a scraped profile into the prompt template variables."""
+        profile_vars = _profile_prompt_vars(
+            orjson.dumps(scraped_profile, option=orjson.OPT_SORT_KEYS, default=str)
+        )
+        return {
+            **profile_vars,
+            "target_group": TARGET_GROUP_LABELS.get(target_group, target_group),
+            "linkedin_url": linkedin_url or profile_vars["linkedin_url"],
+        }
+
+
+@lru_cache(maxsize=1024)
+def _profile_prompt_vars(profile_json: bytes) -> dict[str, Any]:
+    """
+    Profile prompt variables, memoized on the canonical JSON of the profile.
+    
+    Scoring one profile for several target groups formats it once. The
+    returned dict is shared between calls; callers copy it, never mutate.
+    """
+    return ProfileView.model_validate_json(profile_json).to_prompt_vars()
+
+
+def _with_precomputed(result: dict[str, Any], prompt_vars: dict[str, Any]) -> dict[str, Any]:
+    """Merge the precomputed section scores into a result and recompute the sum."""
+    merged = {**result, **prompt_vars["precomputed"]}
+    merged["Cumulative Sum of Score(100)"] = sum(
+        value for value in map(merged.get, SECTION_SCORE_KEYS) if isinstance(value, (int, float))
+    )
+    return merged
+
+
+def _reused_result(scores: dict[str, Any], linkedin_url: str) -> dict[str, Any]:
+    """Semantic-cache scores of a near-duplicate profile, with generic reasoning."""
+    return {
+        "LinkedIn URL": linkedin_url,
+        **scores,
+        **dict.fromkeys(MODEL_REASONING_KEYS, "Scored from a closely matching profile"),
+    }
+
+
+def _fallback_result(linkedin_url: str) -> dict[str, Any]:
+    """Neutral scores returned when the AI response is unusable."""
+    return {
+        "LinkedIn URL": linkedin_url,
+        "Headline Score": 5,
+        "Connection Count Score": 5,
+        "Follower Count Score": 5,
+        "About Score": 5,
+        "Profile Pic Score": 5,
+        "Cover_picture Score": 5,
+        "Experience Score": 5,
+        "Education Score": 5,
+        "Skills Score": 5,
+        "Licenses & Certifications Score": 5,
+        "is Verified Score": 5,
+        "is Premium Score": 5,
+        "Cumulative Sum of Score(100)": 60,
+        "Headline Reasoning": "Unable to parse AI response",
+        "Connection Reasoning": "Unable to parse AI response",
+        "Follower Reasoning": "Unable to parse AI response",
+        "About Reasoning": "Unable to parse AI response",
+        "Profile Pic Reasoning": "Unable to parse AI response",
+        "Cover_picture Reasoning": "Unable to parse AI response",
+        "Experience Reasoning": "Unable to parse AI response",
+        "Education Reasoning": "Unable to parse AI response",
+        "Skills Reasoning": "Unable to parse AI response",
+        "Licenses & Certifications Reasoning": "Unable to parse AI response",
+        "Cumulative Sum Reasoning": "AI response could not be parsed. Please try again.",
+    }
 
 
 # Singleton instance
@@ -375,3 +1172,14 @@ def get_scoring_service() -> OpenAIScoringService:
     if _scoring_service is None:
         _scoring_service = OpenAIScoringService()
     return _scoring_service
+
+
+async def warm_scoring_service() -> None:
+    """Create the singleton and warm its connection (called on application startup)."""
+    await get_scoring_service().warm_up()
+
+
+async def close_scoring_service() -> None:
+    """Close the singleton's pooled client (called on application shutdown)."""
+    if _scoring_service is not None:
+        await _scoring_service.aclose()
@@ -10,151 +10,87 @@ Supports two backends:
 2. WeasyPrint (pure Python fallback, no external API)
 """
 
+import asyncio
 import base64
+import gzip
+import hashlib
+import io
+import os
+import random
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Optional
+from string import Formatter
+from typing import Any, Iterator, Optional
 import httpx
+import orjson
 
 from app.config import settings
+from app.services.logger import log_warning
 
 
-class PDFService:
-    """
-    Standalone PDF generation service.
-    
-    NOT part of the agentic workflow - called on-demand only.
-    """
-    
-    def __init__(self):
-        self._pdfshift_api_key = getattr(settings, 'pdfshift_api_key', None)
-        self._pdfshift_base_url = "https://api.pdfshift.io/v3"
-    
-    def generate_report_html(
-        self,
-        scores: dict[str, Any],
-        profile: dict[str, Any],
-        user_id: str,
-    ) -> str:
-        """
-        Generate styled HTML report from scoring data.
-        
-        Args:
-            scores: Pre-scores or AI scores dict
-            profile: Profile information dict
-            user_id: User ID for the report
-            
-        Returns:
-            Complete HTML string ready for PDF conversion
-        """
-        # Extract data
-        first_name = profile.get("firstName", "") or profile.get("first_name", "") or "User"
-        
-        # Handle both pre-score format and legacy AI score format
-        final_score = scores.get("Final Score", scores.get("Cumulative Sum of Score (out of 100)", 0))
-        
-        # Section scores (1-10 scale from new system)
-        section_scores = {
-            "headline": scores.get("Headline Score", 5),
-            "connections": scores.get("Connection Score", 5),
-            "followers": scores.get("Follower Score", 5),
-            "about": scores.get("About Score", 5),
-            "profile_pic": scores.get("Profile Pic Score", 5),
-            "cover_picture": scores.get("Cover_picture Score", 5),
-            "experience": scores.get("Experience Score", 5),
-            "education": scores.get("Education Score", 5),
-            "skills": scores.get("Skills Score", 5),
-            "licenses_certs": scores.get("Licenses & Certifications Score", 5),
-            "verified": scores.get("Is Verified Score", 5),
-            "premium": scores.get("Is Premium Score", 5),
-        }
-        
-        # Get debug info if available
-        debug = scores.get("_debug", {})
-        sections_detail = debug.get("sections", {})
-        
-        # Determine grade label
-        if final_score >= 8:
-            grade_label = "Excellent"
-            grade_color = "#10b981"
-        elif final_score >= 6:
-            grade_label = "Good"
-            grade_color = "#3b82f6"
-        elif final_score >= 4:
-            grade_label = "Needs Work"
-            grade_color = "#f59e0b"
-        else:
-            grade_label = "Critical"
-            grade_color = "#ef4444"
-        
-        # Build section rows
-        section_rows = self._build_section_rows(section_scores, sections_detail)
-        
-        # Build recommendations
-        recommendations = self._build_recommendations(sections_detail)
-        
-        html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>LinkedIn Profile Audit - {first_name}</title>
-    <style>
-        * {{
+# Report stylesheet. It is static, so it lives here instead of being rebuilt
+# inside every report's f-string; grade-colored rules are added per report.
+REPORT_CSS = """\
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
             padding: 40px;
             color: #1f2937;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 850px;
             margin: 0 auto;
             background: white;
             border-radius: 16px;
             box-shadow: 0 25px 50px -12px rgba(0, 0, 0, 0.25);
             overflow: hidden;
-        }}
+        }
         
-        .header {{
+        .header {
             background: linear-gradient(135deg, #0A66C2 0%, #0077B5 100%);
             color: white;
             padding: 40px;
             text-align: center;
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             font-size: 28px;
             margin-bottom: 8px;
             font-weight: 700;
-        }}
+        }
         
-        .header .subtitle {{
+        .header .subtitle {
             font-size: 16px;
             opacity: 0.9;
-        }}
+        }
         
-        .header .meta {{
+        .header .meta {
             margin-top: 12px;
             font-size: 13px;
             opacity: 0.7;
-        }}
+        }
         
-        .score-hero {{
+        .score-hero {
             text-align: center;
             padding: 40px;
             background: #f8fafc;
             border-bottom: 1px solid #e2e8f0;
-        }}
+        }
         
-        .score-circle {{
+        .score-circle {
             width: 160px;
             height: 160px;
             border-radius: 50%;
@@ -165,119 +101,266 @@ class PDFService:
             justify-content: center;
             background: white;
             box-shadow: 0 10px 40px rgba(0,0,0,0.1);
-            border: 6px solid {grade_color};
-        }}
+        }
         
-        .score-number {{
+        .score-number {
             font-size: 52px;
             font-weight: 800;
-            color: {grade_color};
             line-height: 1;
-        }}
+        }
         
-        .score-max {{
+        .score-max {
             font-size: 14px;
             color: #64748b;
-        }}
+        }
         
-        .score-label {{
+        .score-label {
             font-size: 18px;
             font-weight: 600;
-            color: {grade_color};
             margin-top: 8px;
-        }}
+        }
         
-        .content {{
+        .content {
             padding: 32px 40px;
-        }}
+        }
         
-        h2 {{
+        h2 {
             font-size: 20px;
             color: #0A66C2;
             margin: 32px 0 16px;
             padding-bottom: 8px;
             border-bottom: 2px solid #e2e8f0;
-        }}
+        }
         
-        h2:first-child {{
+        h2:first-child {
             margin-top: 0;
-        }}
+        }
         
-        .scores-table {{
+        .scores-table {
             width: 100%;
             border-collapse: collapse;
             margin: 16px 0;
-        }}
+        }
         
         .scores-table th,
-        .scores-table td {{
+        .scores-table td {
             padding: 12px;
             text-align: left;
             border-bottom: 1px solid #e2e8f0;
-        }}
+        }
         
-        .scores-table th {{
+        .scores-table th {
             background: #f8fafc;
             font-weight: 600;
             color: #334155;
             font-size: 13px;
-        }}
+        }
         
-        .scores-table td:nth-child(2) {{
+        .scores-table td:nth-child(2) {
             text-align: center;
             width: 80px;
-        }}
+        }
         
-        .score-badge {{
+        .score-badge {
             display: inline-block;
             padding: 4px 10px;
             border-radius: 12px;
             font-weight: 600;
             font-size: 13px;
-        }}
+        }
         
-        .score-good {{ background: #dcfce7; color: #166534; }}
-        .score-avg {{ background: #fef3c7; color: #92400e; }}
-        .score-low {{ background: #fee2e2; color: #991b1b; }}
+        .score-good { background: #dcfce7; color: #166534; }
+        .score-avg { background: #fef3c7; color: #92400e; }
+        .score-low { background: #fee2e2; color: #991b1b; }
         
-        .recommendations {{
+        .recommendations {
             background: #f0f9ff;
             border-left: 4px solid #0A66C2;
             padding: 20px;
             margin: 24px 0;
             border-radius: 0 8px 8px 0;
-        }}
+        }
         
-        .recommendations h3 {{
+        .recommendations h3 {
             font-size: 16px;
             color: #0A66C2;
             margin-bottom: 12px;
-        }}
+        }
         
-        .recommendations ul {{
+        .recommendations ul {
             margin: 0;
             padding-left: 20px;
-        }}
+        }
         
-        .recommendations li {{
+        .recommendations li {
             margin: 8px 0;
             line-height: 1.5;
             color: #475569;
-        }}
+        }
         
-        .footer {{
+        .footer {
             text-align: center;
             padding: 24px;
             background: #f8fafc;
             color: #64748b;
             font-size: 13px;
             border-top: 1px solid #e2e8f0;
-        }}
+        }
         
-        .footer a {{
+        .footer a {
             color: #0A66C2;
             text-decoration: none;
-        }}
+        }
+"""
+
+# A gzip-encoded body was rejected: 415, or a 400 whose error names the encoding
+_GZIP_REJECTED_MARKERS = (b"encoding", b"gzip")
+
+
+async def _gzip_rejected(response: httpx.Response) -> bool:
+    """Whether a (streamed) response rejects the gzip request encoding."""
+    if response.status_code == 415:
+        return True
+    if response.status_code != 400:
+        return False
+    body = (await response.aread()).lower()
+    return any(marker in body for marker in _GZIP_REJECTED_MARKERS)
+
+# A slow PDFShift instance fails the attempt instead of holding a worker
+PDFSHIFT_TIMEOUT = httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0)
+PDFSHIFT_MAX_ATTEMPTS = 3
+# Client errors worth retrying (plus all 5xx)
+_RETRYABLE_CLIENT_ERRORS = frozenset({408, 429})
+
+
+def _retry_delay(attempt: int, base: float = 1.0, cap: float = 10.0) -> float:
+    """Exponential backoff with up to 50% jitter for retry number `attempt`."""
+    return min(base * 2 ** attempt, cap) * (1 + random.uniform(0, 0.5))
+
+
+# Read size for streamed PDF responses
+PDF_CHUNK_SIZE = 64 * 1024
+# Larger responses are treated as malformed rather than buffered
+MAX_PDF_BYTES = 25_000_000
+
+# Reports with HTML built ahead of conversion in generate_reports_pipeline
+PIPELINE_QUEUE_SIZE = 4
+
+
+async def _read_body(response: httpx.Response) -> bytes:
+    """
+    Read a streamed response body in PDF_CHUNK_SIZE chunks.
+    
+    Raises once the body is (or is declared to be) over MAX_PDF_BYTES.
+    """
+    if int(response.headers.get("content-length", "0")) > MAX_PDF_BYTES:
+        raise Exception(f"PDF response too large: {response.headers['content-length']} bytes")
+    buffer = bytearray()
+    async for chunk in response.aiter_bytes(PDF_CHUNK_SIZE):
+        buffer += chunk
+        if len(buffer) > MAX_PDF_BYTES:
+            raise Exception(f"PDF response larger than {MAX_PDF_BYTES} bytes")
+    return bytes(buffer)
+
+
+# Report section key -> score field in the scores dict
+SECTION_SCORE_FIELDS = (
+    ("headline", "Headline Score"),
+    ("connections", "Connection Score"),
+    ("followers", "Follower Score"),
+    ("about", "About Score"),
+    ("profile_pic", "Profile Pic Score"),
+    ("cover_picture", "Cover_picture Score"),
+    ("experience", "Experience Score"),
+    ("education", "Education Score"),
+    ("skills", "Skills Score"),
+    ("licenses_certs", "Licenses & Certifications Score"),
+    ("verified", "Is Verified Score"),
+    ("premium", "Is Premium Score"),
+)
+
+# Report table rows, in display order
+SECTION_NAMES = {
+    "headline": "🎯 Headline",
+    "about": "📝 About",
+    "experience": "💼 Experience",
+    "education": "🎓 Education",
+    "skills": "🛠️ Skills",
+    "licenses_certs": "🏆 Certifications",
+    "connections": "🤝 Connections",
+    "followers": "👥 Followers",
+    "profile_pic": "📸 Profile Photo",
+    "cover_picture": "🖼️ Cover Image",
+    "verified": "✅ Verified",
+    "premium": "💎 Premium",
+}
+
+# All table rows in one format string, labels filled in at import; each
+# report fills every section's badge class, score and status in one call
+SECTION_ROWS_TEMPLATE = "\n".join(
+    f'''
+                <tr>
+                    <td>{label}</td>
+                    <td><span class="score-badge {{{key}_badge}}">{{{key}_score:.1f}}</span></td>
+                    <td>{{{key}_status}}</td>
+                </tr>
+            '''
+    for key, label in SECTION_NAMES.items()
+)
+
+# (badge class, status) per whole section score, 0-10
+_SECTION_GRADES = (
+    (("score-low", "Critical"),) * 4
+    + (("score-avg", "Needs Work"),) * 3
+    + (("score-good", "Optimized"),) * 4
+)
+
+# (grade label, grade colour) per whole final score, 0-10
+_REPORT_GRADES = (
+    (("Critical", "#ef4444"),) * 4
+    + (("Needs Work", "#f59e0b"),) * 2
+    + (("Good", "#3b82f6"),) * 2
+    + (("Excellent", "#10b981"),) * 3
+)
+
+
+def _grade_index(score: float) -> int:
+    """Index into the grade tables: the whole part of score, clamped to 0-10."""
+    return min(max(int(score), 0), 10)
+
+
+MAX_RECOMMENDATIONS = 5
+
+# A reason is actionable if it mentions something missing ("missing", "no ")
+_ACTIONABLE_REASON_RE = re.compile(r"missing|no ", re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def _section_title(key: str) -> str:
+    """Display title of a section key ("licenses_certs" -> "Licenses Certs")."""
+    return key.replace("_", " ").title()
+
+
+# Shown when no section has an actionable reason
+DEFAULT_RECOMMENDATIONS = (
+    "<li>Add quantified achievements to your headline</li>",
+    "<li>Include metrics in your experience descriptions</li>",
+    "<li>Expand your skills section with relevant keywords</li>",
+)
+
+
+# Full report page. {css} and the grade fields are filled once per grade by
+# _report_shell; the remaining fields are filled per report
+REPORT_TEMPLATE = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>LinkedIn Profile Audit - {first_name}</title>
+    <style>
+{css}
+        .score-circle {{ border: 6px solid {grade_color}; }}
+        .score-number, .score-label {{ color: {grade_color}; }}
     </style>
 </head>
 <body>
@@ -285,7 +368,7 @@ class PDFService:
         <div class="header">
             <h1>🔍 LinkedIn Profile Audit Report</h1>
             <p class="subtitle">Personalized analysis for {first_name}</p>
-            <p class="meta">Report ID: {user_id} | Generated: {datetime.now().strftime("%B %d, %Y")}</p>
+            <p class="meta">Report ID: {user_id} | Generated: {date}</p>
         </div>
         
         <div class="score-hero">
@@ -317,13 +400,328 @@ class PDFService:
         
         <div class="footer">
             <p>Generated by <a href="#">LinkifyMe</a> | Your LinkedIn Profile Optimization Partner</p>
-            <p style="margin-top: 8px;">© {datetime.now().year} LinkifyMe. All rights reserved.</p>
+            <p style="margin-top: 8px;">© {year} LinkifyMe. All rights reserved.</p>
         </div>
     </div>
 </body>
 </html>'''
+
+
+@lru_cache(maxsize=8)
+def _report_shell(
+    grade_label: str,
+    grade_color: str,
+    inline_css: bool = True,
+) -> tuple[tuple[str, Optional[str], str], ...]:
+    """
+    REPORT_TEMPLATE with the stylesheet (unless inline_css is False) and
+    grade filled in.
+    
+    Returned as (literal text, field name, format spec) parts, one per
+    per-report field; the last part has no field. With four grade buckets,
+    the stylesheet is formatted at most four times per process.
+    """
+    fixed = {"css": REPORT_CSS if inline_css else "", "grade_label": grade_label, "grade_color": grade_color}
+    parts = []
+    text = ""
+    for literal, field, spec, _ in Formatter().parse(REPORT_TEMPLATE):
+        text += literal
+        if field is None:
+            continue
+        if field in fixed:
+            text += format(fixed[field], spec)
+        else:
+            parts.append((text, field, spec))
+            text = ""
+    parts.append((text, None, ""))
+    return tuple(parts)
+
+
+@lru_cache(maxsize=8)
+def _report_shell_bytes(
+    grade_label: str,
+    grade_color: str,
+    inline_css: bool = True,
+) -> tuple[tuple[bytes, Optional[str], str], ...]:
+    """_report_shell with the literal text pre-encoded as UTF-8."""
+    return tuple(
+        (text.encode(), field, spec)
+        for text, field, spec in _report_shell(grade_label, grade_color, inline_css)
+    )
+
+
+@lru_cache(maxsize=1)
+def _weasyprint_assets():
+    """Font configuration and parsed REPORT_CSS, built once per worker process."""
+    from weasyprint import CSS
+    from weasyprint.text.fonts import FontConfiguration
+    
+    font_config = FontConfiguration()
+    return font_config, CSS(string=REPORT_CSS, font_config=font_config)
+
+
+def _render_weasyprint(html: str | bytes) -> bytes:
+    """
+    Render HTML to PDF bytes with WeasyPrint (runs in a worker process).
+    
+    REPORT_CSS is applied from the cached parsed stylesheet, so the HTML
+    can leave it out (generate_report_html(..., inline_css=False)).
+    UTF-8 bytes from generate_report_html_bytes are parsed as-is.
+    """
+    try:
+        from weasyprint import HTML
+    except ImportError:
+        raise ImportError(
+            "WeasyPrint not installed. Install with: pip install weasyprint\n"
+            "Or configure PDFSHIFT_API_KEY for cloud PDF generation."
+        )
+    font_config, stylesheet = _weasyprint_assets()
+    if isinstance(html, bytes):
+        document = HTML(file_obj=io.BytesIO(html), encoding="utf-8")
+    else:
+        document = HTML(string=html)
+    return document.write_pdf(stylesheets=[stylesheet], font_config=font_config)
+
+
+# WeasyPrint layout is CPU-bound and holds the GIL, so it runs in worker
+# processes; created on first use, one worker per CPU
+_render_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    """Get the shared WeasyPrint worker pool."""
+    global _render_pool
+    if _render_pool is None:
+        _render_pool = ProcessPoolExecutor()
+    return _render_pool
+
+
+class ReportCache:
+    """
+    TTL cache of generated PDFs keyed by report content.
+    
+    The key covers everything the report is rendered from, including the
+    date printed on it, so a re-export on the same day returns the same
+    PDF without rendering. Recent PDFs are kept in memory (the oldest
+    entry is evicted once maxsize is reached); with a directory, every
+    PDF is also written to <directory>/<key>.pdf so re-exports survive
+    restarts and are shared between workers. Reports hold personal data,
+    so the directory and files are only accessible to the owner.
+    """
+    
+    def __init__(
+        self,
+        maxsize: int = 64,
+        ttl_seconds: float = 24 * 3600,
+        directory: Optional[Path] = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.directory = directory
+        self._entries: dict[str, tuple[float, bytes]] = {}
+        self._next_prune = 0.0
+    
+    @staticmethod
+    def make_key(scores: dict[str, Any], profile: dict[str, Any], user_id: str) -> str:
+        """BLAKE2b of the canonical JSON report inputs and today's date."""
+        canonical = orjson.dumps(
+            [scores, profile, user_id, datetime.now().strftime("%Y-%m-%d")],
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        )
+        return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached PDF bytes, or None if missing/expired."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] >= time.monotonic():
+            return entry[1]
+        self._entries.pop(key, None)
+        
+        if self.directory is None:
+            return None
+        path = self.directory / f"{key}.pdf"
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age > self.ttl_seconds:
+                return None
+            pdf_bytes = path.read_bytes()
+        except OSError:
+            return None
+        self._remember(key, pdf_bytes, self.ttl_seconds - age)
+        return pdf_bytes
+    
+    def set(self, key: str, pdf_bytes: bytes) -> None:
+        """Store a PDF in memory and, if configured, on disk."""
+        self._remember(key, pdf_bytes, self.ttl_seconds)
+        if self.directory is None:
+            return
+        try:
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # Write then rename, so readers never see a partial file
+            tmp_path = self.directory / f"{key}.{os.getpid()}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(pdf_bytes)
+            os.replace(tmp_path, self.directory / f"{key}.pdf")
+            self._prune()
+        except OSError as e:
+            log_warning("pdf", f"⚠️ Could not write PDF cache: {e}", {"key": key})
+    
+    def _remember(self, key: str, pdf_bytes: bytes, ttl_seconds: float) -> None:
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + ttl_seconds, pdf_bytes)
+    
+    def _prune(self) -> None:
+        """Delete expired PDFs from disk, at most once an hour."""
+        now = time.time()
+        if now < self._next_prune:
+            return
+        self._next_prune = now + 3600
+        for path in self.directory.glob("*.pdf"):
+            try:
+                if now - path.stat().st_mtime > self.ttl_seconds:
+                    path.unlink()
+            except OSError:
+                continue
+
+
+class PDFService:
+    """
+    Standalone PDF generation service.
+    
+    NOT part of the agentic workflow - called on-demand only.
+    """
+    
+    def __init__(self):
+        self._pdfshift_api_key = getattr(settings, 'pdfshift_api_key', None)
+        self._pdfshift_base_url = "https://api.pdfshift.io/v3"
+        self._pdfshift_headers = {
+            "Authorization": "Basic " + base64.b64encode(f"api:{self._pdfshift_api_key}".encode()).decode(),
+            "Content-Type": "application/json",
+        }
+        # Cleared if PDFShift turns out not to accept compressed bodies
+        self._pdfshift_gzip = True
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.cache = ReportCache(
+            directory=Path(settings.pdf_cache_dir) if settings.pdf_cache_dir else None
+        )
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled keep-alive client for the running event loop.
+        
+        Connections cannot outlive their loop, so a new client is created
+        whenever the loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=PDFSHIFT_TIMEOUT,
+                limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=30.0),
+                http2=True,
+            )
+            self._client_loop = loop
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the pooled client if it belongs to the running loop."""
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+    
+    def generate_report_html(
+        self,
+        scores: dict[str, Any],
+        profile: dict[str, Any],
+        user_id: str,
+        inline_css: bool = True,
+    ) -> str:
+        """
+        Generate styled HTML report from scoring data.
+        
+        Args:
+            scores: Pre-scores or AI scores dict
+            profile: Profile information dict
+            user_id: User ID for the report
+            inline_css: Embed REPORT_CSS; the WeasyPrint renderer applies
+                its cached copy instead
+            
+        Returns:
+            Complete HTML string ready for PDF conversion
+        """
+        grade_label, grade_color, values = self._report_values(scores, profile, user_id)
+        shell = _report_shell(grade_label, grade_color, inline_css)
+        return "".join(
+            text + (format(values[field], spec) if field else "")
+            for text, field, spec in shell
+        )
+    
+    def generate_report_html_bytes(
+        self,
+        scores: dict[str, Any],
+        profile: dict[str, Any],
+        user_id: str,
+        inline_css: bool = True,
+    ) -> bytes:
+        """
+        generate_report_html, emitted directly as UTF-8 bytes.
+        
+        The static template text is encoded once per grade; only the
+        per-report values are encoded on each call.
+        """
+        grade_label, grade_color, values = self._report_values(scores, profile, user_id)
+        shell = _report_shell_bytes(grade_label, grade_color, inline_css)
+        return b"".join(
+            text + (format(values[field], spec).encode() if field else b"")
+            for text, field, spec in shell
+        )
+    
+    def _report_values(
+        self,
+        scores: dict[str, Any],
+        profile: dict[str, Any],
+        user_id: str,
+    ) -> tuple[str, str, dict[str, Any]]:
+        """Grade label, grade colour and per-report template values."""
+        # Extract data
+        first_name = profile.get("firstName", "") or profile.get("first_name", "") or "User"
+        
+        # Handle both pre-score format and legacy AI score format
+        final_score = scores.get("Final Score", scores.get("Cumulative Sum of Score (out of 100)", 0))
+        
+        # Section scores (1-10 scale from new system)
+        section_scores = {key: scores.get(field, 5) for key, field in SECTION_SCORE_FIELDS}
+        
+        # Get debug info if available
+        debug = scores.get("_debug", {})
+        sections_detail = debug.get("sections", {})
         
-        return html
+        # Determine grade label
+        grade_label, grade_color = _REPORT_GRADES[_grade_index(final_score)]
+        
+        # Build section rows
+        section_rows = self._build_section_rows(section_scores, sections_detail)
+        
+        # Build recommendations
+        recommendations = self._build_recommendations(sections_detail)
+        
+        now = datetime.now()
+        
+        values = {
+            "first_name": first_name,
+            "user_id": user_id,
+            "date": f"{now:%B %d, %Y}",
+            "year": now.year,
+            "final_score": final_score,
+            "section_rows": section_rows,
+            "recommendations": recommendations,
+        }
+        return grade_label, grade_color, values
     
     def _build_section_rows(
         self,
@@ -331,70 +729,41 @@ class PDFService:
         details: dict[str, Any]
     ) -> str:
         """Build HTML table rows for section scores."""
-        section_names = {
-            "headline": "🎯 Headline",
-            "about": "📝 About",
-            "experience": "💼 Experience",
-            "education": "🎓 Education",
-            "skills": "🛠️ Skills",
-            "licenses_certs": "🏆 Certifications",
-            "connections": "🤝 Connections",
-            "followers": "👥 Followers",
-            "profile_pic": "📸 Profile Photo",
-            "cover_picture": "🖼️ Cover Image",
-            "verified": "✅ Verified",
-            "premium": "💎 Premium",
-        }
-        
-        rows = []
-        for key, label in section_names.items():
+        values = {}
+        for key in SECTION_NAMES:
             score = scores.get(key, 5)
             
             # Determine badge class
-            if score >= 7:
-                badge_class = "score-good"
-                status = "Optimized"
-            elif score >= 4:
-                badge_class = "score-avg"
-                status = "Needs Work"
-            else:
-                badge_class = "score-low"
-                status = "Critical"
+            badge_class, status = _SECTION_GRADES[_grade_index(score)]
             
-            rows.append(f'''
-                <tr>
-                    <td>{label}</td>
-                    <td><span class="score-badge {badge_class}">{score:.1f}</span></td>
-                    <td>{status}</td>
-                </tr>
-            ''')
+            values[f"{key}_badge"] = badge_class
+            values[f"{key}_score"] = score
+            values[f"{key}_status"] = status
         
-        return "\n".join(rows)
+        return SECTION_ROWS_TEMPLATE.format_map(values)
     
     def _build_recommendations(self, sections_detail: dict[str, Any]) -> str:
         """Build recommendation list items from section details."""
-        recommendations = []
+        # Stop scanning sections once enough recommendations are found
+        recommendations = list(islice(
+            self._iter_recommendations(sections_detail), MAX_RECOMMENDATIONS
+        ))
+        
+        # Default recommendations if none found
+        if not recommendations:
+            return "\n".join(DEFAULT_RECOMMENDATIONS)
         
-        # Collect all reasons from sections with lower scores
+        return "\n".join(recommendations)
+    
+    @staticmethod
+    def _iter_recommendations(sections_detail: dict[str, Any]) -> Iterator[str]:
+        """Yield a list item for each low-scoring section with an actionable first reason."""
         for key, detail in sections_detail.items():
             score = detail.get("after_rules", detail.get("raw", 5))
             reasons = detail.get("reasons", [])
             
-            if score < 6 and reasons:
-                # Get the first actionable reason
-                for reason in reasons[:1]:
-                    if "missing" in reason.lower() or "no " in reason.lower():
-                        recommendations.append(f"<li><strong>{key.replace('_', ' ').title()}</strong>: {reason}</li>")
-        
-        # Default recommendations if none found
-        if not recommendations:
-            recommendations = [
-                "<li>Add quantified achievements to your headline</li>",
-                "<li>Include metrics in your experience descriptions</li>",
-                "<li>Expand your skills section with relevant keywords</li>",
-            ]
-        
-        return "\n".join(recommendations[:5])  # Max 5 recommendations
+            if score < 6 and reasons and _ACTIONABLE_REASON_RE.search(reasons[0]):
+                yield f"<li><strong>{_section_title(key)}</strong>: {reasons[0]}</li>"
     
     async def generate_pdf_pdfshift(self, html: str, filename: str) -> bytes:
         """
@@ -405,55 +774,97 @@ class PDFService:
         if not self._pdfshift_api_key:
             raise ValueError("PDFShift API key not configured")
         
-        auth = base64.b64encode(f"api:{self._pdfshift_api_key}".encode()).decode()
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self._pdfshift_base_url}/convert/pdf",
-                headers={
-                    "Authorization": f"Basic {auth}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "source": html,
-                    "filename": filename,
-                    "format": "A4",
-                    "margin": "20mm",
-                    "sandbox": False,  # Remove watermark
-                },
-                timeout=60.0,
-            )
-            
+        client = self._get_client()
+        url = f"{self._pdfshift_base_url}/convert/pdf"
+        body = orjson.dumps({
+            "source": html,
+            "filename": filename,
+            "format": "A4",
+            "margin": "20mm",
+            "sandbox": False,  # Remove watermark
+        })
+        
+        # Timeouts, dropped connections, 408/429 and 5xx are retried with
+        # backoff; the last attempt's response is handled below as usual
+        for attempt in range(PDFSHIFT_MAX_ATTEMPTS):
+            last = attempt == PDFSHIFT_MAX_ATTEMPTS - 1
+            try:
+                response = await self._send_pdfshift(client, url, body)
+            except httpx.TransportError as e:
+                if last:
+                    raise
+                reason = f"{type(e).__name__}: {e}"
+            else:
+                status = response.status_code
+                if last or not (status >= 500 or status in _RETRYABLE_CLIENT_ERRORS):
+                    break
+                await response.aclose()
+                reason = f"status {status}"
+            log_warning("pdf", f"⚠️ PDFShift attempt {attempt + 1}/{PDFSHIFT_MAX_ATTEMPTS} failed, retrying", {
+                "filename": filename,
+                "reason": reason,
+            })
+            await asyncio.sleep(_retry_delay(attempt))
+        
+        try:
             if not response.is_success:
+                await response.aread()
                 raise Exception(f"PDFShift API error: {response.status_code} - {response.text}")
             
             content_type = response.headers.get("content-type", "")
             
             if "application/json" in content_type:
                 # Response is JSON with URL - download the PDF
-                data = response.json()
+                data = orjson.loads(await response.aread())
                 if "url" in data:
-                    pdf_response = await client.get(data["url"])
-                    return pdf_response.content
+                    async with client.stream("GET", data["url"]) as pdf_response:
+                        return await _read_body(pdf_response)
                 raise Exception("PDFShift did not return a PDF")
             else:
                 # Response is binary PDF
-                return response.content
+                return await _read_body(response)
+        finally:
+            await response.aclose()
+    
+    async def _send_pdfshift(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        body: bytes,
+    ) -> httpx.Response:
+        """POST a conversion request; returns the (streamed) response."""
+        headers = self._pdfshift_headers
+        
+        # The HTML is mostly repetitive markup and CSS; gzip shrinks it several-fold.
+        # Responses are streamed so the PDF is read in chunks into one buffer.
+        response = None
+        if self._pdfshift_gzip:
+            response = await client.send(client.build_request(
+                "POST",
+                url,
+                headers={**headers, "Content-Encoding": "gzip"},
+                content=gzip.compress(body, compresslevel=1),
+            ), stream=True)
+        if response is None or await _gzip_rejected(response):
+            rejected = response is not None
+            if rejected:
+                await response.aclose()
+            response = await client.send(client.build_request(
+                "POST", url, headers=headers, content=body
+            ), stream=True)
+            if rejected and response.is_success:
+                # Plain body worked where gzip did not: stop compressing
+                self._pdfshift_gzip = False
+        return response
     
     def generate_pdf_weasyprint(self, html: str) -> bytes:
         """
         Generate PDF using WeasyPrint (pure Python, no external API).
         
-        Fallback when PDFShift is not configured.
+        Fallback when PDFShift is not configured. Blocks the caller;
+        generate_report renders in the worker process pool instead.
         """
-        try:
-            from weasyprint import HTML
-            return HTML(string=html).write_pdf()
-        except ImportError:
-            raise ImportError(
-                "WeasyPrint not installed. Install with: pip install weasyprint\n"
-                "Or configure PDFSHIFT_API_KEY for cloud PDF generation."
-            )
+        return _render_weasyprint(html)
     
     async def generate_report(
         self,
@@ -475,29 +886,140 @@ class PDFService:
         Returns:
             Tuple of (pdf_bytes, filename)
         """
-        first_name = profile.get("firstName", "") or profile.get("first_name", "") or "User"
-        filename = f"LinkifyMe_Report_{first_name}_{user_id}.pdf"
+        # Re-exports of an unchanged report skip HTML and PDF generation
+        cache_key = self.cache.make_key(scores, profile, user_id)
+        filename = self._report_filename(profile, user_id)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached, filename
         
-        # Generate HTML
-        html = self.generate_report_html(scores, profile, user_id)
+        source = self._report_source(scores, profile, user_id)
+        pdf_bytes = await self._render_pdf(source, filename)
         
-        # Generate PDF
+        self.cache.set(cache_key, pdf_bytes)
+        return pdf_bytes, filename
+    
+    @staticmethod
+    def _report_filename(profile: dict[str, Any], user_id: str) -> str:
+        first_name = profile.get("firstName", "") or profile.get("first_name", "") or "User"
+        return f"LinkifyMe_Report_{first_name}_{user_id}.pdf"
+    
+    def _report_source(
+        self,
+        scores: dict[str, Any],
+        profile: dict[str, Any],
+        user_id: str,
+    ) -> str | bytes:
+        """HTML in the form the configured renderer takes."""
         if self._pdfshift_api_key:
-            pdf_bytes = await self.generate_pdf_pdfshift(html, filename)
-        else:
-            # Fallback to WeasyPrint
-            pdf_bytes = self.generate_pdf_weasyprint(html)
+            # PDFShift takes the HTML as a JSON string field
+            return self.generate_report_html(scores, profile, user_id)
+        # WeasyPrint takes UTF-8 bytes and brings its own parsed stylesheet
+        return self.generate_report_html_bytes(scores, profile, user_id, inline_css=False)
+    
+    async def _render_pdf(self, source: str | bytes, filename: str) -> bytes:
+        """Convert _report_source output to PDF bytes."""
+        if self._pdfshift_api_key:
+            return await self.generate_pdf_pdfshift(source, filename)
+        # Fallback to WeasyPrint, rendered out of process
+        return await asyncio.get_running_loop().run_in_executor(
+            _get_render_pool(), _render_weasyprint, source
+        )
+    
+    async def generate_reports_batch(
+        self,
+        jobs: list[tuple[dict[str, Any], dict[str, Any], str]],
+        concurrency: int = 8,
+    ) -> list[Any]:
+        """
+        Generate many PDF reports concurrently.
         
-        return pdf_bytes, filename
-
-
-# Singleton instance
-_pdf_service: Optional[PDFService] = None
+        Args:
+            jobs: (scores, profile, user_id) per report, as for generate_report
+            concurrency: Maximum reports converted at once
+            
+        Returns:
+            (pdf_bytes, filename) per job, in input order; a failed report
+            yields its exception instead of failing the whole batch
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def generate_one(job: tuple[dict[str, Any], dict[str, Any], str]) -> tuple[bytes, str]:
+            async with semaphore:
+                return await self.generate_report(*job)
+        
+        return await asyncio.gather(*(generate_one(job) for job in jobs), return_exceptions=True)
+    
+    async def generate_reports_pipeline(
+        self,
+        jobs: list[tuple[dict[str, Any], dict[str, Any], str]],
+        concurrency: int = 4,
+    ) -> list[Any]:
+        """
+        Generate many PDF reports, building the next report's HTML while
+        earlier ones are being converted.
+        
+        A single producer builds HTML in a worker thread and feeds a small
+        queue; `concurrency` consumers convert it to PDF.
+        
+        Args:
+            jobs: (scores, profile, user_id) per report, as for generate_report
+            concurrency: Maximum reports converted at once
+            
+        Returns:
+            (pdf_bytes, filename) per job, in input order; a failed report
+            yields its exception instead of failing the whole batch
+        """
+        results: list[Any] = [None] * len(jobs)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        
+        async def produce() -> None:
+            try:
+                for index, (scores, profile, user_id) in enumerate(jobs):
+                    try:
+                        cache_key = self.cache.make_key(scores, profile, user_id)
+                        filename = self._report_filename(profile, user_id)
+                        cached = self.cache.get(cache_key)
+                        if cached is not None:
+                            results[index] = (cached, filename)
+                            continue
+                        source = await asyncio.to_thread(
+                            self._report_source, scores, profile, user_id
+                        )
+                    except Exception as e:
+                        results[index] = e
+                        continue
+                    await queue.put((index, cache_key, source, filename))
+            finally:
+                for _ in range(concurrency):
+                    await queue.put(None)
+        
+        async def consume() -> None:
+            while (item := await queue.get()) is not None:
+                index, cache_key, source, filename = item
+                try:
+                    pdf_bytes = await self._render_pdf(source, filename)
+                except Exception as e:
+                    results[index] = e
+                    continue
+                results[index] = (pdf_bytes, filename)
+                self.cache.set(cache_key, pdf_bytes)
+        
+        await asyncio.gather(produce(), *(consume() for _ in range(concurrency)))
+        return results
 
 
+@lru_cache(maxsize=1)
 def get_pdf_service() -> PDFService:
     """Get the singleton PDFService instance."""
-    global _pdf_service
-    if _pdf_service is None:
-        _pdf_service = PDFService()
-    return _pdf_service
+    return PDFService()
+
+
+async def close_pdf_service() -> None:
+    """Close the pooled client and the render workers (called on application shutdown)."""
+    global _render_pool
+    if get_pdf_service.cache_info().currsize:
+        await get_pdf_service().aclose()
+    if _render_pool is not None:
+        _render_pool.shutdown(cancel_futures=True)
+        _render_pool = None
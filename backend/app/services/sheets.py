@@ -8,12 +8,21 @@ Provides CRUD operations for the LinkifyMe sheets:
 - Activity Log (AL)
 """
 
+import atexit
 import json
-from datetime import datetime
+import logging
+import queue
+import re
+import threading
+import time
 from typing import Any, Optional
 
 import gspread
+from gspread.utils import DateTimeOption, ValueInputOption, ValueRenderOption, rowcol_to_a1
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.service_account import Credentials
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from app.config import settings
 
@@ -26,6 +35,108 @@ SHEET_ACTIVITY_LOG = "Activity Log"
 SHEET_FEEDBACK = "Feedback"
 SHEET_USERS = "Users"
 
+# Keep-alive connections to the Sheets API, shared by all worksheet calls
+SHEETS_POOL_SIZE = 20
+
+# Rate-limit and server errors are retried with backoff (honouring Retry-After).
+# POST is left out: retrying a values.append could write the row twice.
+SHEETS_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET", "PUT"),
+    raise_on_status=False,
+)
+
+# Activity Log rows are written behind the caller in batches of up to this
+# many, at most this many seconds after the first row of a batch is queued
+ACTIVITY_LOG_BATCH_SIZE = 100
+ACTIVITY_LOG_FLUSH_SECONDS = 2.0
+
+# Row number of the first cell in an A1 range such as "'Activity Log'!A842:F842"
+_RANGE_ROW_RE = re.compile(r"![A-Z]+(\d+)")
+# Row number of the last cell in such a range
+_RANGE_END_ROW_RE = re.compile(r"(\d+)$")
+
+# Field names per sheet, in column order (column A first)
+USER_KEYS = (
+    "user_id", "linkedin_url", "email", "phone", "name",
+    "created_at", "last_attempt_at", "total_attempts",
+)
+PROFILE_INFO_KEYS = (
+    "user_id", "attempt_id", "linkedin_url", "scrape_status", "date_time",
+    "email", "phone", "target_group", "complete_scraped_data",
+    "first_name", "last_name", "headline", "connection_count", "follower_count",
+    "about", "profile_picture_url", "cover_picture_url", "geo_location_name", "birthday",
+    "experience_json", "education_json", "skills_json", "certifications_json",
+    "is_verified", "is_premium",
+)
+PROFILE_SCORING_KEYS = (
+    "user_id", "attempt_id", "linkedin_url", "first_name",
+    # Section scores (columns 5-17)
+    "headline_score", "connection_score", "follower_score", "about_score",
+    "profile_pic_score", "cover_picture_score", "experience_score", "education_score",
+    "skills_score", "licenses_certs_score", "verified_score", "premium_score", "final_score",
+    # Section reasonings (columns 18-28)
+    "headline_reasoning", "connection_reasoning", "follower_reasoning", "about_reasoning",
+    "profile_pic_reasoning", "cover_picture_reasoning", "experience_reasoning",
+    "education_reasoning", "skills_reasoning", "licenses_certs_reasoning",
+    "final_score_reasoning",
+    # Metadata (columns 29-32)
+    "timestamp", "completion_status", "remarks", "completed_within_seconds",
+)
+PAYMENT_CONFIRMATION_KEYS = (
+    "payment_id", "user_id", "payment_status", "payment_gateway_id", "amount",
+    "created_at", "updated_at", "payment_ids", "payment_count", "attempts_per_payment",
+    "attempts_granted_total", "attempts_used_total", "attempts_remaining", "last_paid_at",
+)
+ACTIVITY_LOG_KEYS = ("timestamp", "unique_id", "user_id", "event_type", "status", "message")
+
+# Field name -> 1-based column, for row updates
+USER_COLUMNS = {key: col for col, key in enumerate(USER_KEYS, start=1)}
+PROFILE_INFO_COLUMNS = {key: col for col, key in enumerate(PROFILE_INFO_KEYS, start=1)}
+PROFILE_SCORING_COLUMNS = {key: col for col, key in enumerate(PROFILE_SCORING_KEYS, start=1)}
+PAYMENT_CONFIRMATION_COLUMNS = {key: col for col, key in enumerate(PAYMENT_CONFIRMATION_KEYS, start=1)}
+
+# Profile Scoring fields read back as floats
+_SCORE_KEYS = PROFILE_SCORING_KEYS[4:17]
+
+# Payment Confirmation counters read back as ints (empty = 0)
+_PAYMENT_COUNT_KEYS = (
+    "payment_count", "attempts_granted_total", "attempts_used_total", "attempts_remaining",
+)
+
+# Read options for numeric rows: numbers come back as int/float rather than
+# display strings, while cells the sheet parsed as dates stay formatted text
+NUMERIC_READ = {
+    "value_render_option": ValueRenderOption.unformatted,
+    "date_time_render_option": DateTimeOption.formatted_string,
+}
+
+
+def now_iso() -> str:
+    """Current UTC time as ISO 8601 to the second, e.g. 2026-01-31T09:05:00Z."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def _pad(values: list[Any], width: int) -> list[Any]:
+    """Pad a row (the API trims trailing empty cells) to width with ""."""
+    return values + [""] * (width - len(values))
+
+
+def _safe_float(val: Any) -> float:
+    """Convert to float safely, return 0.0 for empty/invalid."""
+    if not val:
+        return 0.0
+    try:
+        # Handle cases where value might be a string with commas or other formatting
+        if isinstance(val, str):
+            val = val.replace(',', '')
+        return float(val)
+    except (ValueError, TypeError):
+        return 0.0
+
+
 # Scopes for Google Sheets API
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
@@ -33,12 +144,72 @@ SCOPES = [
 ]
 
 
+class RowIndex:
+    """
+    Short-lived map from a sheet's first-column value to the latest row
+    holding it.
+    
+    Built from one full-sheet read and trusted for ttl_seconds, so repeat
+    lookups skip the scan. Rows appended by this process are added as they
+    are created; rows written by other processes show up once it expires.
+    """
+    
+    def __init__(self, ttl_seconds: float = 30.0):
+        self.ttl_seconds = ttl_seconds
+        self._rows: dict[str, int] = {}
+        self._expires_at = 0.0
+    
+    @property
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self._expires_at
+    
+    def get(self, key: str) -> Optional[int]:
+        """Return the cached row number for key, or None."""
+        return self._rows.get(key) if self.is_fresh else None
+    
+    def load(self, all_values: list[list[str]]) -> None:
+        """Rebuild the index from a full sheet read (later rows win)."""
+        self._rows = {row[0]: idx for idx, row in enumerate(all_values, start=1) if row}
+        self._expires_at = time.monotonic() + self.ttl_seconds
+    
+    def set(self, key: str, row: int) -> None:
+        """Record a newly written row while the index is fresh."""
+        if self.is_fresh:
+            self._rows[key] = row
+    
+    def clear(self) -> None:
+        self._rows = {}
+        self._expires_at = 0.0
+
+
 class GoogleSheetsService:
     """Service for interacting with Google Sheets."""
     
     def __init__(self):
         self._client: Optional[gspread.Client] = None
         self._spreadsheet: Optional[gspread.Spreadsheet] = None
+        # Worksheet handles by name; resolving one is a metadata request
+        self._worksheets: dict[str, gspread.Worksheet] = {}
+        # First-column (User ID) row lookups for the PI and PS sheets
+        self._profile_rows = RowIndex()
+        self._scoring_rows = RowIndex()
+        
+        # Last Activity Log row known to hold data; None until first read
+        self._activity_log_rows: Optional[int] = None
+        
+        # Single writer thread batches Activity Log appends; None stops it
+        self._log_queue: queue.Queue = queue.Queue()
+        self._log_writer = threading.Thread(
+            target=self._run_activity_log_writer, name="sheets-activity-log", daemon=True
+        )
+        self._log_writer.start()
+        atexit.register(self.close)
+    
+    def close(self, timeout: float = 10.0) -> None:
+        """Write any queued Activity Log rows and stop the writer thread."""
+        if self._log_writer.is_alive():
+            self._log_queue.put(None)
+            self._log_writer.join(timeout)
     
     def _get_client(self) -> gspread.Client:
         """Get or create authenticated gspread client."""
@@ -51,7 +222,14 @@ class GoogleSheetsService:
                 creds_dict,
                 scopes=SCOPES,
             )
-            self._client = gspread.authorize(credentials)
+            session = AuthorizedSession(credentials)
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=SHEETS_POOL_SIZE,
+                max_retries=SHEETS_RETRY,
+            )
+            session.mount("https://", adapter)
+            self._client = gspread.authorize(None, session=session)
         
         return self._client
     
@@ -63,9 +241,59 @@ class GoogleSheetsService:
         return self._spreadsheet
     
     def _get_sheet(self, sheet_name: str) -> gspread.Worksheet:
-        """Get a specific worksheet by name."""
-        spreadsheet = self._get_spreadsheet()
-        return spreadsheet.worksheet(sheet_name)
+        """Get a specific worksheet by name (resolved once per process)."""
+        sheet = self._worksheets.get(sheet_name)
+        if sheet is None:
+            sheet = self._get_spreadsheet().worksheet(sheet_name)
+            self._worksheets[sheet_name] = sheet
+        return sheet
+    
+    def _append_row(self, sheet: gspread.Worksheet, row_data: list[Any]) -> int:
+        """
+        Append a row and return its row number.
+        
+        The number comes from the range in the append response, so the
+        sheet is not re-read to find it.
+        """
+        response = sheet.append_row(row_data, value_input_option="RAW", table_range="A1")
+        return int(_RANGE_ROW_RE.search(response["updates"]["updatedRange"]).group(1))
+    
+    def _update_columns(
+        self,
+        sheet: gspread.Worksheet,
+        row: int,
+        column_map: dict[str, int],
+        updates: dict[str, Any],
+    ) -> None:
+        """
+        Write the mapped fields of one row in a single batchUpdate request.
+        
+        Adjacent columns share one range, so a contiguous block of fields is
+        one range/value pair. Values are interpreted as if typed in, as with
+        update_cell. Keys missing from column_map are ignored.
+        """
+        cells = sorted(
+            (column_map[key], value) for key, value in updates.items() if key in column_map
+        )
+        # (first column, values) per run of adjacent columns
+        blocks: list[tuple[int, list[Any]]] = []
+        for col, value in cells:
+            if blocks and col == blocks[-1][0] + len(blocks[-1][1]):
+                blocks[-1][1].append(value)
+            else:
+                blocks.append((col, [value]))
+        if not blocks:
+            return
+        sheet.batch_update(
+            [
+                {
+                    "range": f"{rowcol_to_a1(row, start)}:{rowcol_to_a1(row, start + len(values) - 1)}",
+                    "values": [values],
+                }
+                for start, values in blocks
+            ],
+            value_input_option=ValueInputOption.user_entered,
+        )
     
     # =========================================================================
     # Users (USR) Operations
@@ -100,6 +328,13 @@ class GoogleSheetsService:
                 return f"https://www.linkedin.com/in/{username}"
         return url
     
+    @staticmethod
+    def _user_from_row(row: list[str]) -> dict[str, Any]:
+        """Map a Users row's cell values to named fields."""
+        user = dict(zip(USER_KEYS, _pad(row, len(USER_KEYS))))
+        user["total_attempts"] = int(user["total_attempts"]) if user["total_attempts"] else 0
+        return user
+    
     def find_user_by_linkedin_url(self, linkedin_url: str) -> Optional[tuple[int, dict]]:
         """
         Find a user by LinkedIn URL.
@@ -116,16 +351,7 @@ class GoogleSheetsService:
                 if len(row) >= 2:
                     row_url = self._normalize_linkedin_url(row[1])
                     if row_url == normalized_url:
-                        return (idx, {
-                            "user_id": row[0],
-                            "linkedin_url": row[1],
-                            "email": row[2] if len(row) > 2 else "",
-                            "phone": row[3] if len(row) > 3 else "",
-                            "name": row[4] if len(row) > 4 else "",
-                            "created_at": row[5] if len(row) > 5 else "",
-                            "last_attempt_at": row[6] if len(row) > 6 else "",
-                            "total_attempts": int(row[7]) if len(row) > 7 and row[7] else 0,
-                        })
+                        return (idx, self._user_from_row(row))
         except Exception as e:
             import logging
             logging.getLogger("linkify.sheets").warning(f"Error finding user: {e}")
@@ -148,16 +374,7 @@ class GoogleSheetsService:
                 if len(row) >= 3:
                     row_email = row[2].strip().lower()
                     if row_email == normalized_email:
-                        return (idx, {
-                            "user_id": row[0],
-                            "linkedin_url": row[1],
-                            "email": row[2],
-                            "phone": row[3] if len(row) > 3 else "",
-                            "name": row[4] if len(row) > 4 else "",
-                            "created_at": row[5] if len(row) > 5 else "",
-                            "last_attempt_at": row[6] if len(row) > 6 else "",
-                            "total_attempts": int(row[7]) if len(row) > 7 and row[7] else 0,
-                        })
+                        return (idx, self._user_from_row(row))
         except Exception as e:
             import logging
             logging.getLogger("linkify.sheets").warning(f"Error finding user by email: {e}")
@@ -178,7 +395,7 @@ class GoogleSheetsService:
         from app.services.counter import get_user_id_counter
         
         user_id = get_user_id_counter().get_next_id()
-        now = datetime.utcnow().isoformat()
+        now = now_iso()
         
         sheet = self._ensure_users_sheet()
         row_data = [
@@ -192,8 +409,7 @@ class GoogleSheetsService:
             0,             # Total Attempts (0 until first analysis completes)
         ]
         
-        sheet.append_row(row_data, value_input_option="RAW")
-        row_number = len(sheet.get_all_values())
+        row_number = self._append_row(sheet, row_data)
         
         return (row_number, user_id)
     
@@ -217,7 +433,7 @@ class GoogleSheetsService:
             # Update last attempt timestamp and increment total attempts
             new_total = user_data["total_attempts"] + 1
             self.update_user(row, {
-                "last_attempt_at": datetime.utcnow().isoformat(),
+                "last_attempt_at": now_iso(),
                 "total_attempts": new_total,
                 # Update email/phone if provided and different
                 "email": email,
@@ -236,21 +452,8 @@ class GoogleSheetsService:
         
         sheet = self._ensure_users_sheet()
         
-        column_map = {
-            "user_id": 1,
-            "linkedin_url": 2,
-            "email": 3,
-            "phone": 4,
-            "name": 5,
-            "created_at": 6,
-            "last_attempt_at": 7,
-            "total_attempts": 8,
-        }
-        
         try:
-            for key, value in updates.items():
-                if key in column_map:
-                    sheet.update_cell(row, column_map[key], value)
+            self._update_columns(sheet, row, USER_COLUMNS, updates)
         except Exception as e:
             logger.warning(f"Failed to update user (quota?): {e}")
     
@@ -262,16 +465,7 @@ class GoogleSheetsService:
             
             for row in all_values[1:]:  # Skip header
                 if row and row[0] == user_id:
-                    return {
-                        "user_id": row[0],
-                        "linkedin_url": row[1],
-                        "email": row[2] if len(row) > 2 else "",
-                        "phone": row[3] if len(row) > 3 else "",
-                        "name": row[4] if len(row) > 4 else "",
-                        "created_at": row[5] if len(row) > 5 else "",
-                        "last_attempt_at": row[6] if len(row) > 6 else "",
-                        "total_attempts": int(row[7]) if len(row) > 7 and row[7] else 0,
-                    }
+                    return self._user_from_row(row)
         except Exception as e:
             import logging
             logging.getLogger("linkify.sheets").warning(f"Error getting user: {e}")
@@ -372,7 +566,7 @@ class GoogleSheetsService:
         24. Is Verified | 25. Is Premium
         """
         sheet = self._get_sheet(SHEET_PROFILE_INFO)
-        now = datetime.utcnow().strftime("%d/%m/%Y, %I:%M:%S %p")  # User's preferred date format
+        now = time.strftime("%d/%m/%Y, %I:%M:%S %p", time.gmtime())  # User's preferred date format
         
         # Append row matching 25-column format (User ID is now column 1)
         row_data = [
@@ -403,10 +597,9 @@ class GoogleSheetsService:
             "",  # Is Premium (column 25)
         ]
         
-        sheet.append_row(row_data, value_input_option="RAW")
-        
-        # Get the row number (last row)
-        return len(sheet.get_all_values())
+        row = self._append_row(sheet, row_data)
+        self._profile_rows.set(row_data[0], row)
+        return row
     
     def update_profile_info(self, row: int, updates: dict[str, Any]) -> None:
         """Update specific columns in a Profile Information row.
@@ -424,46 +617,21 @@ class GoogleSheetsService:
         
         sheet = self._get_sheet(SHEET_PROFILE_INFO)
         
-        # Column mapping matching user's format (1-indexed) - 25 columns
-        column_map = {
-            "user_id": 1,  # Was customer_id
-            "attempt_id": 2,
-            "linkedin_url": 3,
-            "scrape_status": 4,
-            "date_time": 5,
-            "email": 6,
-            "phone": 7,
-            "target_group": 8,
-            "complete_scraped_data": 9,  # Raw JSON from Apify
-            "first_name": 10,
-            "last_name": 11,
-            "headline": 12,
-            "connection_count": 13,
-            "follower_count": 14,
-            "about": 15,
-            "profile_picture_url": 16,
-            "cover_picture_url": 17,
-            "geo_location_name": 18,
-            "birthday": 19,
-            "experience_json": 20,
-            "education_json": 21,
-            "skills_json": 22,
-            "certifications_json": 23,
-            "is_verified": 24,
-            "is_premium": 25,
-        }
+        if "user_id" in updates:
+            self._profile_rows.clear()
+        
+        values = {}
+        for key, value in updates.items():
+            # Convert dicts/lists to JSON strings
+            if isinstance(value, (dict, list)):
+                value = json.dumps(value)
+            # Convert booleans to Yes/No
+            if isinstance(value, bool):
+                value = "Yes" if value else "No"
+            values[key] = value
         
         try:
-            for key, value in updates.items():
-                if key in column_map:
-                    col = column_map[key]
-                    # Convert dicts/lists to JSON strings
-                    if isinstance(value, (dict, list)):
-                        value = json.dumps(value)
-                    # Convert booleans to Yes/No
-                    if isinstance(value, bool):
-                        value = "Yes" if value else "No"
-                    sheet.update_cell(row, col, value)
+            self._update_columns(sheet, row, PROFILE_INFO_COLUMNS, values)
         except Exception as e:
             # Log error but don't fail - quota limits shouldn't break workflow
             logger.warning(f"Failed to update profile info (quota?): {e}")
@@ -479,50 +647,30 @@ class GoogleSheetsService:
         19: Exp JSON | 20: Edu JSON | 21: Skills JSON | 22: Certs JSON | 23: Verified | 24: Premium
         """
         sheet = self._get_sheet(SHEET_PROFILE_INFO)
-        values = sheet.row_values(row)
-        
-        # Pad with empty strings if row is shorter than expected (25 columns)
-        while len(values) < 25:
-            values.append("")
-        
-        return {
-            "user_id": values[0],  # Was customer_id
-            "attempt_id": values[1],
-            "linkedin_url": values[2],
-            "scrape_status": values[3],
-            "date_time": values[4],
-            "email": values[5],
-            "phone": values[6],
-            "target_group": values[7],
-            "complete_scraped_data": values[8],
-            "first_name": values[9],
-            "last_name": values[10],
-            "headline": values[11],
-            "connection_count": values[12],
-            "follower_count": values[13],
-            "about": values[14],
-            "profile_picture_url": values[15],
-            "cover_picture_url": values[16],
-            "geo_location_name": values[17],
-            "birthday": values[18],
-            "experience_json": values[19],
-            "education_json": values[20],
-            "skills_json": values[21],
-            "certifications_json": values[22],
-            "is_verified": values[23],
-            "is_premium": values[24],
-        }
+        return self._profile_info_from_values(sheet.row_values(row))
+    
+    @staticmethod
+    def _profile_info_from_values(values: list[str]) -> dict[str, Any]:
+        """Map a Profile Information row's cell values to named fields."""
+        return dict(zip(PROFILE_INFO_KEYS, _pad(values, len(PROFILE_INFO_KEYS))))
     
     def find_profile_by_unique_id(self, unique_id: str) -> Optional[tuple[int, dict]]:
         """Find a profile by unique_id. Returns (row_number, data) or None."""
+        row = self._profile_rows.get(unique_id)
+        if row is not None:
+            data = self.get_profile_info(row)
+            if data["user_id"] == unique_id:
+                return (row, data)
+        
         sheet = self._get_sheet(SHEET_PROFILE_INFO)
         all_values = sheet.get_all_values()
+        self._profile_rows.load(all_values)
         
         # Iterate backwards to find the LATEST profile if duplicates exist
         for idx in range(len(all_values) - 1, -1, -1):
             row = all_values[idx]
             if row and row[0] == unique_id:
-                return (idx + 1, self.get_profile_info(idx + 1))
+                return (idx + 1, self._profile_info_from_values(row))
         
         return None
     
@@ -533,7 +681,7 @@ class GoogleSheetsService:
     def create_profile_scoring(self, user_id: str) -> int:
         """Create a new Profile Scoring row. Returns row number."""
         sheet = self._get_sheet(SHEET_PROFILE_SCORING)
-        now = datetime.utcnow().isoformat()
+        now = now_iso()
         
         # Initialize with placeholders matching user's 31-column format
         # 1: User ID (was Customer ID)
@@ -549,8 +697,9 @@ class GoogleSheetsService:
         row_data[29] = "pending" # Status (col 30, index 29)
         row_data[28] = now       # Timestamp (col 29, index 28)
         
-        sheet.append_row(row_data, value_input_option="RAW")
-        return len(sheet.get_all_values())
+        row = self._append_row(sheet, row_data)
+        self._scoring_rows.set(user_id, row)
+        return row
     
     def update_profile_scoring(self, row: int, updates: dict[str, Any]) -> None:
         """Update specific columns in a Profile Scoring row.
@@ -569,50 +718,16 @@ class GoogleSheetsService:
         
         sheet = self._get_sheet(SHEET_PROFILE_SCORING)
         
-        # New column mapping matching user's required format (1-indexed)
-        # Shifted by 1 due to Attempt ID insertion at col 2
-        column_map = {
-            "user_id": 1,  # Was customer_id
-            "attempt_id": 2,
-            "linkedin_url": 3,
-            "first_name": 4,
-            "headline_score": 5,
-            "connection_score": 6,
-            "follower_score": 7,
-            "about_score": 8,
-            "profile_pic_score": 9,
-            "cover_picture_score": 10,
-            "experience_score": 11,
-            "education_score": 12,
-            "skills_score": 13,
-            "licenses_certs_score": 14,
-            "verified_score": 15,
-            "premium_score": 16,
-            "final_score": 17,
-            "headline_reasoning": 18,
-            "connection_reasoning": 19,
-            "follower_reasoning": 20,
-            "about_reasoning": 21,
-            "profile_pic_reasoning": 22,
-            "cover_picture_reasoning": 23,
-            "experience_reasoning": 24,
-            "education_reasoning": 25,
-            "skills_reasoning": 26,
-            "licenses_certs_reasoning": 27,
-            "final_score_reasoning": 28,
-            "timestamp": 29,
-            "completion_status": 30,
-            "remarks": 31,
-            "completed_within_seconds": 32,
+        if "user_id" in updates:
+            self._scoring_rows.clear()
+        
+        values = {
+            key: json.dumps(value) if isinstance(value, (dict, list)) else value
+            for key, value in updates.items()
         }
         
         try:
-            for key, value in updates.items():
-                if key in column_map:
-                    col = column_map[key]
-                    if isinstance(value, (dict, list)):
-                        value = json.dumps(value)
-                    sheet.update_cell(row, col, value)
+            self._update_columns(sheet, row, PROFILE_SCORING_COLUMNS, values)
         except Exception as e:
             # Log the error but don't fail - quota limits shouldn't break the workflow
             logger.warning(f"Failed to update profile scoring (quota?): {e}")
@@ -624,75 +739,36 @@ class GoogleSheetsService:
         Customer ID | Attempt ID | LinkedIn Profile | First Name | [12 scores] | [11 reasonings] | Timestamp | Status | Remarks
         """
         sheet = self._get_sheet(SHEET_PROFILE_SCORING)
-        values = sheet.row_values(row)
-        
-        # Ensure we have at least 31 columns
-        while len(values) < 31:
-            values.append("")
-        
-        def safe_float(val):
-            """Convert to float safely, return 0.0 for empty/invalid."""
-            if not val:
-                return 0.0
-            try:
-                # Handle cases where value might be a string with commas or other formatting
-                if isinstance(val, str):
-                    val = val.replace(',', '')
-                return float(val)
-            except (ValueError, TypeError):
-                return 0.0
-        
-        return {
-            # Basic info (columns 1-4)
-            "user_id": values[0],  # Was customer_id
-            "attempt_id": values[1],
-            "linkedin_url": values[2],
-            "first_name": values[3],
-            # Section scores (columns 5-17)
-            "headline_score": safe_float(values[4]),
-            "connection_score": safe_float(values[5]),
-            "follower_score": safe_float(values[6]),
-            "about_score": safe_float(values[7]),
-            "profile_pic_score": safe_float(values[8]),
-            "cover_picture_score": safe_float(values[9]),
-            "experience_score": safe_float(values[10]),
-            "education_score": safe_float(values[11]),
-            "skills_score": safe_float(values[12]),
-            "licenses_certs_score": safe_float(values[13]),
-            "verified_score": safe_float(values[14]),
-            "premium_score": safe_float(values[15]),
-            "final_score": safe_float(values[16]),
-            # Section reasonings (columns 18-28)
-            "headline_reasoning": values[17],
-            "connection_reasoning": values[18],
-            "follower_reasoning": values[19],
-            "about_reasoning": values[20],
-            "profile_pic_reasoning": values[21],
-            "cover_picture_reasoning": values[22],
-            "experience_reasoning": values[23],
-            "education_reasoning": values[24],
-            "skills_reasoning": values[25],
-            "licenses_certs_reasoning": values[26],
-            "final_score_reasoning": values[27],
-            # Metadata (columns 29-31)
-            "timestamp": values[28],
-            "completion_status": values[29],
-            "remarks": values[30],
-            # Computed fields for backward compatibility
-            "overall_score": safe_float(values[16]),  # Same as final_score
-            "profile_photo_score": safe_float(values[8]),  # Alias for profile_pic_score
-        }
+        return self._profile_scoring_from_values(sheet.row_values(row, **NUMERIC_READ))
+    
+    @staticmethod
+    def _profile_scoring_from_values(values: list[str]) -> dict[str, Any]:
+        """Map a Profile Scoring row's cell values to named fields."""
+        scoring = dict(zip(PROFILE_SCORING_KEYS, _pad(values, len(PROFILE_SCORING_KEYS))))
+        for key in _SCORE_KEYS:
+            scoring[key] = _safe_float(scoring[key])
+        # Computed fields for backward compatibility
+        scoring["overall_score"] = scoring["final_score"]
+        scoring["profile_photo_score"] = scoring["profile_pic_score"]
+        return scoring
     
     def find_scoring_by_user_id(self, user_id: str) -> Optional[tuple[int, dict]]:
         """Find scoring by user_id. Returns (row_number, data) or None."""
+        row = self._scoring_rows.get(user_id)
+        if row is not None:
+            data = self.get_profile_scoring(row)
+            if data["user_id"] == user_id:
+                return (row, data)
+        
         sheet = self._get_sheet(SHEET_PROFILE_SCORING)
-        all_values = sheet.get_all_values()
+        all_values = sheet.get_all_values(**NUMERIC_READ)
+        self._scoring_rows.load(all_values)
         
         # Iterate backwards to find the LATEST scoring record
         for idx in range(len(all_values) - 1, -1, -1):
             row = all_values[idx]
             if row and row[0] == user_id:
-                return (idx + 1, self.get_profile_scoring(idx + 1))
+                return (idx + 1, self._profile_scoring_from_values(row))
         
         return None
     
@@ -729,7 +805,7 @@ class GoogleSheetsService:
         attempts_granted_total | attempts_used_total | attempts_remaining | last_paid_at
         """
         sheet = self._get_sheet(SHEET_PAYMENT_CONFIRMATION)
-        now = datetime.utcnow().isoformat()
+        now = now_iso()
         
         row_data = [
             payment_id,          # payment_id (col 1)
@@ -748,61 +824,25 @@ class GoogleSheetsService:
             "",                  # last_paid_at (col 14)
         ]
         
-        sheet.append_row(row_data, value_input_option="RAW")
-        return len(sheet.get_all_values())
+        return self._append_row(sheet, row_data)
     
     def update_payment_confirmation(self, row: int, updates: dict[str, Any]) -> None:
         """Update specific columns in a Payment Confirmation row."""
         sheet = self._get_sheet(SHEET_PAYMENT_CONFIRMATION)
         
-        column_map = {
-            "payment_id": 1,
-            "user_id": 2,
-            "payment_status": 3,
-            "payment_gateway_id": 4,
-            "amount": 5,
-            "created_at": 6,
-            "updated_at": 7,
-            "payment_ids": 8,
-            "payment_count": 9,
-            "attempts_per_payment": 10,
-            "attempts_granted_total": 11,
-            "attempts_used_total": 12,
-            "attempts_remaining": 13,
-            "last_paid_at": 14,
-        }
-        
-        updates["updated_at"] = datetime.utcnow().isoformat()
+        updates["updated_at"] = now_iso()
         
-        for key, value in updates.items():
-            if key in column_map:
-                sheet.update_cell(row, column_map[key], value)
+        self._update_columns(sheet, row, PAYMENT_CONFIRMATION_COLUMNS, updates)
     
     def get_payment_confirmation(self, row: int) -> dict[str, Any]:
         """Get a Payment Confirmation row by row number."""
         sheet = self._get_sheet(SHEET_PAYMENT_CONFIRMATION)
-        values = sheet.row_values(row)
-        
-        # Ensure length up to col 14
-        while len(values) < 14:
-            values.append("")
-        
-        return {
-            "payment_id": values[0],
-            "user_id": values[1],
-            "payment_status": values[2],
-            "payment_gateway_id": values[3],
-            "amount": values[4],
-            "created_at": values[5],
-            "updated_at": values[6],
-            "payment_ids": values[7],
-            "payment_count": int(values[8] or 0),
-            "attempts_per_payment": int(values[9] or self.DEFAULT_ATTEMPTS_PER_PAYMENT),
-            "attempts_granted_total": int(values[10] or 0),
-            "attempts_used_total": int(values[11] or 0),
-            "attempts_remaining": int(values[12] or 0),
-            "last_paid_at": values[13],
-        }
+        values = _pad(sheet.row_values(row), len(PAYMENT_CONFIRMATION_KEYS))
+        pc = dict(zip(PAYMENT_CONFIRMATION_KEYS, values))
+        for key in _PAYMENT_COUNT_KEYS:
+            pc[key] = int(pc[key] or 0)
+        pc["attempts_per_payment"] = int(pc["attempts_per_payment"] or self.DEFAULT_ATTEMPTS_PER_PAYMENT)
+        return pc
     
     def _find_payment_row_by_user_id(self, user_id: str) -> Optional[int]:
         """Find payment confirmation row by user_id. Returns row number or None."""
@@ -835,7 +875,7 @@ class GoogleSheetsService:
         if attempts_per_payment is None:
             attempts_per_payment = self.DEFAULT_ATTEMPTS_PER_PAYMENT
             
-        now = datetime.utcnow().isoformat()
+        now = now_iso()
         row = self._find_payment_row_by_user_id(user_id)
         
         # Create if not exists
@@ -920,54 +960,88 @@ class GoogleSheetsService:
         status: str,
         message: str,
     ) -> None:
-        """Append an entry to the Activity Log.
+        """Queue an entry for the Activity Log.
+        
+        Rows are appended in batches by a background thread, so this never
+        blocks on (or fails because of) the Sheets API.
+        """
+        self._log_queue.put([
+            now_iso(),
+            unique_id,
+            user_id or "",
+            event_type,
+            status,
+            message,
+        ])
+    
+    def _run_activity_log_writer(self) -> None:
+        """Collect queued Activity Log rows and append each batch in one request."""
+        stopping = False
+        while not stopping:
+            row = self._log_queue.get()
+            if row is None:
+                break
+            rows = [row]
+            deadline = time.monotonic() + ACTIVITY_LOG_FLUSH_SECONDS
+            while len(rows) < ACTIVITY_LOG_BATCH_SIZE:
+                try:
+                    row = self._log_queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                rows.append(row)
+            self._write_activity_rows(rows)
+    
+    def _write_activity_rows(self, rows: list[list[Any]]) -> None:
+        """Append rows to the Activity Log.
         
         Catches quota errors gracefully to not fail the main workflow.
         """
-        import logging
         logger = logging.getLogger("linkify.sheets")
         
         try:
             sheet = self._get_sheet(SHEET_ACTIVITY_LOG)
-            
-            row_data = [
-                datetime.utcnow().isoformat(),
-                unique_id,
-                user_id or "",
-                event_type,
-                status,
-                message,
-            ]
-            
-            sheet.append_row(row_data, value_input_option="RAW")
+            response = sheet.append_rows(
+                rows,
+                value_input_option="RAW",
+                insert_data_option="INSERT_ROWS",
+                table_range="A1",
+            )
+            if self._activity_log_rows is not None:
+                end_row = int(_RANGE_END_ROW_RE.search(response["updates"]["updatedRange"]).group(1))
+                self._activity_log_rows = max(self._activity_log_rows, end_row)
         except Exception as e:
             # Log the error but don't fail - quota limits shouldn't break the workflow
-            logger.warning(f"Failed to write activity log (quota?): {e}")
+            logger.warning(f"Failed to write {len(rows)} activity log rows (quota?): {e}")
     
     def get_recent_activity_logs(self, limit: int = 100) -> list[dict[str, Any]]:
-        """Get the most recent activity log entries."""
+        """Get the most recent activity log entries.
+        
+        Only the last `limit` rows are downloaded: the last data row is
+        learned once from column A and then tracked as batches are appended.
+        The range read is open-ended, so rows appended by other processes
+        are still included.
+        """
         sheet = self._get_sheet(SHEET_ACTIVITY_LOG)
-        all_values = sheet.get_all_values()
+        if self._activity_log_rows is None:
+            self._activity_log_rows = len(sheet.col_values(1))
+        
+        start = max(1, self._activity_log_rows - limit + 1)
+        values = sheet.get(f"A{start}:F")
+        self._activity_log_rows = max(self._activity_log_rows, start + len(values) - 1)
         
         # Skip header row if exists
-        data_rows = all_values[1:] if all_values and all_values[0][0] == "Timestamp" else all_values
-        
-        # Get last N rows
-        recent = data_rows[-limit:] if len(data_rows) > limit else data_rows
-        
-        logs = []
-        for row in reversed(recent):  # Most recent first
-            if len(row) >= 6:
-                logs.append({
-                    "timestamp": row[0],
-                    "unique_id": row[1],
-                    "user_id": row[2],
-                    "event_type": row[3],
-                    "status": row[4],
-                    "message": row[5],
-                })
-        
-        return logs
+        if start == 1 and values and values[0] and values[0][0] == "Timestamp":
+            values = values[1:]
+        
+        # Most recent first; cells missing from the end of a row read as ""
+        width = len(ACTIVITY_LOG_KEYS)
+        return [
+            dict(zip(ACTIVITY_LOG_KEYS, row + [""] * (width - len(row))))
+            for row in reversed(values[-limit:])
+        ]
 
     # =========================================================================
     # Feedback Operations
@@ -975,13 +1049,14 @@ class GoogleSheetsService:
     
     def _ensure_sheet_exists(self, sheet_name: str, headers: list[str]) -> gspread.Worksheet:
         """Ensure a sheet exists, create it if not."""
-        spreadsheet = self._get_spreadsheet()
         try:
-            return spreadsheet.worksheet(sheet_name)
+            return self._get_sheet(sheet_name)
         except gspread.WorksheetNotFound:
             # Create the sheet with headers
+            spreadsheet = self._get_spreadsheet()
             sheet = spreadsheet.add_worksheet(title=sheet_name, rows=1000, cols=len(headers))
             sheet.append_row(headers, value_input_option="RAW")
+            self._worksheets[sheet_name] = sheet
             return sheet
     
     def create_feedback(
@@ -1009,7 +1084,7 @@ class GoogleSheetsService:
         sheet = self._ensure_sheet_exists(SHEET_FEEDBACK, headers)
         
         row_data = [
-            datetime.utcnow().isoformat(),
+            now_iso(),
             user_id,
             email,
             would_refer,
@@ -1017,8 +1092,7 @@ class GoogleSheetsService:
             suggestions or "",
         ]
         
-        sheet.append_row(row_data, value_input_option="RAW")
-        return len(sheet.get_all_values())
+        return self._append_row(sheet, row_data)
 
 
 # Singleton instance
@@ -0,0 +1,113 @@
+"""
+Apify Webhook Tests
+
+The webhook endpoint only accepts notifications when webhooks are
+configured with a shared secret, and a notification wakes the poller
+waiting on its run.
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import router
+from app.config import settings
+from app.services import apify
+from app.services.apify import APIFY_WEBHOOK_SECRET_HEADER, ApifyService
+
+SECRET = "test-secret"
+
+FINISHED_PAYLOAD = {
+    "resource": {
+        "id": "run-1",
+        "status": "SUCCEEDED",
+        "finishedAt": "2024-01-01T00:00:00Z",
+        "defaultDatasetId": "dataset-1",
+    },
+}
+
+
+def _configure(monkeypatch, base_url: str, secret: str) -> ApifyService:
+    """Install a fresh service singleton built from the given webhook settings."""
+    monkeypatch.setattr(settings, "apify_webhook_base_url", base_url)
+    monkeypatch.setattr(settings, "apify_webhook_secret", secret)
+    service = ApifyService()
+    monkeypatch.setattr(apify, "_apify_service", service)
+    return service
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    return TestClient(app)
+
+
+def test_route_is_404_when_webhooks_are_unconfigured(monkeypatch, client):
+    _configure(monkeypatch, base_url="", secret=SECRET)
+
+    response = client.post(
+        "/api/apify/webhook", json=FINISHED_PAYLOAD, headers={APIFY_WEBHOOK_SECRET_HEADER: SECRET}
+    )
+
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize("received", ["wrong-secret", ""])
+def test_route_rejects_wrong_or_empty_secret(monkeypatch, client, received):
+    service = _configure(monkeypatch, base_url="https://backend.example", secret=SECRET)
+
+    response = client.post(
+        "/api/apify/webhook", json=FINISHED_PAYLOAD, headers={APIFY_WEBHOOK_SECRET_HEADER: received}
+    )
+
+    assert response.status_code == 401
+    assert service._webhook_results == {}
+
+
+def test_route_accepts_matching_secret(monkeypatch, client):
+    service = _configure(monkeypatch, base_url="https://backend.example", secret=SECRET)
+
+    response = client.post(
+        "/api/apify/webhook", json=FINISHED_PAYLOAD, headers={APIFY_WEBHOOK_SECRET_HEADER: SECRET}
+    )
+
+    assert response.status_code == 200
+    assert service._webhook_results["run-1"]["status"] == "SUCCEEDED"
+
+
+def test_base_url_without_secret_disables_webhooks(monkeypatch, client):
+    service = _configure(monkeypatch, base_url="https://backend.example", secret="")
+
+    assert service.webhook_url == ""
+    assert not service.verify_webhook_secret("")
+    response = client.post("/api/apify/webhook", json=FINISHED_PAYLOAD)
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_handle_webhook_wakes_waiting_poller(monkeypatch):
+    service = _configure(monkeypatch, base_url="https://backend.example", secret=SECRET)
+    status_calls = []
+
+    async def get_run_status(run_id):
+        status_calls.append(run_id)
+        return {"run_id": run_id, "status": "RUNNING"}
+
+    monkeypatch.setattr(service, "get_run_status", get_run_status)
+
+    # The safety-net poll interval is far longer than the test timeout, so
+    # only the notification can end the wait in time
+    poll = asyncio.create_task(service.poll_until_complete("run-1", timeout=60, max_interval=30))
+    while "run-1" not in service._pending_runs:
+        await asyncio.sleep(0)
+    service.handle_webhook(FINISHED_PAYLOAD)
+
+    status = await asyncio.wait_for(poll, timeout=2)
+
+    assert status["status"] == "SUCCEEDED"
+    assert status["default_dataset_id"] == "dataset-1"
+    assert status_calls == ["run-1"]
+    assert service._pending_runs == {}
@@ -0,0 +1,40 @@
+"""
+Connections Scorer Tests
+
+Guards the single connection thresholds table and its top rung.
+"""
+
+import inspect
+
+from app.scoring.sections import SCORER_MAP
+from app.scoring.sections import connections
+from app.scoring.sections.connections import ConnectionsScorer
+
+
+def test_scorer_is_defined_once():
+    source = inspect.getsource(connections)
+
+    assert source.count("class ConnectionsScorer") == 1
+    assert source.count("THRESHOLDS = [") == 1
+    assert type(SCORER_MAP["connections"]) is ConnectionsScorer
+
+
+def test_top_rung():
+    assert ConnectionsScorer.THRESHOLDS[-1] == (2000, 10.0)
+
+
+def test_lookup_tables_match_thresholds():
+    counts = [count for count, _ in ConnectionsScorer.THRESHOLDS]
+
+    assert counts == sorted(counts)
+    assert ConnectionsScorer._COUNTS == tuple(counts)
+    assert ConnectionsScorer._SCORES == tuple(score for _, score in ConnectionsScorer.THRESHOLDS)
+
+
+def test_scores_by_count():
+    scorer = ConnectionsScorer()
+
+    assert scorer.score({"connectionsCount": 10})["score_raw"] == 0.0
+    assert scorer.score({"connectionsCount": "500+"})["score_raw"] == 6.0
+    assert scorer.score({"connectionsCount": 1999})["score_raw"] == 9.0
+    assert scorer.score({"connectionsCount": 5000})["score_raw"] == 10.0
@@ -0,0 +1,52 @@
+"""
+Logger Tests
+
+Records pass through the queue handler with their exception and
+structured fields intact.
+"""
+
+import io
+import json
+import logging
+import logging.handlers
+import queue
+
+from app.services.logger import JsonFormatter, RecordQueueHandler
+
+
+def _log_exception_through_queue(formatter: logging.Formatter) -> str:
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(formatter)
+
+    records: queue.Queue = queue.Queue()
+    listener = logging.handlers.QueueListener(records, handler)
+    logger = logging.getLogger("linkify.test_queue")
+    logger.propagate = False
+    logger.addHandler(RecordQueueHandler(records))
+    listener.start()
+    try:
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("Failed %s", "step", extra={"component": "test", "data": {"id": 1}})
+    finally:
+        listener.stop()
+        logger.handlers.clear()
+    return stream.getvalue()
+
+
+def test_json_entry_keeps_exception_separate():
+    entry = json.loads(_log_exception_through_queue(JsonFormatter()))
+
+    assert entry["message"] == "Failed step"
+    assert entry["data"] == {"id": 1}
+    assert "ValueError: boom" in entry["exception"]
+
+
+def test_plain_formatter_puts_traceback_after_message():
+    output = _log_exception_through_queue(logging.Formatter("%(message)s"))
+
+    first_line, *rest = output.splitlines()
+    assert first_line == "Failed step"
+    assert rest[-1] == "ValueError: boom"
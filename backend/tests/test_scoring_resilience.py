@@ -0,0 +1,181 @@
+"""
+AI Scoring Resilience Tests
+
+Covers the circuit breaker and the per-call retry loop around the model.
+"""
+
+import httpx
+import openai
+import pytest
+
+from app.services import openai_scoring
+from app.services.openai_scoring import (
+    LLM_MAX_ATTEMPTS,
+    CircuitBreaker,
+    CircuitOpenError,
+    OpenAIScoringService,
+    _retry_delay,
+)
+
+CHAT_URL = "https://api.openai.com/v1/chat/completions"
+
+
+def _api_error(error_type: type[openai.APIStatusError], status_code: int, headers=None):
+    response = httpx.Response(status_code, headers=headers, request=httpx.Request("POST", CHAT_URL))
+    return error_type("error", response=response, body=None)
+
+
+class FakeClock:
+    """Stands in for time.monotonic in the scoring module."""
+
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(openai_scoring.time, "monotonic", clock)
+    return clock
+
+
+class FakeReply:
+    def __init__(self, content: str):
+        self.content = content
+
+
+class FakeChain:
+    """Raises the queued errors in turn, then replies."""
+
+    def __init__(self, *errors: Exception):
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def ainvoke(self, prompt_vars):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return FakeReply("{}")
+
+
+@pytest.fixture
+def no_sleep(monkeypatch) -> list[float]:
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(openai_scoring.asyncio, "sleep", sleep)
+    return delays
+
+
+def test_breaker_opens_after_failure_threshold(clock):
+    breaker = CircuitBreaker(fail_max=3, reset_timeout=30.0)
+
+    for _ in range(2):
+        breaker.record_failure()
+    assert not breaker.is_open
+
+    breaker.record_failure()
+    assert breaker.is_open
+
+
+def test_breaker_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(fail_max=3, reset_timeout=30.0)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert not breaker.is_open
+
+
+def test_breaker_half_open_trial_closes_on_success(clock):
+    breaker = CircuitBreaker(fail_max=2, reset_timeout=30.0)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    clock.now += 29.0
+    assert breaker.is_open
+    clock.now += 1.0
+    assert not breaker.is_open
+
+    breaker.record_success()
+    breaker.record_failure()
+    assert not breaker.is_open
+
+
+def test_breaker_half_open_trial_reopens_on_failure(clock):
+    breaker = CircuitBreaker(fail_max=2, reset_timeout=30.0)
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now += 30.0
+
+    breaker.record_failure()
+
+    assert breaker.is_open
+
+
+def test_retry_delay_honours_retry_after():
+    error = _api_error(openai.RateLimitError, 429, headers={"retry-after": "7"})
+
+    assert _retry_delay(error, attempt=0) == 7.0
+    assert _retry_delay(error, attempt=0, cap=5.0) == 5.0
+
+
+def test_retry_delay_without_retry_after_uses_capped_backoff():
+    error = _api_error(openai.InternalServerError, 500)
+
+    for attempt in range(8):
+        assert 0.0 <= _retry_delay(error, attempt, base=1.0, cap=20.0) <= min(2 ** attempt, 20.0)
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_error_raises_on_first_attempt(no_sleep):
+    chain = FakeChain(_api_error(openai.BadRequestError, 400))
+
+    with pytest.raises(openai.BadRequestError):
+        await OpenAIScoringService()._invoke_chain(chain, {})
+
+    assert chain.calls == 1
+    assert no_sleep == []
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried(no_sleep):
+    chain = FakeChain(
+        _api_error(openai.RateLimitError, 429, headers={"retry-after": "2"}),
+        httpx.ConnectError("connection refused"),
+    )
+
+    assert await OpenAIScoringService()._invoke_chain(chain, {}) == "{}"
+    assert chain.calls == 3
+    assert no_sleep[0] == 2.0
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_give_up_after_max_attempts(no_sleep):
+    chain = FakeChain(*(_api_error(openai.InternalServerError, 503) for _ in range(LLM_MAX_ATTEMPTS)))
+
+    with pytest.raises(openai.InternalServerError):
+        await OpenAIScoringService()._invoke_chain(chain, {})
+
+    assert chain.calls == LLM_MAX_ATTEMPTS
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_skips_the_model():
+    service = OpenAIScoringService()
+    for _ in range(service.breaker.fail_max):
+        service.breaker.record_failure()
+
+    def chains():
+        raise AssertionError("model called while the circuit is open")
+
+    service._chains = chains
+    with pytest.raises(CircuitOpenError):
+        await service._invoke_llm({})
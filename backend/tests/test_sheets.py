@@ -0,0 +1,79 @@
+"""
+Google Sheets Service Tests
+
+Pure tests of the row-write helpers against a stub worksheet; no
+credentials or network access needed.
+"""
+
+import pytest
+
+from app.services.sheets import GoogleSheetsService, PROFILE_INFO_COLUMNS
+
+
+class StubWorksheet:
+    """Records the write calls made against it."""
+
+    def __init__(self, updated_range: str = ""):
+        self.updated_range = updated_range
+        self.batch_updates = []
+        self.appended_rows = []
+
+    def batch_update(self, data, **kwargs):
+        self.batch_updates.append((data, kwargs))
+
+    def append_row(self, values, **kwargs):
+        self.appended_rows.append((values, kwargs))
+        return {"updates": {"updatedRange": self.updated_range}}
+
+
+@pytest.fixture
+def service() -> GoogleSheetsService:
+    # The helpers use no instance state; skip __init__ (credentials, writer thread)
+    return GoogleSheetsService.__new__(GoogleSheetsService)
+
+
+def test_update_columns_groups_adjacent_columns(service):
+    sheet = StubWorksheet()
+
+    service._update_columns(sheet, 7, {"a": 1, "b": 2, "c": 4, "d": 5, "e": 6, "f": 28}, {
+        "f": "z", "b": 2, "a": 1, "d": "x", "c": "w", "e": "y",
+    })
+
+    [(data, kwargs)] = sheet.batch_updates
+    assert data == [
+        {"range": "A7:B7", "values": [[1, 2]]},
+        {"range": "D7:F7", "values": [["w", "x", "y"]]},
+        {"range": "AB7:AB7", "values": [["z"]]},
+    ]
+    assert kwargs["value_input_option"] == "USER_ENTERED"
+
+
+def test_update_columns_ignores_unmapped_keys(service):
+    sheet = StubWorksheet()
+
+    service._update_columns(sheet, 3, PROFILE_INFO_COLUMNS, {
+        "scrape_status": "done",
+        "not_a_column": "ignored",
+    })
+
+    [(data, _)] = sheet.batch_updates
+    assert data == [{"range": "D3:D3", "values": [["done"]]}]
+
+
+def test_update_columns_without_mapped_keys_sends_nothing(service):
+    sheet = StubWorksheet()
+
+    service._update_columns(sheet, 3, PROFILE_INFO_COLUMNS, {"not_a_column": "ignored"})
+
+    assert sheet.batch_updates == []
+
+
+@pytest.mark.parametrize("updated_range, row", [
+    ("'Activity Log'!A842:F842", 842),
+    ("Users!A2:H2", 2),
+])
+def test_append_row_returns_row_from_updated_range(service, updated_range, row):
+    sheet = StubWorksheet(updated_range)
+
+    assert service._append_row(sheet, ["a", "b"]) == row
+    assert sheet.appended_rows == [(["a", "b"], {"value_input_option": "RAW", "table_range": "A1"})]